@@ -0,0 +1,165 @@
+"""
+Benchmark of concurrent writes from several processes.
+
+This module starts several writer processes on the same temporary data directory. Each process saves its
+own tournament repeatedly, adds players, and updates a tournament shared by all processes, retrying when
+its save is refused by a version conflict. The throughput and the number of conflicts are printed as JSON,
+with a check that no write was lost (versions and player count) and that the files are still readable.
+
+Usage:
+    python -m benchmark.contention_benchmark --workers 1 2 4 8 --saves 50 --players 20
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmark.tournament_benchmark import create_tournament, generate_players
+from model.player import Player
+from model.tournament import Tournament
+from repository.file_storage import ConflictError
+from repository.player_repository import PlayerRepository
+from repository.tournament_repository import TournamentRepository
+
+SHARED_TOURNAMENT = "Tournoi partagé"
+
+
+def open_repositories(directory):
+    return (PlayerRepository(os.path.join(directory, "players.json")),
+            TournamentRepository(os.path.join(directory, "tournament.json")))
+
+
+def run_writer(directory, worker, saves, players_count, start_at):
+    """Write from one process: own tournament, players and shared tournament (executed in a worker process).
+
+    Returns:
+        dict: The durations of the saves, the number of conflicts and the number of shared updates.
+    """
+    player_repository, tournament_repository = open_repositories(directory)
+    rng = random.Random(worker)
+    tournament = create_tournament(f"Section {worker}", generate_players(16, rng), 7)
+
+    # Démarrer tous les processus en même temps
+    time.sleep(max(0.0, start_at - time.time()))
+
+    own_durations, shared_durations, player_durations = [], [], []
+    conflicts = 0
+    for save in range(saves):
+        tournament.director_note = f"Sauvegarde {save}"
+        start = time.perf_counter()
+        tournament_repository.add_tournament(tournament)
+        own_durations.append(time.perf_counter() - start)
+
+        # Mise à jour du tournoi partagé : relire puis réessayer tant qu'un autre processus l'a modifié
+        start = time.perf_counter()
+        while True:
+            shared = Tournament.from_json(tournament_repository.get_tournament(SHARED_TOURNAMENT))
+            shared.director_note = f"Processus {worker}, sauvegarde {save}"
+            try:
+                tournament_repository.add_tournament(shared)
+                break
+            except ConflictError:
+                conflicts += 1
+        shared_durations.append(time.perf_counter() - start)
+
+    for index in range(players_count):
+        player = Player(f"Joueur{index}", f"Processus{worker:03d}", "01-01-2000", f"W{worker:03d}{index:04d}")
+        start = time.perf_counter()
+        player_repository.add_player(player)
+        player_durations.append(time.perf_counter() - start)
+
+    return {
+        "own_durations": own_durations,
+        "shared_durations": shared_durations,
+        "player_durations": player_durations,
+        "conflicts": conflicts,
+    }
+
+
+def check_storage(directory, workers_count, saves, players_count):
+    """Check that every write is in the storage after the run.
+
+    Returns:
+        dict: The expected and stored versions and player count, and whether everything matches.
+    """
+    player_repository, tournament_repository = open_repositories(directory)
+    tournament_repository.wait_for_compaction()
+    headers = {header.name: header for header in tournament_repository.get_tournament_headers()}
+    own_versions = [headers[f"Section {worker}"].version for worker in range(workers_count)]
+    shared_version = headers[SHARED_TOURNAMENT].version
+    stored_players = len(player_repository.load_players())
+    return {
+        "own_versions_ok": all(version == saves for version in own_versions),
+        # Le tournoi partagé a été enregistré une première fois avant le lancement des processus
+        "shared_version": shared_version,
+        "expected_shared_version": 1 + workers_count * saves,
+        "stored_players": stored_players,
+        "expected_players": workers_count * players_count,
+        "ok": (all(version == saves for version in own_versions) and
+               shared_version == 1 + workers_count * saves and
+               stored_players == workers_count * players_count),
+    }
+
+
+def run_contention(workers_count, saves, players_count):
+    """Run the writer processes on a new temporary data directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        _, tournament_repository = open_repositories(directory)
+        tournament_repository.add_tournament(create_tournament(SHARED_TOURNAMENT, [], 7))
+
+        start_at = time.time() + 0.5
+        with ProcessPoolExecutor(max_workers=workers_count) as executor:
+            futures = [executor.submit(run_writer, directory, worker, saves, players_count, start_at)
+                       for worker in range(workers_count)]
+            results = [future.result() for future in futures]
+        elapsed = time.time() - start_at
+
+        own = [duration for result in results for duration in result["own_durations"]]
+        shared = [duration for result in results for duration in result["shared_durations"]]
+        player = [duration for result in results for duration in result["player_durations"]]
+        return {
+            "workers": workers_count,
+            "elapsed_seconds": elapsed,
+            "writes_per_second": (len(own) + len(shared) + len(player)) / elapsed,
+            "own_save_median_seconds": statistics.median(own),
+            "shared_update_median_seconds": statistics.median(shared),
+            "player_add_median_seconds": statistics.median(player) if player else None,
+            "conflicts": sum(result["conflicts"] for result in results),
+            "storage": check_storage(directory, workers_count, saves, players_count),
+        }
+
+
+def run_benchmark(workers_counts, saves, players_count):
+    return {
+        "benchmark": "contention",
+        "python": platform.python_version(),
+        "saves": saves,
+        "players": players_count,
+        "results": [run_contention(workers_count, saves, players_count) for workers_count in workers_counts],
+    }
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Mesure des écritures concurrentes de plusieurs processus.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Nombres de processus")
+    parser.add_argument("--saves", type=int, default=50, help="Nombre d'enregistrements par processus")
+    parser.add_argument("--players", type=int, default=20, help="Nombre de joueurs ajoutés par processus")
+    parser.add_argument("--output", help="Fichier JSON de sortie (sortie standard par défaut)")
+    args = parser.parse_args(arguments)
+
+    report = json.dumps(run_benchmark(args.workers, args.saves, args.players), indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
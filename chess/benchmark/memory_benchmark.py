@@ -0,0 +1,154 @@
+"""
+Benchmark of the memory footprint of the model classes.
+
+This module creates many matches between a pool of players with the current model classes (__slots__, two
+players and a result code per match) and with the previous layout, reproduced here for comparison (an instance
+dictionary per object and a dictionary of the players and their points per match). The memory allocated per
+match and per player, measured with tracemalloc, is printed as JSON, with the memory used by the tournaments
+of a synthetic archive once loaded.
+
+Usage:
+    python -m benchmark.memory_benchmark --matches 100000 1000000 --players 1000
+"""
+
+import argparse
+import json
+import platform
+import random
+import tracemalloc
+
+from benchmark.snapshot_benchmark import build_archive
+from benchmark.tournament_benchmark import RESULTS
+from model.match import Match
+from model.player import Player
+from model.tournament import Tournament
+
+
+class LegacyPlayer:
+    """A player with the previous layout: an instance dictionary, compared by identity."""
+
+    def __init__(self, firstname, lastname, birth, national_chess_id):
+        self.firstname = firstname.title()
+        self.lastname = lastname.title()
+        self.birth = birth
+        self.national_chess_id = national_chess_id
+        self.score = 0
+
+
+class LegacyMatch:
+    """A match with the previous layout: a dictionary of the players and their points, and the result."""
+
+    def __init__(self, players):
+        self.players = players
+        self.result = None
+
+    def set_result(self, result):
+        # Mise à jour des points comme dans l'ancienne méthode Match.set_result
+        player1, player2 = list(self.players.keys())
+        self.result = result
+        if result == "win":
+            self.players[player1] += 1
+        elif result == "loss":
+            self.players[player2] += 1
+        else:
+            for player in self.players:
+                self.players[player] += 0.5
+
+
+def measure(build):
+    """Return the memory allocated by build (in bytes), the objects it returns being still alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def create_players(player_class, count):
+    return [player_class(f"Prénom{index}", f"Nom{index}", "01-01-2000", f"AB{index:05d}") for index in range(count)]
+
+
+def create_matches(match_factory, players, count, seed):
+    """Create matches with results between players of the pool, the same ones for every layout."""
+    rng = random.Random(seed)
+    matches = []
+    for index in range(count):
+        player1 = players[index % len(players)]
+        player2 = players[(index + 1 + rng.randrange(len(players) - 1)) % len(players)]
+        matches.append(match_factory(player1, player2, rng.choice(RESULTS)))
+    return matches
+
+
+def create_legacy_match(player1, player2, result):
+    match = LegacyMatch({player1: 0, player2: 0})
+    match.set_result(result)
+    return match
+
+
+def run_matches(matches_count, players_count, seed):
+    """Measure the memory of the matches and of the players, with the previous and the current layouts."""
+    legacy_players = create_players(LegacyPlayer, players_count)
+    players = create_players(Player, players_count)
+    legacy_bytes = measure(lambda: create_matches(create_legacy_match, legacy_players, matches_count, seed))
+    slots_bytes = measure(lambda: create_matches(Match, players, matches_count, seed))
+    legacy_player_bytes = measure(lambda: create_players(LegacyPlayer, players_count))
+    slots_player_bytes = measure(lambda: create_players(Player, players_count))
+    return {
+        "matches": matches_count,
+        "bytes_per_match": {"before": legacy_bytes / matches_count, "after": slots_bytes / matches_count},
+        "bytes_per_player": {"before": legacy_player_bytes / players_count,
+                             "after": slots_player_bytes / players_count},
+        "match_memory_ratio": legacy_bytes / slots_bytes,
+    }
+
+
+def run_archive(tournaments_count, players_count, rounds_count):
+    """Measure the memory of the tournaments of a synthetic archive, loaded with Tournament.from_json."""
+    archive = build_archive(tournaments_count, players_count, rounds_count)
+    matches_count = sum(len(round_data["matches"]) for tournament_data in archive
+                        for round_data in tournament_data["rounds"])
+    loaded_bytes = measure(lambda: [Tournament.from_json(tournament_data) for tournament_data in archive])
+    return {
+        "tournaments": tournaments_count,
+        "matches": matches_count,
+        "bytes": loaded_bytes,
+        "bytes_per_match": loaded_bytes / matches_count,
+    }
+
+
+def run_benchmark(matches_counts, players_count, tournaments_count, seed):
+    return {
+        "benchmark": "memory",
+        "python": platform.python_version(),
+        "players": players_count,
+        "results": [run_matches(count, players_count, seed) for count in matches_counts],
+        "archive": run_archive(tournaments_count, 16, 7),
+    }
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Mesure de la mémoire occupée par les matchs et les joueurs, "
+                                                 "avant et après le passage aux classes compactes.")
+    parser.add_argument("--matches", type=int, nargs="+", default=[100000, 1000000], help="Nombres de matchs")
+    parser.add_argument("--players", type=int, default=1000, help="Nombre de joueurs (au moins 2)")
+    parser.add_argument("--tournaments", type=int, default=1000,
+                        help="Nombre de tournois de 16 joueurs et 7 rounds de l'archive chargée")
+    parser.add_argument("--seed", type=int, default=42, help="Graine des appariements et des résultats")
+    parser.add_argument("--output", help="Fichier JSON de sortie (sortie standard par défaut)")
+    args = parser.parse_args(arguments)
+
+    if args.players < 2:
+        parser.error("Le nombre de joueurs doit être au moins égal à 2.")
+
+    report = json.dumps(run_benchmark(args.matches, args.players, args.tournaments, args.seed), indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark of the name search index.
+
+This module builds a search index of synthetic players (accented names generated from syllables) and times
+prefix and substring searches. The timings are printed as JSON.
+
+Usage:
+    python -m benchmark.search_benchmark --entries 1000 100000 --seed 42
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import time
+
+from utils.search_index import SearchIndex
+
+SYLLABLES = ("ma", "ri", "lé", "on", "dû", "pon", "ber", "tin", "ça", "ro", "él", "ise", "mar", "gue", "rite",
+             "lau", "ren", "hé", "lè", "ne", "cos", "ta", "da", "vid", "an", "ne", "zoé", "lu", "cas", "bo")
+QUERIES = {
+    "prefix_short": "ma",
+    "prefix_long": "marti",
+    "substring_short": "on",
+    "substring_long": "rtin",
+    "accented": "Hélè",
+    "no_match": "xyzw",
+}
+
+
+def generate_name(rng):
+    """Generate a name of two to four syllables."""
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+
+
+def generate_entries(entries_count, rng):
+    """Generate the entries of synthetic players, searched on their last name, first name and full name."""
+    entries = []
+    for index in range(entries_count):
+        lastname, firstname = generate_name(rng), generate_name(rng)
+        entries.append((index, (lastname, firstname), (lastname, firstname, f"{lastname} {firstname}")))
+    return entries
+
+
+def time_query(search, query, limit, repetitions):
+    """Return the median duration in seconds and the number of results of a search."""
+    durations = []
+    results = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        results = search(query, limit)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), len(results)
+
+
+def run_benchmark(entries_counts, seed, limit, repetitions):
+    """Build an index of each size and time each query.
+
+    Returns:
+        dict: The environment, the build times and the median query times.
+    """
+    results = []
+    for entries_count in entries_counts:
+        entries = generate_entries(entries_count, random.Random(seed))
+        start = time.perf_counter()
+        search_index = SearchIndex.build(entries)
+        build_seconds = time.perf_counter() - start
+
+        queries = {}
+        for name, query in QUERIES.items():
+            seconds, count = time_query(search_index.search, query, limit, repetitions)
+            queries[name] = {"query": query, "median_seconds": seconds, "results": count}
+        results.append({"entries": entries_count, "build_seconds": build_seconds, "queries": queries})
+    return {
+        "benchmark": "search",
+        "python": platform.python_version(),
+        "limit": limit,
+        "results": results,
+    }
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Mesure des temps de recherche dans l'index des noms.")
+    parser.add_argument("--entries", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Nombres d'entrées de l'index")
+    parser.add_argument("--seed", type=int, default=42, help="Graine des noms générés")
+    parser.add_argument("--limit", type=int, default=20, help="Nombre maximal de résultats par recherche")
+    parser.add_argument("--repetitions", type=int, default=50, help="Nombre de répétitions de chaque recherche")
+    parser.add_argument("--output", help="Fichier JSON de sortie (sortie standard par défaut)")
+    args = parser.parse_args(arguments)
+
+    report = json.dumps(run_benchmark(args.entries, args.seed, args.limit, args.repetitions), indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
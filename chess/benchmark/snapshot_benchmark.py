@@ -0,0 +1,146 @@
+"""
+Benchmark of the binary snapshot of the tournament archive.
+
+This module builds a synthetic archive of finished tournaments (a few tournaments played with seeded random
+results, copied under different names), then times the save and the load of the archive in JSON and in the
+binary snapshot, as well as the loading of the whole archive and of one tournament through the repository,
+with and without the binary snapshot. The timings and speedups are printed as JSON.
+
+Usage:
+    python -m benchmark.snapshot_benchmark --tournaments 1000 10000 --players 16 --rounds 7
+"""
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import random
+import tempfile
+import time
+
+from benchmark.tournament_benchmark import RESULTS, create_tournament, generate_players
+from repository.tournament_repository import (TournamentRepository, iter_binary_records,
+                                              write_binary_records)
+from utils.json_stream import iter_json_array, write_json_array
+
+TEMPLATES_COUNT = 8
+
+
+def play_template(index, players_count, rounds_count, repository):
+    """Play a tournament with random results and return its stored data."""
+    rng = random.Random(index)
+    random.seed(index)
+    tournament = create_tournament(f"Modèle {index}", generate_players(players_count, rng), rounds_count)
+    for _ in range(rounds_count):
+        for match in tournament.generate_pairs_for_round():
+            tournament.record_result(match, rng.choice(RESULTS))
+        tournament.current_round += 1
+    return repository._tournament_to_data(tournament)
+
+
+def build_archive(tournaments_count, players_count, rounds_count):
+    """Build the synthetic archive: copies of a few played tournaments, each under its own name."""
+    repository = TournamentRepository(os.devnull)
+    templates = [play_template(index, players_count, rounds_count, repository) for index in range(TEMPLATES_COUNT)]
+    return [{**templates[index % TEMPLATES_COUNT], "name": f"Tournoi {index:06d}"}
+            for index in range(tournaments_count)]
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def save_json(filename, archive):
+    with open(filename, 'w') as file:
+        write_json_array(file, archive)
+
+
+def save_binary(filename, archive):
+    with open(filename, 'wb') as file:
+        for _ in write_binary_records(file, archive):
+            pass
+
+
+def load_json(filename):
+    with open(filename, 'r') as file:
+        return list(iter_json_array(file))
+
+
+def load_binary(filename):
+    with open(filename, 'rb') as file:
+        # Passer l'en-tête du fichier
+        pickle.load(file)
+        return list(iter_binary_records(file))
+
+
+def run_archive(tournaments_count, players_count, rounds_count):
+    """Time the save and the load of an archive of the given size."""
+    archive = build_archive(tournaments_count, players_count, rounds_count)
+    last_name = archive[-1]["name"]
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "tournament.json")
+        json_repository = TournamentRepository(filename, use_binary_snapshot=False)
+        binary_repository = TournamentRepository(filename)
+
+        json_save, _ = timed(lambda: save_json(filename, archive))
+        binary_save, _ = timed(lambda: save_binary(binary_repository.binary_filename, archive))
+        json_load, json_archive = timed(lambda: load_json(filename))
+        binary_load, binary_archive = timed(lambda: load_binary(binary_repository.binary_filename))
+
+        repository_json_load, _ = timed(json_repository.load_tournaments)
+        repository_json_get, _ = timed(lambda: json_repository.get_tournament(last_name))
+        repository_binary_load, _ = timed(binary_repository.load_tournaments)
+        repository_binary_get, _ = timed(lambda: binary_repository.get_tournament(last_name))
+
+        return {
+            "tournaments": tournaments_count,
+            "json_bytes": os.path.getsize(filename),
+            "binary_bytes": os.path.getsize(binary_repository.binary_filename),
+            "same_data": json_archive == binary_archive == archive,
+            "save_seconds": {"json": json_save, "binary": binary_save},
+            "load_seconds": {"json": json_load, "binary": binary_load},
+            "repository_load_tournaments_seconds": {"json": repository_json_load, "binary": repository_binary_load},
+            "repository_get_tournament_seconds": {"json": repository_json_get, "binary": repository_binary_get},
+            "save_speedup": json_save / binary_save,
+            "load_speedup": json_load / binary_load,
+            "repository_load_speedup": repository_json_load / repository_binary_load,
+        }
+
+
+def run_benchmark(tournaments_counts, players_count, rounds_count):
+    return {
+        "benchmark": "snapshot",
+        "python": platform.python_version(),
+        "players": players_count,
+        "rounds": rounds_count,
+        "results": [run_archive(count, players_count, rounds_count) for count in tournaments_counts],
+    }
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Mesure du chargement et de l'enregistrement de l'archive "
+                                                 "des tournois, en JSON et en binaire.")
+    parser.add_argument("--tournaments", type=int, nargs="+", default=[1000, 10000],
+                        help="Nombres de tournois de l'archive")
+    parser.add_argument("--players", type=int, default=16, help="Nombre de joueurs par tournoi (pair)")
+    parser.add_argument("--rounds", type=int, default=7, help="Nombre de rounds par tournoi")
+    parser.add_argument("--output", help="Fichier JSON de sortie (sortie standard par défaut)")
+    args = parser.parse_args(arguments)
+
+    if args.players < 2 or args.players % 2:
+        parser.error("Le nombre de joueurs doit être pair et au moins égal à 2.")
+
+    report = json.dumps(run_benchmark(args.tournaments, args.players, min(args.rounds, args.players - 1)),
+                        indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Headless tournament simulation and benchmark.
+
+This module simulates complete tournaments without any user interaction: it generates a synthetic pool
+of players, plays every round with seeded random results, and times separately the pairing, the
+standings and the persistence of each round. The timings are printed as JSON.
+
+Usage:
+    python -m benchmark.tournament_benchmark --players 8 64 512 2000 --rounds 7 --seed 42
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+
+from model.player import Player
+from model.round import Round
+from model.tournament import Tournament, calculate_leaderboard
+from repository.tournament_repository import TournamentRepository
+
+RESULTS = ("win", "loss", "draw")
+
+
+def generate_players(count, rng):
+    """Generate a pool of synthetic players with unique national chess IDs.
+
+    Args:
+        count (int): The number of players.
+        rng (random.Random): The random generator.
+
+    Returns:
+        List[Player]: The players.
+    """
+    players = []
+    for index in range(count):
+        letters = chr(ord("A") + index // 26 // 100000 % 26) + chr(ord("A") + index // 100000 % 26)
+        national_chess_id = f"{letters}{index % 100000:05d}"
+        birth = f"{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-{rng.randint(1950, 2010)}"
+        players.append(Player(f"Joueur{index}", f"Bench{index:06d}", birth, national_chess_id))
+    return players
+
+
+def create_tournament(name, players, rounds_count):
+    """Create a tournament with its players and empty rounds."""
+    tournament = Tournament(name=name, place="Benchmark", date_start="01-01-2024", date_end="02-01-2024")
+    for number in range(rounds_count):
+        tournament.add_round(Round(f"Round {number + 1}", [], None, None))
+    tournament.players_list = list(players)
+    return tournament
+
+
+def simulate_tournament(players_count, rounds_count, seed, repository):
+    """Play a synthetic tournament and time each step of each round.
+
+    Args:
+        players_count (int): The number of players (must be even).
+        rounds_count (int): The number of rounds.
+        seed (int): The seed of the random results.
+        repository (TournamentRepository): The repository used to time the persistence.
+
+    Returns:
+        dict: The timings in seconds, per round and in total, for pairing, standings and persistence.
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    players = generate_players(players_count, rng)
+    tournament = create_tournament(f"Benchmark {players_count}", players, rounds_count)
+
+    timings = {"pairing": [], "results": [], "standings": [], "persistence": []}
+    for _ in range(rounds_count):
+        start = time.perf_counter()
+        matches = tournament.generate_pairs_for_round()
+        timings["pairing"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for match in matches:
+            tournament.record_result(match, rng.choice(RESULTS))
+        timings["results"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            calculate_leaderboard(tournament, {})
+        timings["standings"].append(time.perf_counter() - start)
+
+        tournament.current_round += 1
+        start = time.perf_counter()
+        repository.add_tournament(tournament)
+        timings["persistence"].append(time.perf_counter() - start)
+
+    return {
+        "players": players_count,
+        "rounds": rounds_count,
+        "seed": seed,
+        "per_round_seconds": timings,
+        "total_seconds": {step: sum(values) for step, values in timings.items()},
+    }
+
+
+def run_benchmark(players_counts, rounds_count, seed):
+    """Run the simulation for each size of player pool, persisting in a temporary directory.
+
+    Returns:
+        dict: The environment and the timings of each simulation.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        repository = TournamentRepository(os.path.join(directory, "tournament.json"))
+        for players_count in players_counts:
+            rounds = min(rounds_count, players_count - 1)
+            results.append(simulate_tournament(players_count, rounds, seed, repository))
+        repository.wait_for_compaction()
+    return {
+        "benchmark": "tournament",
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Simulation de tournois et mesure des temps d'exécution.")
+    parser.add_argument("--players", type=int, nargs="+", default=[8, 64, 512, 2000],
+                        help="Nombres de joueurs à simuler (pairs)")
+    parser.add_argument("--rounds", type=int, default=7, help="Nombre de rounds")
+    parser.add_argument("--seed", type=int, default=42, help="Graine des résultats aléatoires")
+    parser.add_argument("--output", help="Fichier JSON de sortie (sortie standard par défaut)")
+    args = parser.parse_args(arguments)
+
+    if any(count < 2 or count % 2 for count in args.players):
+        parser.error("Les nombres de joueurs doivent être pairs et au moins égaux à 2.")
+
+    report = json.dumps(run_benchmark(args.players, args.rounds, args.seed), indent=4)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
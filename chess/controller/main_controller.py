@@ -1,30 +1,36 @@
-# Import des classes de repository
-from repository.tournament_repository import TournamentRepository
-from repository.player_repository import PlayerRepository
+import time
+
+# Import de la session, qui crée les repositories et précharge leurs données
+from controller.session import Session
 
 # Import des classes de controller
 from controller.tournament_controller import TournamentController
 from controller.player_controller import PlayerController
+from controller.section_controller import SectionController
 
 # Import des classes de vue
 from view.tournament_view import TournamentView
 from view.player_view import PlayerView
 from view.main_view import MainView
 
+# Erreur levée quand un autre programme a modifié les données entre-temps
+from repository.file_storage import ConflictError
 
-class MainController:
-    def __init__(self):
+# Import du service des terminaux d'arbitres
+from service.arbiter_service import ArbiterService
 
-        # Initialisation des instances nécessaires
-        _tournament_repository = TournamentRepository()
-        _player_repository = PlayerRepository()
 
-        # Création de TournamentController
-        self._tournament_controller = TournamentController(_tournament_repository, None,
-                                                           _player_repository, None)
+# Entrée du menu mesurée avec --profile-startup : la liste des tournois, affichée sans autre saisie
+PROFILED_LISTING_CHOICE = "1"
+
 
-        # Création de TournamentView avec le contrôleur correspondant
-        _tournament_view = TournamentView(self._tournament_controller)
+class MainController:
+    def __init__(self, session=None):
+
+        # Repositories partagés par tous les contrôleurs
+        self._session = session or Session()
+        _player_repository = self._session.player_repository
+        _tournament_repository = self._session.tournament_repository
 
         # Création de PlayerView
         _player_view = PlayerView(_player_repository)
@@ -33,35 +39,87 @@ class MainController:
 
         # Création de PlayerController avec le view correspondant
         self._player_controller = PlayerController(_player_repository, _player_view)
-        self._tournament_controller = TournamentController(_tournament_repository, _tournament_view,
-                                                           _player_repository, self._player_controller)
 
-    def run(self):
+        # Création de TournamentController, puis de TournamentView avec le contrôleur correspondant
+        self._tournament_controller = TournamentController(_tournament_repository, None,
+                                                           _player_repository, self._player_controller,
+                                                           self._session.rating_repository,
+                                                           self._session.checkpoint_repository)
+        self._tournament_controller.tournament_view = TournamentView(self._tournament_controller)
+        self._section_controller = SectionController(_tournament_repository, self._tournament_controller)
+
+    def generate_round_pairings(self, tournament_name):
+        """Génère les appariements du round en cours d'un tournoi (mode ligne de commande)."""
+        return self._tournament_controller.generate_round_pairings(tournament_name)
+
+    def import_round_results(self, tournament_name, stream, file_format=None):
+        """Importe les résultats du round en cours d'un tournoi (mode ligne de commande)."""
+        return self._tournament_controller.import_results_from_file(tournament_name, stream, file_format)
+
+    def export_report(self, report, tournament_name=None, file_format="csv", output="-", round_number=None):
+        """Exporte un rapport en CSV ou en HTML (mode ligne de commande)."""
+        return self._tournament_controller.export_report(report, tournament_name, file_format, output,
+                                                         round_number)
+
+    def create_arbiter_service(self):
+        """Crée le service des terminaux d'arbitres, sur les repositories de l'application."""
+        return ArbiterService(self._tournament_controller)
+
+    def run(self, profile=None):
+        """Affiche le menu principal et exécute les choix de l'utilisateur.
+
+        Les données sont préchargées en arrière-plan pendant l'affichage du premier menu.
+
+        Args:
+            profile (StartupProfile, optional): Affiche les temps jusqu'au premier menu et à la première liste.
+        """
+        self._session.start_preload()
 
         while True:
             self._main_view.display_main_menu()
+            if profile is not None:
+                profile.report("menu principal affiché")
 
             choice = input("Entrez le numéro de votre choix: ")
-
-            if choice == "1":
-                self._tournament_controller.show_tournaments()
-            elif choice == "2":
-                self._tournament_controller.show_tournament_details()
-            elif choice == "3":
-                self._player_controller.show_players()
-            elif choice == "4":
-                self._player_controller.create_new_player()
-            elif choice == "5":
-                self._tournament_controller.create_new_tournament()
-            elif choice == "6":
-                self._tournament_controller.resume_unstarted_tournament()
-            elif choice == "7":
-                self._tournament_controller.resume_tournament()
-            elif choice == "8":
-                print("\nA bientôt !")
-                break
-            else:
-                print("Choix invalide. Veuillez entrer un numéro valide.")
+            if choice != "11":
+                action_start = time.perf_counter()
+                waited = self._session.wait_until_ready()
+
+            try:
+                if choice == "1":
+                    self._tournament_controller.show_tournaments()
+                elif choice == "2":
+                    self._tournament_controller.show_tournament_details()
+                elif choice == "3":
+                    self._player_controller.show_players()
+                elif choice == "4":
+                    self._player_controller.create_new_player()
+                elif choice == "5":
+                    self._tournament_controller.create_new_tournament()
+                elif choice == "6":
+                    self._tournament_controller.resume_unstarted_tournament()
+                elif choice == "7":
+                    self._tournament_controller.resume_tournament()
+                elif choice == "8":
+                    self._section_controller.play_sections_in_parallel()
+                elif choice == "9":
+                    self._tournament_controller.show_player_history()
+                elif choice == "10":
+                    self._tournament_controller.export_report_from_menu()
+                elif choice == "11":
+                    print("\nA bientôt !")
+                    break
+                else:
+                    print("Choix invalide. Veuillez entrer un numéro valide.")
+            except ConflictError as error:
+                # Données modifiées par un autre programme (service des arbitres, autre terminal)
+                print(f"\n{error}")
+
+            if profile is not None and choice == PROFILED_LISTING_CHOICE:
+                profile.report("première liste affichée",
+                               f" (action : {(time.perf_counter() - action_start) * 1000:.1f} ms, dont "
+                               f"{waited * 1000:.1f} ms d'attente du préchargement, "
+                               f"préchargement : {self._session.preload_seconds * 1000:.1f} ms)")
 
 
 if __name__ == "__main__":
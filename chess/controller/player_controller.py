@@ -1,5 +1,9 @@
+from operator import itemgetter
+
 from model.player import Player
-from view.player_view import get_player_info_from_user
+from repository.player_repository import get_selected_player
+from view.player_view import (display_player_details, display_players_found, get_player_info_from_user,
+                              get_player_search_query)
 
 
 class PlayerController:
@@ -8,43 +12,35 @@ class PlayerController:
         self.player_view = player_view
 
     def show_players(self):
-        """Affiche la liste des joueurs."""
-        sorted_players = self.player_repository.get_player_by_alphabetical_order()
+        """Affiche la liste des joueurs, puis les détails des joueurs demandés."""
+        sorted_players = self.player_view.show_players()
         if not sorted_players:
-            print("Aucun joueur enregistré pour le moment.")
-        else:
-            print("Liste des joueurs :\n")
-            for index, player_info in enumerate(sorted_players, start=1):
-                print(f"{index}. {player_info['lastname']} {player_info['firstname']}")
-
-            while True:
-                choice = input("\nSouhaitez-vous les détails d'un joueur ? (y/n): ").lower()
-                if choice == "n":
-                    break
-                elif choice == "y":
-                    player_index = input("Veuillez indiquer l'index du joueur : ")
-                    try:
-                        player_index = int(player_index)
-                        if 1 <= player_index <= len(sorted_players):
-                            player_info = sorted_players[player_index - 1]
-                            print("\nDétails du joueur :\n")
-                            print(f"Nom: {player_info['lastname']} {player_info['firstname']}")
-                            print(f"Date de naissance: {player_info['birth']}")
-                            print(f"Identifiant national d'échecs: {player_info['national chess ID']}")
-                        else:
-                            print("Index invalide.")
-                    except ValueError:
-                        print("Veuillez entrer un index valide.")
-                else:
-                    print("Choix invalide. Veuillez entrer 'y' pour oui ou 'n' pour non.")
+            return
+
+        while True:
+            choice = input("\nSouhaitez-vous les détails d'un joueur ? (y/n): ").lower()
+            if choice == "n":
+                break
+            elif choice == "y":
+                player_index = input("Veuillez indiquer l'index du joueur : ")
+                try:
+                    player_index = int(player_index)
+                    if 1 <= player_index <= len(sorted_players):
+                        display_player_details(sorted_players[player_index - 1])
+                    else:
+                        print("Index invalide.")
+                except ValueError:
+                    print("Veuillez entrer un index valide.")
+            else:
+                print("Choix invalide. Veuillez entrer 'y' pour oui ou 'n' pour non.")
 
     def create_new_player(self):
         """Obtient les informations du joueur et crée un objet Player."""
         firstname, lastname, birth, national_chess_id = get_player_info_from_user()
         new_player = Player(firstname, lastname, birth, national_chess_id)
+        self.player_repository.add_player(new_player)
         print(f"La joueuse ou le joueur {new_player.firstname} {new_player.lastname} "
               f"a bien été ajouté.e à la liste.")
-        self.player_repository.add_player(new_player)
         return new_player
 
     def add_player(self):
@@ -53,3 +49,28 @@ class PlayerController:
         if player_info is not None:
             new_player = Player(*player_info)
             self.player_repository.add_player(new_player)
+
+    def search_players(self, query, limit=None):
+        """Recherche des joueurs par nom ou prénom, sans tenir compte des accents ni de la casse."""
+        return self.player_repository.search_players(query, limit)
+
+    def select_player(self):
+        """Recherche un joueur par nom puis le fait choisir parmi les résultats.
+
+        Returns:
+            tuple: Le joueur choisi (Player) et son index dans les résultats.
+        """
+        while True:
+            query = get_player_search_query()
+            # Les résultats d'une recherche sont classés par pertinence, la liste complète par nom
+            sort_key = None
+            if query:
+                players = self.search_players(query)
+            else:
+                players = self.player_repository.get_player_by_alphabetical_order()
+                sort_key = itemgetter('lastname')
+            if not players:
+                print("Aucun joueur trouvé.")
+                continue
+            display_players_found(players, sort_key)
+            return get_selected_player(players)
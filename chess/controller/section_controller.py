@@ -0,0 +1,163 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from model.pairing import PairingError
+from model.tournament import Tournament
+from repository.file_storage import ConflictError
+from view.tournament_view import (ask_to_play_next_round,
+                                  display_round_pairings,
+                                  display_section_header,
+                                  get_section_indexes_from_user)
+
+
+def section_to_data(tournament):
+    """Convertit un tournoi en dictionnaire transmissible à un processus de calcul."""
+    tournament_data = tournament.to_json()
+    tournament_data["players_list"] = [player.to_json() for player in tournament.players_list]
+    return tournament_data
+
+
+def compute_section_pairings(tournament_data, ratings=None):
+    """Calcule les appariements du round en cours d'une section (exécuté dans un processus de calcul).
+
+    Args:
+        tournament_data (dict): Les données de la section.
+        ratings (dict, optional): L'Elo des joueurs pour l'appariement du premier round.
+
+    Returns:
+        tuple: (pairings, error) : les paires d'identifiants nationaux par échiquier, ou le message d'erreur
+               si aucun appariement n'est possible.
+    """
+    tournament = Tournament.from_json(tournament_data)
+    try:
+        return tournament.compute_pairings(ratings), None
+    except PairingError as error:
+        return None, str(error)
+
+
+def compute_section_standings(tournament_data):
+    """Calcule le classement et les départages d'une section (exécuté dans un processus de calcul).
+
+    Returns:
+        List[tuple]: (national_chess_id, score, buchholz, sonneborn_berger, cumulatif) du premier au dernier.
+    """
+    tournament = Tournament.from_json(tournament_data)
+    return [(player.national_chess_id, *scores) for player, *scores in tournament.score_ledger.detailed_standings()]
+
+
+class SectionController:
+    """Joue plusieurs sections indépendantes d'un open (A, B, jeunes...) round par round.
+
+    Les appariements et les classements des sections sont calculés en parallèle dans des processus de calcul,
+    qui ne reçoivent et ne renvoient que des données JSON. Le coordinateur applique ces résultats à ses propres
+    objets Tournament et est le seul à écrire dans le repository, une fois par section et par round.
+    """
+
+    def __init__(self, tournament_repository, tournament_controller, max_workers=None):
+        self.tournament_repository = tournament_repository
+        self.tournament_controller = tournament_controller
+        self.max_workers = max_workers
+
+    def play_sections_in_parallel(self):
+        """Demande les sections à jouer parmi les tournois non terminés, puis les joue ensemble."""
+        unfinished_tournaments = self.tournament_repository.find_unfinished_tournaments()
+        if len(unfinished_tournaments) < 2:
+            print("Il faut au moins deux tournois non terminés pour jouer en mode multi-sections.")
+            return
+
+        print("\nTournois non terminés :")
+        for idx, tournament in enumerate(unfinished_tournaments, 1):
+            print(f"{idx}. {tournament.name} à {tournament.place}")
+        indexes = get_section_indexes_from_user(len(unfinished_tournaments))
+
+        tournaments = [Tournament.from_json(self.tournament_repository.get_tournament(
+            unfinished_tournaments[index - 1].name)) for index in indexes]
+        # Reprendre le round en cours de chaque section depuis son point de reprise
+        for tournament in tournaments:
+            self.tournament_controller.restore_checkpoint(tournament)
+        self.play_sections(tournaments)
+
+    def play_sections(self, tournaments):
+        """Joue les rounds de plusieurs sections, jusqu'à leur fin ou jusqu'à l'arrêt demandé par l'utilisateur.
+
+        Args:
+            tournaments (List[Tournament]): Les sections, qui doivent être des tournois distincts.
+        """
+        workers = min(len(tournaments), self.max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            sections = [tournament for tournament in tournaments
+                        if tournament.current_round < len(tournament.rounds)]
+            while sections:
+                sections = self._pair_sections(executor, sections)
+
+                # La saisie des résultats reste séquentielle : c'est l'arbitre qui les fournit
+                for tournament in sections:
+                    display_section_header(tournament)
+                    self.tournament_controller.enter_round_results(tournament)
+
+                sections = self._close_sections_round(executor, sections)
+
+                sections = [tournament for tournament in sections
+                            if tournament.current_round < len(tournament.rounds)]
+                if not sections or not ask_to_play_next_round():
+                    break
+
+    def _pair_sections(self, executor, sections):
+        """Génère en parallèle les appariements des sections dont le round en cours n'est pas encore apparié.
+
+        Returns:
+            List[Tournament]: Les sections appariées ; celles dont l'appariement est impossible sont écartées.
+        """
+        now = datetime.now().strftime("%d-%m-%Y %H:%M")
+        to_pair = []
+        for tournament in sections:
+            current_round = tournament.rounds[tournament.current_round]
+            if current_round.start_time is None:
+                current_round.start_time = now
+            if not current_round.matches:
+                to_pair.append(tournament)
+
+        failed = set()
+        results = executor.map(compute_section_pairings, [section_to_data(tournament) for tournament in to_pair],
+                               [self.tournament_controller.get_seed_ratings(tournament) for tournament in to_pair])
+        for tournament, (pairings, error) in zip(to_pair, results):
+            display_section_header(tournament)
+            if error is not None:
+                print(error)
+                failed.add(tournament.name)
+                continue
+            display_round_pairings(tournament.apply_pairings(pairings))
+            self.tournament_controller.checkpoint_pairings(tournament)
+
+        return [tournament for tournament in sections if tournament.name not in failed]
+
+    def _close_sections_round(self, executor, sections):
+        """Calcule en parallèle les classements, clôt le round de chaque section et les enregistre.
+
+        Returns:
+            List[Tournament]: Les sections enregistrées ; celles modifiées entre-temps par un autre programme
+                              sont écartées, les autres continuent.
+        """
+        results = executor.map(compute_section_standings, [section_to_data(tournament) for tournament in sections])
+        for tournament, standings in zip(sections, results):
+            display_section_header(tournament)
+            players_by_id = {player.national_chess_id: player for player in tournament.players_list}
+            self.tournament_controller.close_round(
+                tournament, [(players_by_id[national_chess_id], *scores) for national_chess_id, *scores in standings])
+
+        # Le coordinateur est le seul à écrire : les processus de calcul ne touchent pas au stockage
+        saved = []
+        for tournament in sections:
+            try:
+                self.tournament_controller.save_tournament(tournament)
+            except ConflictError as error:
+                display_section_header(tournament)
+                print(error)
+                continue
+            saved.append(tournament)
+        return saved
+
+
+if __name__ == "__main__":
+    pass
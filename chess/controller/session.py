@@ -0,0 +1,94 @@
+"""
+This module contains the session of the application: the repositories shared by all the controllers, whose
+data is loaded in a background thread while the main menu is displayed.
+
+Classes:
+    Session: The shared repositories and their preloading.
+    StartupProfile: The startup timings printed with --profile-startup.
+"""
+
+import sys
+import threading
+import time
+
+from repository.checkpoint_repository import CheckpointRepository
+from repository.rating_repository import RatingRepository
+from repository.repository_factory import create_repositories
+
+
+class Session:
+    """Repositories shared by the controllers of the application, preloaded in the background.
+
+    start_preload reads and indexes the players and the tournaments in a background thread, so that the
+    main menu is displayed without waiting for the data files. The repositories keep this data in memory
+    and only read the files again when they change, so the menu actions then work on the warm caches.
+    The actions call wait_until_ready first: they never use a repository while the thread is filling it.
+    """
+
+    def __init__(self, backend=None):
+        """Initialize the Session.
+
+        Args:
+            backend (str, optional): The storage backend, 'json' or 'sqlite' (see create_repositories).
+        """
+        self.player_repository, self.tournament_repository = create_repositories(backend)
+        self.rating_repository = RatingRepository(self.tournament_repository)
+        self.checkpoint_repository = CheckpointRepository(self.tournament_repository)
+        self.preload_seconds = None
+        self._preload_thread = None
+
+    def preload(self):
+        """Load and index the players and the tournaments."""
+        start = time.perf_counter()
+        try:
+            self.player_repository.preload()
+            self.tournament_repository.preload()
+        except Exception:
+            # Fichier illisible : l'action du menu qui en a besoin rencontrera et affichera la même erreur
+            pass
+        self.preload_seconds = time.perf_counter() - start
+
+    def start_preload(self):
+        """Start preloading the data in a background thread, if it is not already started."""
+        if self._preload_thread is not None:
+            return
+        # Thread démon : quitter le programme n'attend pas la fin du préchargement
+        self._preload_thread = threading.Thread(target=self.preload, name="session-preload", daemon=True)
+        self._preload_thread.start()
+
+    def wait_until_ready(self):
+        """Wait for the end of the preloading, if it was started.
+
+        Returns:
+            float: The time waited, in seconds.
+        """
+        if self._preload_thread is None or not self._preload_thread.is_alive():
+            return 0.0
+        start = time.perf_counter()
+        self._preload_thread.join()
+        return time.perf_counter() - start
+
+
+class StartupProfile:
+    """Startup timings, printed on the error output so that they do not mix with the menus."""
+
+    def __init__(self, started_at):
+        """Initialize the StartupProfile.
+
+        Args:
+            started_at (float): The time.perf_counter() value at the start of the program.
+        """
+        self.started_at = started_at
+        self._reported = set()
+
+    def report(self, event, detail=""):
+        """Print the time elapsed since the start of the program, the first time an event occurs."""
+        if event in self._reported:
+            return
+        self._reported.add(event)
+        elapsed = (time.perf_counter() - self.started_at) * 1000
+        print(f"[profil] {event} : {elapsed:.1f} ms{detail}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    pass
@@ -1,15 +1,31 @@
+import sys
+
 from model.tournament import Tournament, calculate_leaderboard
 from model.round import Round
+from model.pairing import PairingError
 from datetime import datetime
-from repository.tournament_repository import TournamentRepository
-from repository.player_repository import get_selected_player
+from operator import attrgetter
+from repository.file_storage import atomic_write
+from utils.report_export import ReportExportError, write_report
+from utils.result_import import ResultImportError, read_results, validate_results
+from view.player_view import ask_head_to_head, display_head_to_head, display_player_history
 from view.tournament_view import (display_tournament_list,
                                   get_tournament_index_from_user,
+                                  get_tournament_choice_from_user,
                                   prompt_add_players,
                                   prompt_play_tournament,
                                   ask_to_play_next_round,
                                   display_add_player_menu,
-                                  get_user_choice)
+                                  get_user_choice,
+                                  display_round_pairings,
+                                  display_crosstable,
+                                  display_result_template,
+                                  ask_result_entry_mode,
+                                  get_result_file_path,
+                                  display_import_errors,
+                                  ask_export_report,
+                                  ask_export_format,
+                                  get_export_file_path)
 
 
 def get_tournament_name_by_index(tournaments, tournament_index):
@@ -21,29 +37,131 @@ def get_tournament_name_by_index(tournaments, tournament_index):
 
 
 class TournamentController:
-    def __init__(self, tournament_repository, tournament_view, player_repository, player_controller):
+    def __init__(self, tournament_repository, tournament_view, player_repository, player_controller,
+                 rating_repository=None, checkpoint_repository=None):
         self.tournament_repository = tournament_repository
         self.tournament_view = tournament_view
         self.player_repository = player_repository
         self.player_controller = player_controller
+        self.rating_repository = rating_repository
+        self.checkpoint_repository = checkpoint_repository
         self.num_players = 0
+        # Tournois enregistrés déjà chargés pour l'affichage et les exports, avec leur grille américaine
+        self._stored_tournaments = {}
 
     def show_tournaments(self):
         tournaments = self.tournament_repository.get_tournaments_by_alphabetical_order()
-        display_tournament_list(tournaments)
+        display_tournament_list(tournaments, attrgetter('name'))
         return tournaments
 
-    def show_tournament_details(self):
+    def select_tournament_name(self):
+        """Affiche la liste des tournois et fait choisir un tournoi, par son index ou une partie de son nom.
+
+        Returns:
+            str: Le nom du tournoi choisi, ou None si aucun tournoi ne correspond à la recherche.
+        """
         tournaments = self.show_tournaments()
         total_tournaments = len(tournaments)
-        tournament_index = get_tournament_index_from_user(total_tournaments)
-        tournament_name = get_tournament_name_by_index(tournaments, tournament_index)
-        self.get_tournament_details(tournament_name)
+        choice = get_tournament_choice_from_user(total_tournaments)
+        if isinstance(choice, int):
+            return get_tournament_name_by_index(tournaments, choice)
+        # Recherche par nom, sans tenir compte des accents ni de la casse
+        tournaments_found = self.search_tournaments(choice)
+        if not tournaments_found:
+            print("Aucun tournoi trouvé.")
+            return None
+        if len(tournaments_found) > 1:
+            display_tournament_list(tournaments_found)
+            tournament_index = get_tournament_index_from_user(len(tournaments_found))
+        else:
+            tournament_index = 1
+        return get_tournament_name_by_index(tournaments_found, tournament_index)
+
+    def show_tournament_details(self):
+        tournament_name = self.select_tournament_name()
+        if tournament_name is not None:
+            self.get_tournament_details(tournament_name)
+
+    def export_report_from_menu(self):
+        """Exporte les appariements, le classement ou le rapport d'un tournoi, ou le rapport de tous les tournois."""
+        report, all_tournaments = ask_export_report()
+        tournament_name = None
+        if not all_tournaments:
+            tournament_name = self.select_tournament_name()
+            if tournament_name is None:
+                return
+        file_format = ask_export_format()
+        default_name = f"{tournament_name or 'tournois'}-{report}.{file_format}".replace(" ", "_")
+        output = get_export_file_path(default_name)
+        if self.export_report(report, tournament_name, file_format, output):
+            print(f"Rapport enregistré dans {output}.")
+
+    def export_report(self, report, tournament_name=None, file_format="csv", output="-", round_number=None):
+        """Exporte les appariements, le classement ou le rapport complet d'un tournoi en CSV ou en HTML.
+
+        Args:
+            report (str): 'pairings', 'standings', 'crosstable' ou 'report'.
+            tournament_name (str, optional): Le nom du tournoi, sans tenir compte des accents ni de la casse.
+                                             Sans nom, le rapport complet porte sur tous les tournois, lus un par un.
+            file_format (str, optional): 'csv' ou 'html'.
+            output (str, optional): Le fichier à écrire, ou '-' pour la sortie standard.
+            round_number (int, optional): Le round des appariements (par défaut, le dernier round apparié).
+
+        Returns:
+            bool: True si le rapport a été écrit.
+        """
+        if tournament_name is None:
+            if report != "report":
+                print("Indiquez le tournoi dont exporter les appariements, le classement ou la grille américaine.")
+                return False
+            # Les tournois sont lus et convertis un par un pendant l'écriture du rapport
+            tournaments = (Tournament.from_json(tournament_data)
+                           for tournament_data in self.tournament_repository.iter_tournaments())
+        else:
+            header = self.tournament_repository.find_tournament_by_name(tournament_name)
+            if header is None:
+                print("Le tournoi spécifié n'existe pas ou n'a pas été trouvé.")
+                return False
+            tournaments = [self.get_stored_tournament(header)]
+
+        round_index = None if round_number is None else round_number - 1
+        try:
+            if output == "-":
+                write_report(sys.stdout, report, file_format, tournaments, round_index)
+            else:
+                # Remplacement atomique : une page publiée n'est jamais lue à moitié écrite
+                with atomic_write(output) as file:
+                    write_report(file, report, file_format, tournaments, round_index)
+        except ReportExportError as error:
+            print(error)
+            return False
+        return True
+
+    def search_tournaments(self, query, limit=None):
+        """Recherche des tournois par nom, sans tenir compte des accents ni de la casse."""
+        return self.tournament_repository.search_tournaments(query, limit)
+
+    def show_player_history(self):
+        """Affiche les parties d'un joueur dans tous les tournois, puis éventuellement son face-à-face
+        avec un autre joueur."""
+        player, _ = self.player_controller.select_player()
+        games = self.tournament_repository.get_player_history(player.national_chess_id)
+        display_player_history(player, games)
+        if games and ask_head_to_head():
+            opponent, _ = self.player_controller.select_player()
+            display_head_to_head(player, opponent, self.tournament_repository.get_head_to_head(
+                player.national_chess_id, opponent.national_chess_id))
 
     def create_new_tournament(self):
         """Crée un nouveau tournoi avec les détails fournis par l'utilisateur."""
         name, place, date_start, date_end, director_note, rounds = self.tournament_view.get_new_tournament_details()
 
+        # Un tournoi de même nom serait remplacé, y compris un tournoi enregistré avant les numéros de version
+        existing_tournament = self.tournament_repository.find_tournament_by_name(name)
+        if existing_tournament is not None:
+            print(f"\nUn tournoi nommé {existing_tournament.name} existe déjà. Choisissez un autre nom.")
+            return None
+
         # Création du tournoi avec les détails fournis
         new_tournament = Tournament(name=name, place=place, date_start=date_start, date_end=date_end,
                                     director_note=director_note)
@@ -72,7 +190,6 @@ class TournamentController:
         """Add players to the tournament."""
         selected_players_index = []
         selected_players = []
-        sorted_players_list = self.player_repository.display_players_by_index()
 
         # Ajouter les joueurs déjà présents dans le tournoi
         for player in tournament.players_list:
@@ -89,7 +206,7 @@ class TournamentController:
             display_add_player_menu(self.num_players)
             user_choice = get_user_choice()
             if user_choice == "1":
-                selected_player, index = get_selected_player(sorted_players_list)
+                selected_player, index = self.player_controller.select_player()
                 # Vérifier si le joueur est déjà dans le tournoi
                 if any(player.firstname == selected_player.firstname and
                        player.lastname == selected_player.lastname for player in selected_players):
@@ -118,9 +235,6 @@ class TournamentController:
                 for player in selected_players:
                     print(f"- {player.firstname} {player.lastname}")
 
-                # Enregistrer le nouveau joueur dans le repository
-                self.player_repository.add_player(new_player)
-
             elif user_choice == "3":
                 # Vérifier si le nombre de joueurs est pair et au moins 6
                 if len(selected_players) >= 6 and len(selected_players) % 2 == 0:
@@ -142,11 +256,32 @@ class TournamentController:
             tournament = Tournament.from_json(chosen_tournament)
             self.add_players_to_tournament(tournament)
 
+    def get_stored_tournament(self, header):
+        """Retourne le tournoi enregistré d'un en-tête, en lecture seule.
+
+        Le tournoi chargé est conservé, avec sa grille américaine, tant que la version enregistrée ne change
+        pas : afficher ou exporter de nouveau le même tournoi ne relit et ne recalcule rien.
+
+        Args:
+            header (TournamentHeader): L'en-tête du tournoi.
+
+        Returns:
+            Tournament: Le tournoi, à ne pas modifier.
+        """
+        tournament = self._stored_tournaments.get(header.name)
+        if tournament is None or tournament.version != header.version:
+            tournament = Tournament.from_json(self.tournament_repository.get_tournament(header.name))
+            self._stored_tournaments[header.name] = tournament
+        return tournament
+
     def get_tournament_details(self, tournament_name):
         tournament_details = self.tournament_repository.get_tournament_details(tournament_name)
         if tournament_details:
             # Afficher les détails du tournoi
             self.tournament_view.display_tournament_details(tournament_details)
+            if tournament_details['rounds'] and tournament_details['rounds'][0]['matches']:
+                header = self.tournament_repository.find_tournament_by_name(tournament_details['name'])
+                display_crosstable(self.get_stored_tournament(header).crosstable)
         else:
             print("Le tournoi spécifié n'existe pas ou n'a pas été trouvé.")
 
@@ -166,10 +301,79 @@ class TournamentController:
         chosen_tournament = self.tournament_repository.resume_tournament()
         if chosen_tournament:
             tournament = Tournament.from_json(chosen_tournament)
+            self.restore_checkpoint(tournament)
             self.play_tournament(tournament)
 
+    def restore_checkpoint(self, tournament):
+        """Restaure le round en cours d'un tournoi depuis son point de reprise : les appariements et les résultats
+        déjà saisis, sans refaire les appariements.
+
+        Returns:
+            int: Le nombre de résultats restaurés.
+        """
+        if self.checkpoint_repository is None:
+            return 0
+        checkpoint = self.checkpoint_repository.load(tournament)
+        if checkpoint is None:
+            return 0
+
+        current_round = tournament.rounds[tournament.current_round]
+        if checkpoint["pairings"] and not current_round.matches:
+            players_ids = {player.national_chess_id for player in tournament.players_list}
+            if not all(player_id in players_ids for pair in checkpoint["pairings"] for player_id in pair):
+                print("Le point de reprise ne correspond pas aux joueurs du tournoi : il est ignoré.")
+                return 0
+            tournament.apply_pairings([tuple(pair) for pair in checkpoint["pairings"]])
+            if current_round.start_time is None:
+                current_round.start_time = checkpoint["start_time"]
+
+        restored = 0
+        for board, result in sorted(checkpoint["results"].items()):
+            if (1 <= board <= len(current_round.matches) and current_round.matches[board - 1].result is None and
+                    result in ("win", "loss", "draw")):
+                tournament.record_result(current_round.matches[board - 1], result)
+                restored += 1
+        print(f"Reprise du round {tournament.current_round + 1} : {restored} résultat(s) déjà saisi(s) "
+              f"restauré(s).")
+        return restored
+
+    def checkpoint_pairings(self, tournament):
+        """Enregistre les appariements du round en cours dans le point de reprise."""
+        if self.checkpoint_repository is None:
+            return
+        try:
+            self.checkpoint_repository.save_pairings(tournament)
+        except OSError as error:
+            print(f"Impossible d'enregistrer le point de reprise : {error}")
+
+    def checkpoint_results(self, tournament, results):
+        """Enregistre des résultats du round en cours, en tuples (échiquier, résultat), dans le point de reprise."""
+        if self.checkpoint_repository is None or not results:
+            return
+        try:
+            self.checkpoint_repository.save_results(tournament, results)
+        except OSError as error:
+            print(f"Impossible d'enregistrer le point de reprise : {error}")
+
+    def save_tournament(self, tournament):
+        """Enregistre le tournoi, met à jour le classement Elo avec ses rounds terminés, puis efface son point de
+        reprise devenu inutile.
+
+        Le classement Elo n'est mis à jour qu'une fois le tournoi enregistré : un round refusé par un conflit de
+        version n'y entre pas.
+
+        Raises:
+            ConflictError: Si le tournoi a été enregistré par un autre programme depuis son chargement. Le point
+                           de reprise est alors conservé.
+        """
+        self.tournament_repository.add_tournament(tournament)
+        if self.rating_repository is not None:
+            self.rating_repository.update_tournament(tournament)
+        if self.checkpoint_repository is not None:
+            self.checkpoint_repository.clear(tournament.name)
+
     def play_tournament(self, tournament):
-        while tournament.current_round <= len(tournament.rounds):
+        while tournament.current_round < len(tournament.rounds):
             current_round = tournament.rounds[tournament.current_round]
 
             print(f"\nRound {tournament.current_round + 1} :")
@@ -178,40 +382,170 @@ class TournamentController:
             if current_round.start_time is None:
                 current_round.start_time = datetime.now().strftime("%d-%m-%Y %H:%M")
 
-            # Générer les paires de matchs pour ce round
-            tournament.generate_pairs_for_round()
+            # Générer les paires de matchs pour ce round, sauf si elles l'ont déjà été
+            if not current_round.matches:
+                try:
+                    tournament.generate_pairs_for_round(self.get_seed_ratings(tournament))
+                except PairingError as error:
+                    print(error)
+                    break
+                self.checkpoint_pairings(tournament)
+                display_round_pairings(current_round.matches)
+
+            self.enter_round_results(tournament)
 
             for match in current_round.matches:
-                player1 = list(match.players.keys())[0]
-                player2 = list(match.players.keys())[1]
-                player1_name = f"{player1.firstname} {player1.lastname}"
-                player2_name = f"{player2.firstname} {player2.lastname}"
-                score1 = match.players[player1]
-                score2 = match.players[player2]
-                print(f"Match: {player1_name} vs {player2_name}, Scores: {score1}-{score2}")
+                score1, score2 = match.points
+                print(f"Match: {match.player1.fullname()} vs {match.player2.fullname()}, Scores: {score1}-{score2}")
                 # print(f"Start Time: {current_round.start_time}, End Time: {current_round.end_time}")
 
-            # Récupérer les scores précédents à partir des données du tournoi
-            previous_scores = self.players_score if hasattr(self, 'players_score') else {}
-
-            # Calculer et afficher le classement provisoire
-            calculate_leaderboard(tournament, previous_scores)
-
-            if current_round.end_time is None:
-                current_round.end_time = datetime.now().strftime("%d-%m-%Y %H:%M")
+            self.close_round(tournament)
+            # Enregistrer le tournoi à la fin de chaque round : le point de reprise du round est effacé
+            self.save_tournament(tournament)
 
             # Demander si vous voulez jouer le prochain round
-
-            if tournament.current_round == (len(tournament.rounds) - 1):
-                tournament.current_round += 1
-                tournament_repository = TournamentRepository()
-                tournament_repository.add_tournament(tournament)
-                break
-
-            if not ask_to_play_next_round():
-                tournament.current_round += 1
-                tournament_repository = TournamentRepository()
-                tournament_repository.add_tournament(tournament)
+            if tournament.current_round == len(tournament.rounds) or not ask_to_play_next_round():
                 break
 
-            tournament.current_round += 1
+    def get_seed_ratings(self, tournament):
+        """Retourne l'Elo des joueurs du tournoi pour l'appariement du premier round, ou None.
+
+        Returns:
+            dict: L'Elo des joueurs classés par identifiant national, None après le premier round
+                  ou sans classement Elo.
+        """
+        if self.rating_repository is None or tournament.current_round != 0:
+            return None
+        ratings = self.rating_repository.get_ratings()
+        return {player.national_chess_id: ratings[player.national_chess_id]
+                for player in tournament.players_list if player.national_chess_id in ratings}
+
+    def close_round(self, tournament, standings=None):
+        """Affiche le classement, termine le round en cours et passe au suivant.
+
+        Args:
+            tournament (Tournament): Le tournoi.
+            standings (List[tuple], optional): Le classement déjà calculé, en tuples (joueur, score, buchholz,
+                                               sonneborn_berger, cumulatif). Par défaut, il est lu dans le
+                                               registre des scores du tournoi.
+        """
+        current_round = tournament.rounds[tournament.current_round]
+
+        # Récupérer les scores précédents à partir des données du tournoi
+        previous_scores = self.players_score if hasattr(self, 'players_score') else {}
+
+        # Calculer et afficher le classement provisoire
+        calculate_leaderboard(tournament, previous_scores, standings)
+
+        if current_round.end_time is None:
+            current_round.end_time = datetime.now().strftime("%d-%m-%Y %H:%M")
+        tournament.current_round += 1
+
+    def enter_round_results(self, tournament):
+        """Saisit les résultats du round en cours, match par match ou depuis un fichier CSV/JSON."""
+        if not tournament.get_pending_matches():
+            return
+
+        matches = tournament.rounds[tournament.current_round].matches
+        if ask_result_entry_mode() == "2":
+            while True:
+                file_path = get_result_file_path()
+                if not file_path:
+                    break
+                try:
+                    with open(file_path, 'r') as file:
+                        self.import_round_results(tournament, file)
+                    self.checkpoint_results(tournament, [(board, match.result) for board, match in
+                                                         enumerate(matches, 1) if match.result is not None])
+                    return
+                except OSError as error:
+                    print(f"Impossible de lire le fichier : {error}")
+                except ResultImportError as error:
+                    display_import_errors(error.errors)
+
+        # Chaque résultat saisi est enregistré aussitôt dans le point de reprise
+        for board, match in enumerate(matches, 1):
+            if match.result is None:
+                self.checkpoint_results(tournament, [(board, tournament.play_match(match))])
+
+    def import_round_results(self, tournament, stream, file_format=None):
+        """Importe les résultats du round en cours depuis un flux CSV ou JSON.
+
+        Les résultats sont tous vérifiés avant d'être appliqués : si une ligne est erronée, aucun n'est appliqué.
+
+        Args:
+            tournament (Tournament): Le tournoi.
+            stream: Le flux texte contenant les résultats (fichier ou entrée standard).
+            file_format (str, optional): 'csv' ou 'json'. Par défaut, le format est détecté.
+
+        Returns:
+            int: Le nombre de résultats appliqués.
+
+        Raises:
+            ResultImportError: Si le fichier est invalide ou ne correspond pas aux appariements.
+        """
+        entries = read_results(stream, file_format)
+        results = validate_results(tournament.rounds[tournament.current_round].matches, entries)
+        for match, result in results:
+            tournament.record_result(match, result)
+        return len(results)
+
+    def _load_tournament_in_progress(self, tournament_name):
+        tournament_data = self.tournament_repository.get_tournament(tournament_name)
+        if tournament_data is None:
+            print("Le tournoi spécifié n'existe pas ou n'a pas été trouvé.")
+            return None
+        tournament = Tournament.from_json(tournament_data)
+        if tournament.current_round >= len(tournament.rounds):
+            print("Ce tournoi est terminé.")
+            return None
+        return tournament
+
+    def generate_round_pairings(self, tournament_name):
+        """Génère et enregistre les appariements du round en cours, puis affiche le modèle de fichier de résultats.
+
+        Returns:
+            bool: True si les appariements sont disponibles.
+        """
+        tournament = self._load_tournament_in_progress(tournament_name)
+        if tournament is None:
+            return False
+
+        current_round = tournament.rounds[tournament.current_round]
+        if not current_round.matches:
+            if current_round.start_time is None:
+                current_round.start_time = datetime.now().strftime("%d-%m-%Y %H:%M")
+            try:
+                tournament.generate_pairs_for_round(self.get_seed_ratings(tournament))
+            except PairingError as error:
+                print(error)
+                return False
+            self.tournament_repository.add_tournament(tournament)
+
+        display_result_template(current_round.matches)
+        return True
+
+    def import_results_from_file(self, tournament_name, stream, file_format=None):
+        """Applique un fichier de résultats au round en cours et enregistre le tournoi une seule fois.
+
+        Returns:
+            bool: True si les résultats ont été appliqués.
+        """
+        tournament = self._load_tournament_in_progress(tournament_name)
+        if tournament is None:
+            return False
+        if not tournament.rounds[tournament.current_round].matches:
+            print("Les appariements de ce round n'ont pas encore été générés.")
+            return False
+
+        try:
+            count = self.import_round_results(tournament, stream, file_format)
+        except ResultImportError as error:
+            display_import_errors(error.errors)
+            return False
+
+        print(f"{count} résultats enregistrés.")
+        if not tournament.get_pending_matches():
+            self.close_round(tournament)
+        self.save_tournament(tournament)
+        return True
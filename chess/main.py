@@ -1,10 +1,94 @@
-from controller.main_controller import MainController
+import argparse
+import sys
+import time
 
+from repository.file_storage import ConflictError
+from service import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_URL
 
-def main():
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Gestion des tournois d'échecs du club.")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Afficher les temps jusqu'au premier menu et à la première liste des tournois")
+    subparsers = parser.add_subparsers(dest="command")
+
+    pairings_parser = subparsers.add_parser(
+        "pairings", help="Générer les appariements du round en cours et afficher le modèle de fichier de résultats")
+    pairings_parser.add_argument("tournament", help="Nom du tournoi")
+
+    results_parser = subparsers.add_parser(
+        "import-results", help="Importer les résultats du round en cours depuis un fichier CSV ou JSON")
+    results_parser.add_argument("tournament", help="Nom du tournoi")
+    results_parser.add_argument("file", help="Fichier de résultats, ou '-' pour l'entrée standard")
+    results_parser.add_argument("--format", choices=["csv", "json"], help="Format du fichier (détecté par défaut)")
+
+    export_parser = subparsers.add_parser(
+        "export", help="Exporter les appariements, le classement ou le rapport complet en CSV ou en HTML")
+    export_parser.add_argument("report", choices=["pairings", "standings", "crosstable", "report"],
+                               help="Appariements d'un round, classement, grille américaine, ou rapport complet")
+    export_parser.add_argument("tournament", nargs="?",
+                               help="Nom du tournoi (sans nom, le rapport complet porte sur tous les tournois)")
+    export_parser.add_argument("--format", choices=["csv", "html"],
+                               help="Format du rapport (par défaut, d'après l'extension du fichier, sinon csv)")
+    export_parser.add_argument("--round", type=int, help="Numéro du round des appariements (par défaut, le dernier "
+                                                         "round apparié)")
+    export_parser.add_argument("--output", default="-", help="Fichier à écrire ('-' pour la sortie standard)")
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Lancer le service local auquel se connectent les terminaux d'arbitres")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST,
+                              help="Adresse d'écoute (0.0.0.0 pour le réseau local)")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port d'écoute")
+
+    arbiter_parser = subparsers.add_parser(
+        "arbiter", help="Saisir les résultats du round en cours depuis un terminal d'arbitre")
+    arbiter_parser.add_argument("tournament", help="Nom du tournoi")
+    arbiter_parser.add_argument("--url", default=DEFAULT_URL, help="Adresse du service des arbitres")
+
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    started_at = time.perf_counter()
+    args = parse_arguments(sys.argv[1:] if arguments is None else arguments)
+    if args.command == "arbiter":
+        # Le terminal d'arbitre passe par le service : il n'ouvre pas le stockage lui-même
+        from service.arbiter_client import ArbiterClient, run_arbiter_terminal
+        run_arbiter_terminal(ArbiterClient(args.url), args.tournament)
+        return 0
+
+    # Imports différés : chaque commande ne charge que ce qu'elle utilise, et l'import des contrôleurs est
+    # compté dans le profil de démarrage
+    from controller.main_controller import MainController
+    from controller.session import StartupProfile
     main_controller = MainController()
-    main_controller.run()
+
+    if args.command == "serve":
+        from service.arbiter_server import serve
+        serve(main_controller.create_arbiter_service(), args.host, args.port)
+        return 0
+
+    try:
+        if args.command == "pairings":
+            return 0 if main_controller.generate_round_pairings(args.tournament) else 1
+        if args.command == "import-results":
+            if args.file == "-":
+                success = main_controller.import_round_results(args.tournament, sys.stdin, args.format)
+            else:
+                with open(args.file, 'r') as file:
+                    success = main_controller.import_round_results(args.tournament, file, args.format)
+            return 0 if success else 1
+        if args.command == "export":
+            file_format = args.format or ("html" if args.output.lower().endswith((".html", ".htm")) else "csv")
+            return 0 if main_controller.export_report(args.report, args.tournament, file_format, args.output,
+                                                      args.round) else 1
+    except ConflictError as error:
+        print(error)
+        return 1
+
+    main_controller.run(StartupProfile(started_at) if args.profile_startup else None)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
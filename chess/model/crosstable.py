@@ -0,0 +1,212 @@
+"""
+This module contains the definition of the Crosstable class, the grid of the games of a tournament: for each
+player and each round, the opponent and the points scored.
+
+The grid is built in a single pass over the matches of the rounds and kept in a players × rounds NumPy array
+of (opponent index, points) cells. The scores, the tiebreaks and the standings are then computed on the whole
+array at once, instead of scanning the matches and their dictionaries of players again for each of them.
+
+Classes:
+    Crosstable: The players × rounds grid of the games of a tournament.
+
+Functions:
+    format_cell: The notation of a cell of the grid ("5+", "3=", "2-").
+
+Usage:
+    crosstable = tournament.crosstable
+    crosstable.detailed_standings()
+    for rank, player, cells, score in crosstable.rows():
+        ...
+"""
+
+# NumPy est importé dans les méthodes qui l'utilisent, comme dans model/rating.py
+
+NO_OPPONENT = -1
+# Cellule de la grille : index de l'adversaire (NO_OPPONENT sans adversaire) et points marqués (NaN sans résultat)
+CELL_DTYPE = [("opponent", "i4"), ("points", "f4")]
+RESULT_SYMBOLS = {1: "+", 0.5: "=", 0: "-"}
+
+
+def format_cell(opponent_rank, points):
+    """Return the notation of a cell: the rank of the opponent followed by +, = or - ("5+"), or by "?" when
+    the game has no result yet. The cell of a round without game is empty."""
+    if points is None:
+        return "" if opponent_rank is None else f"{opponent_rank}?"
+    symbol = RESULT_SYMBOLS.get(points, f"({points:g})")
+    return symbol if opponent_rank is None else f"{opponent_rank}{symbol}"
+
+
+class Crosstable:
+    """The players × rounds grid of the games of a tournament.
+
+    The players are indexed in seed order (their order in the tournament). Each cell holds the index of the
+    opponent of the player in the round and the points the player scored: a paired game without result has its
+    opponent and no points, an incomplete match (opponent not found in the tournament) has points and no
+    opponent.
+
+    The grid is not updated: the tournament builds a new one after a result is recorded (see
+    Tournament.crosstable).
+
+    Attributes:
+        players (list): The players of the tournament, in seed order.
+        cells (numpy.ndarray): The players × rounds array of CELL_DTYPE cells.
+    """
+
+    def __init__(self, players, cells):
+        self.players = players
+        self.cells = cells
+        self._tiebreaks = None
+        self._order = None
+
+    @classmethod
+    def from_rounds(cls, players, rounds):
+        """Build the grid of a tournament in a single pass over the matches of its rounds.
+
+        Args:
+            players (list): The players of the tournament, in seed order.
+            rounds (list): The rounds of the tournament, in the order they were played.
+
+        Returns:
+            Crosstable: The grid of the games.
+        """
+        import numpy as np
+
+        players = list(players)
+        indexes = {player: index for index, player in enumerate(players)}
+        player_indexes, round_indexes, opponents, points = [], [], [], []
+        for round_index, round in enumerate(rounds):
+            for match in round.matches:
+                seats = [(indexes.get(player), score) for player, score in match.seats()]
+                if any(index is None for index, _ in seats):
+                    continue
+                played = match.result is not None
+                if len(seats) == 2:
+                    (index1, score1), (index2, score2) = seats
+                    player_indexes += (index1, index2)
+                    opponents += (index2, index1)
+                    points += (score1, score2) if played else (np.nan, np.nan)
+                    round_indexes += (round_index, round_index)
+                elif played:
+                    # Match incomplet (joueur introuvable) : seuls les points du joueur présent sont comptés
+                    for index, score in seats:
+                        player_indexes.append(index)
+                        opponents.append(NO_OPPONENT)
+                        points.append(score)
+                        round_indexes.append(round_index)
+
+        cells = np.empty((len(players), len(rounds)), dtype=CELL_DTYPE)
+        cells["opponent"] = NO_OPPONENT
+        cells["points"] = np.nan
+        cells["opponent"][player_indexes, round_indexes] = opponents
+        cells["points"][player_indexes, round_indexes] = points
+        return cls(players, cells)
+
+    def __len__(self):
+        return len(self.players)
+
+    def _compute_tiebreaks(self):
+        """Compute the scores and the tiebreaks of all the players at once.
+
+        The tiebreaks are those of the ScoreLedger: Buchholz (sum of the scores of the opponents),
+        Sonneborn-Berger (same sum, weighted by the points scored against each opponent) and progressive
+        score (sum of the scores after each game).
+
+        Returns:
+            tuple: (scores, buchholz, sonneborn_berger, progressive) arrays, by player index.
+        """
+        import numpy as np
+
+        opponents = self.cells["opponent"]
+        points = self.cells["points"].astype(np.float64)
+        has_result = ~np.isnan(points)
+        scored = np.where(has_result, points, 0.0)
+        scores = scored.sum(axis=1)
+        # Parties jouées contre un adversaire du tournoi : les seules qui comptent pour les départages
+        games = has_result & (opponents != NO_OPPONENT)
+        opponent_scores = np.where(games, scores[opponents], 0.0) if len(scores) else scored
+        buchholz = opponent_scores.sum(axis=1)
+        sonneborn_berger = (scored * opponent_scores).sum(axis=1)
+        progressive = np.where(games, np.cumsum(scored, axis=1), 0.0).sum(axis=1)
+        return scores, buchholz, sonneborn_berger, progressive
+
+    def get_tiebreaks(self):
+        """Return the scores and the tiebreaks of the players.
+
+        Returns:
+            tuple: (scores, buchholz, sonneborn_berger, progressive) lists, by player index (seed order).
+        """
+        if self._tiebreaks is None:
+            self._tiebreaks = tuple(values.tolist() for values in self._compute_tiebreaks())
+        return self._tiebreaks
+
+    def get_order(self):
+        """Return the player indexes from the best ranked to the lowest ranked.
+
+        Players with the same score are ranked by Buchholz, Sonneborn-Berger, progressive score, then seed.
+        """
+        if self._order is None:
+            import numpy as np
+
+            scores, buchholz, sonneborn_berger, progressive = (np.array(values) for values in self.get_tiebreaks())
+            # lexsort trie sur la dernière clé d'abord
+            self._order = np.lexsort((np.arange(len(self.players)), -progressive, -sonneborn_berger, -buchholz,
+                                      -scores)).tolist()
+        return self._order
+
+    def get_games(self):
+        """Return the games with a result of each player, in the order played.
+
+        Returns:
+            List[list]: By player index, the (opponent_index, points, opponent_points) tuples of the player.
+                        The opponent index is NO_OPPONENT (and the opponent points None) for an incomplete
+                        match.
+        """
+        import numpy as np
+
+        opponents = self.cells["opponent"]
+        points = self.cells["points"]
+        # Points de l'adversaire de chaque case, lus en une seule indexation du tableau
+        opponent_points = points[opponents, np.arange(points.shape[1])] if len(self.players) else points
+        games = []
+        for player_opponents, player_points, player_opponent_points in zip(
+                opponents.tolist(), points.tolist(), opponent_points.tolist()):
+            # NaN (différent de lui-même) : pas de résultat
+            games.append([(opponent, score, None if opponent == NO_OPPONENT else opponent_score)
+                          for opponent, score, opponent_score in zip(player_opponents, player_points,
+                                                                     player_opponent_points)
+                          if score == score])
+        return games
+
+    def detailed_standings(self):
+        """Return the standings of the tournament with the tiebreaks.
+
+        Returns:
+            List[tuple]: (player, score, buchholz, sonneborn_berger, progressive) tuples, from the best ranked
+                         to the lowest ranked.
+        """
+        scores, buchholz, sonneborn_berger, progressive = self.get_tiebreaks()
+        return [(self.players[index], scores[index], buchholz[index], sonneborn_berger[index], progressive[index])
+                for index in self.get_order()]
+
+    def rows(self):
+        """Yield the rows of the grid, from the best ranked player to the lowest ranked.
+
+        The opponents are designated by their rank, as in a printed crosstable.
+
+        Yields:
+            tuple: (rank, player, cells, score), the cells being (opponent_rank, points) tuples for each round,
+                   with None for a missing opponent or result.
+        """
+        order = self.get_order()
+        ranks = [0] * len(order)
+        for rank, index in enumerate(order, 1):
+            ranks[index] = rank
+        scores = self.get_tiebreaks()[0]
+        for rank, index in enumerate(order, 1):
+            cells = [(None if opponent == NO_OPPONENT else ranks[opponent], None if points != points else points)
+                     for opponent, points in self.cells[index].tolist()]
+            yield rank, self.players[index], cells, scores[index]
+
+
+if __name__ == "__main__":
+    pass
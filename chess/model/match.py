@@ -12,21 +12,67 @@ Usage:
 """
 
 
-class Match:
-    """A class representing a match in a chess tournament."""
+# Code du résultat d'un match, du point de vue du premier joueur : un petit entier par match au lieu d'une chaîne
+RESULTS = (None, "win", "loss", "draw")
+RESULT_CODES = {result: code for code, result in enumerate(RESULTS)}
+# Points des deux joueurs, par code de résultat (0 à 0 tant que le match n'a pas de résultat)
+RESULT_POINTS = ((0, 0), (1, 0), (0, 1), (0.5, 0.5))
 
-    def __init__(self, players):
 
-        self.players = players
-        self.result = None
+class Match:
+    """A match between two players of a tournament.
+
+    The match only keeps its two players and the code of its result: the points of the players are derived
+    from the result. A player is None in an incomplete match (player not found in the tournament when the
+    data was loaded).
+    """
+
+    __slots__ = ("player1", "player2", "result_code")
+
+    def __init__(self, player1, player2, result=None):
+        self.player1 = player1
+        self.player2 = player2
+        self.result_code = RESULT_CODES[result]
+
+    @property
+    def result(self):
+        """The result for the first player: 'win', 'loss', 'draw', or None if the match has not been played."""
+        return RESULTS[self.result_code]
+
+    @result.setter
+    def result(self, result):
+        self.result_code = RESULT_CODES[result]
+
+    @property
+    def points(self):
+        """The points of the two players: (points1, points2)."""
+        return RESULT_POINTS[self.result_code]
+
+    def is_complete(self):
+        """Return True if both players of the match were found."""
+        return self.player1 is not None and self.player2 is not None
+
+    def seats(self):
+        """Return the (player, points) tuples of the players of the match, without the missing player of an
+        incomplete match."""
+        return [(player, points) for player, points in zip((self.player1, self.player2), self.points)
+                if player is not None]
+
+    def get_points(self, player):
+        """Return the points of a player in this match (0 for a player who did not play it)."""
+        points1, points2 = self.points
+        if player == self.player1:
+            return points1
+        return points2 if player == self.player2 else 0
 
     def to_json(self):
-        # Convertir les clés en chaînes de caractères pour les noms des joueurs
-        players_json = {f"{player.firstname} {player.lastname}": score for player, score in self.players.items()}
-
-        # Créer un dictionnaire contenant les données du match
+        # Les joueurs sont enregistrés par leur nom complet, avec leurs points, et par leur identifiant
+        # national, qui les distingue de leurs homonymes (None pour le joueur manquant d'un match incomplet)
         match_json = {
-            "players": players_json
+            "players": {f"{player.firstname} {player.lastname}": points for player, points in self.seats()},
+            "player_ids": [None if player is None else player.national_chess_id
+                           for player in (self.player1, self.player2)],
+            "result": self.result
         }
 
         return match_json
@@ -36,41 +82,50 @@ class Match:
         # Récupérer les données des joueurs depuis le JSON
         players_data = match_data["players"]
 
-        # Créer un dictionnaire pour stocker les objets Player et leurs scores
-        players = {}
-        for player_name, score in players_data.items():
-            split_index = player_name.find(" ")
-            if split_index != -1:
-                player_firstname = player_name[:split_index]
-                player_lastname = player_name[split_index + 1:]
-            else:
-                # S'il n'y a pas d'espace, le nom complet est le prénom
-                player_firstname = player_name
-                player_lastname = ""
-            player = find_player(tournament, player_firstname, player_lastname)
-            # player = find_player(tournament, player_name)
-            if player:
-                players[player] = score
-            else:
-                print(f"Joueur introuvable dans la liste des joueurs du tournoi : {player_name}")
-
-        # Créer l'objet Match avec les joueurs (objets Player) et leurs scores
-        match = cls(players)
-        return match
+        # Retrouver les objets Player du tournoi, à leur place dans le match : par identifiant national, ou par
+        # nom complet dans les fichiers enregistrés avant les identifiants
+        players = []
+        if "player_ids" in match_data:
+            for national_chess_id in match_data["player_ids"]:
+                player = None
+                if national_chess_id is not None:
+                    player = tournament.get_player_by_national_chess_id(national_chess_id)
+                    if player is None:
+                        print(f"Joueur introuvable dans la liste des joueurs du tournoi : {national_chess_id}")
+                players.append(player)
+        else:
+            for player_name in players_data:
+                player = tournament.get_player_by_fullname(player_name)
+                if player is None:
+                    print(f"Joueur introuvable dans la liste des joueurs du tournoi : {player_name}")
+                players.append(player)
+        player1, player2 = (players + [None, None])[:2]
+
+        if "result" in match_data:
+            result = match_data["result"]
+        else:
+            # Les anciens fichiers n'enregistrent que les scores
+            result = result_from_scores(list(players_data.values()))
+        return cls(player1, player2, result)
 
     def __str__(self):
-        player1_name = f"{list(self.players.keys())[0].firstname} {list(self.players.keys())[0].lastname}"
-        player2_name = f"{list(self.players.keys())[1].firstname} {list(self.players.keys())[1].lastname}"
-        return (f"\nMatch: {player1_name} vs {player2_name}, Scores: {self.players[list(self.players.keys())[0]]}-"
-                f"{self.players[list(self.players.keys())[1]]}")
+        points1, points2 = self.points
+        # Joueur introuvable dans le tournoi : sa place est affichée sans nom, comme seats() l'ignore
+        name1, name2 = (player.fullname() if player is not None else "?" for player in (self.player1, self.player2))
+        return f"\nMatch: {name1} vs {name2}, Scores: {points1}-{points2}"
 
-    def play_match(self):
-        # Afficher les détails du match
-        player1 = list(self.players.keys())[0]
-        player2 = list(self.players.keys())[1]
+    def play_match(self, ledger=None):
+        """Ask the result of the match to the user and record it.
+
+        Args:
+            ledger (ScoreLedger, optional): The score ledger of the tournament, updated with the result.
+
+        Returns:
+            str: The result for the first player ('win', 'loss' or 'draw').
+        """
         # Afficher les détails du match
-        player1_name = f"{list(self.players.keys())[0].firstname} {list(self.players.keys())[0].lastname}"
-        player2_name = f"{list(self.players.keys())[1].firstname} {list(self.players.keys())[1].lastname}"
+        player1_name = self.player1.fullname()
+        player2_name = self.player2.fullname()
         print(f"Match: {player1_name} contre {player2_name}")
 
         # Demander à l'utilisateur de saisir le résultat
@@ -82,44 +137,45 @@ class Match:
             else:
                 print("Veuillez entrer 'win', 'loss' ou 'draw'.")
 
-        # Assigner le résultat du match à la variable d'instance self.result
-        self.result = result
+        return self.set_result(result, ledger)
 
-        # Mettre à jour les scores des joueurs en fonction du résultat
-        if result == "win":
-            winning_player = player1
-        elif result == "loss":
-            winning_player = player2
-        else:
-            winning_player = None
+    def set_result(self, result, ledger=None):
+        """Record the result of the match, or correct the result already recorded.
 
-        if winning_player:
-            self.players[winning_player] += 1
-        else:
-            for player in self.players:
-                self.players[player] += 0.5
+        Args:
+            result (str): The result for the first player ('win', 'loss' or 'draw').
+            ledger (ScoreLedger, optional): The score ledger of the tournament, updated with the result.
+
+        Returns:
+            str: The recorded result.
+        """
+        # Un résultat déjà enregistré est corrigé : le registre remplace les anciens points des joueurs
+        previous_points = self.points if self.result is not None else None
+        # Les points des joueurs découlent du code du résultat
+        self.result = result
+
+        if ledger is not None:
+            if previous_points is None:
+                ledger.record_match(self)
+            else:
+                ledger.correct_match(self, previous_points)
 
         return result
 
 
-# def find_player(tournament, player_firstname, player_lastname):
-#     for p in tournament.players_list:
-#         print(f" p : {p}")
-#         if p.firstname == player_firstname:
-#             print(f"p.firstame : {p.firstname}")
-#             print(f"player_firstname : {player_firstname} ")
-#             if player_lastname and p.lastname != player_lastname:
-#                 print(f"p.lastname : {p.lastname}")
-#                 print(f"player_lastname: {player_lastname}")
-#                 continue
-#             return p
-#     return None
-
-def find_player(tournament, player_firstname, player_lastname):
-    for p in tournament.players_list:
-        if p.firstname == player_firstname and p.lastname == player_lastname:
-            return p
-    return None
+def result_from_scores(scores):
+    """Return the result for the first player ('win', 'loss' or 'draw') from the scores of a match.
+
+    Returns:
+        str: The result, or None if the match has not been played (both scores are 0).
+    """
+    if len(scores) != 2 or scores[0] == scores[1] == 0:
+        return None
+    if scores[0] > scores[1]:
+        return "win"
+    if scores[0] < scores[1]:
+        return "loss"
+    return "draw"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,239 @@
+"""
+This module contains the Swiss pairing engine used to pair the players of a round.
+
+The engine is a pure function working on player identifiers: it takes the standings and the pairs
+already played and returns the pairings of the round, without any user interaction.
+
+Players are paired by score groups, following the Dutch system: inside a score group, the top half
+plays the bottom half, and a player who cannot be paired in their group floats down to the next one.
+A depth-first search with backtracking explores the alternatives. If the search exceeds its budget,
+the best partial pairing is completed with Edmonds' maximum matching algorithm, so a legal pairing
+is always found when one exists.
+
+Functions:
+    pair_players: Compute the pairings of a round.
+
+Usage:
+    pairings = pair_players(["A", "B", "C", "D"], {("A", "B"), ("C", "D")}, {"A": 1, "B": 1, "C": 0, "D": 0})
+"""
+
+import itertools
+
+
+class PairingError(Exception):
+    """Raised when the players of a round cannot be paired."""
+
+
+def pair_players(standings, played_pairs, scores=None, search_budget=None):
+    """Compute the pairings of a round.
+
+    Args:
+        standings (list): Player identifiers, ordered from the best ranked to the lowest ranked.
+        played_pairs: Container of the pairs already played, supporting `(player1, player2) in played_pairs`.
+                      Pairs are checked in both orders.
+        scores (dict, optional): Score of each player, used to build the score groups. By default, all
+                                 players are in the same group.
+        search_budget (int, optional): Maximum number of steps of the backtracking search before falling back
+                                       to the matching algorithm. Defaults to 20 times the number of players.
+
+    Returns:
+        List[tuple]: The pairs of player identifiers, ordered by board.
+
+    Raises:
+        PairingError: If the number of players is odd or if no legal pairing exists.
+    """
+    count = len(standings)
+    if count % 2:
+        raise PairingError("Le nombre de joueurs doit être pair pour générer les paires.")
+    if count == 0:
+        return []
+    if scores is None:
+        scores = {}
+    if search_budget is None:
+        search_budget = 20 * count
+
+    def can_play(position1, position2):
+        player1 = standings[position1]
+        player2 = standings[position2]
+        return (player1, player2) not in played_pairs and (player2, player1) not in played_pairs
+
+    # Position de fin du groupe de score de chaque joueur
+    group_ends = [0] * count
+    group_end = count
+    for position in range(count - 1, -1, -1):
+        if position < count - 1 and scores.get(standings[position], 0) != scores.get(standings[position + 1], 0):
+            group_end = position + 1
+        group_ends[position] = group_end
+
+    opponents, complete = _search_pairing(count, group_ends, can_play, search_budget)
+    if not complete:
+        opponents = _complete_matching(count, opponents, can_play)
+
+    pairings = []
+    for position in range(count):
+        opponent = opponents[position]
+        if opponent > position:
+            pairings.append((standings[position], standings[opponent]))
+    return pairings
+
+
+def _candidates(position, paired, group_ends, can_play):
+    """Yield the possible opponents of a player, from the preferred to the least preferred.
+
+    The preferred opponent is the first player of the bottom half of the player's score group, then the rest
+    of the bottom half, the top half in reverse order and finally the players of the lower groups.
+    """
+    count = len(paired)
+    group_end = group_ends[position]
+    group = [other for other in range(position + 1, group_end) if not paired[other]]
+    half = (len(group) - 1) // 2
+    for other in itertools.chain(group[half:], reversed(group[:half]), range(group_end, count)):
+        if not paired[other] and can_play(position, other):
+            yield other
+
+
+def _search_pairing(count, group_ends, can_play, search_budget):
+    """Pair the players with a depth-first search and backtracking.
+
+    Returns:
+        tuple: The opponent of each position (-1 if unpaired) and whether the pairing is complete.
+               When the budget is exhausted, the deepest partial pairing found is returned.
+    """
+    paired = [False] * count
+    opponents = [-1] * count
+    best_opponents = list(opponents)
+    best_depth = 0
+    stack = []
+    steps = 0
+
+    def first_unpaired(start):
+        while start < count and paired[start]:
+            start += 1
+        return start
+
+    # Chaque niveau de la pile contient un joueur, ses adversaires restant à essayer et l'adversaire en cours
+    position = first_unpaired(0)
+    paired[position] = True
+    stack.append((position, _candidates(position, paired, group_ends, can_play), -1))
+
+    while stack:
+        steps += 1
+        if steps > search_budget:
+            return best_opponents, False
+
+        position, candidates, previous = stack.pop()
+        if previous != -1:
+            # Annuler l'appariement essayé précédemment pour ce joueur
+            paired[previous] = False
+            opponents[position] = opponents[previous] = -1
+
+        opponent = next(candidates, -1)
+        if opponent == -1:
+            paired[position] = False
+            continue
+
+        paired[opponent] = True
+        opponents[position] = opponent
+        opponents[opponent] = position
+        stack.append((position, candidates, opponent))
+
+        if len(stack) > best_depth:
+            best_depth = len(stack)
+            best_opponents = list(opponents)
+
+        next_position = first_unpaired(position + 1)
+        if next_position == count:
+            return opponents, True
+        paired[next_position] = True
+        stack.append((next_position, _candidates(next_position, paired, group_ends, can_play), -1))
+
+    raise PairingError("Aucun appariement possible : tous les adversaires restants ont déjà été rencontrés.")
+
+
+def _complete_matching(count, opponents, can_play):
+    """Complete a partial pairing into a perfect matching with Edmonds' blossom algorithm.
+
+    Raises:
+        PairingError: If no perfect matching exists.
+    """
+    adjacency = [[other for other in range(count) if other != position and can_play(position, other)]
+                 for position in range(count)]
+    match = list(opponents)
+
+    for root in range(count):
+        if match[root] == -1 and not _augment(root, adjacency, match):
+            raise PairingError("Aucun appariement possible : tous les adversaires restants ont déjà été rencontrés.")
+    return match
+
+
+def _augment(root, adjacency, match):
+    """Search an augmenting path from a free vertex and apply it to the matching.
+
+    Returns:
+        bool: True if the matching was augmented.
+    """
+    count = len(adjacency)
+    used = [False] * count
+    parent = [-1] * count
+    base = list(range(count))
+
+    def lowest_common_ancestor(vertex1, vertex2):
+        visited = [False] * count
+        while True:
+            vertex1 = base[vertex1]
+            visited[vertex1] = True
+            if match[vertex1] == -1:
+                break
+            vertex1 = parent[match[vertex1]]
+        while True:
+            vertex2 = base[vertex2]
+            if visited[vertex2]:
+                return vertex2
+            vertex2 = parent[match[vertex2]]
+
+    def mark_path(vertex, blossom_base, child, blossom):
+        while base[vertex] != blossom_base:
+            blossom[base[vertex]] = blossom[base[match[vertex]]] = True
+            parent[vertex] = child
+            child = match[vertex]
+            vertex = parent[match[vertex]]
+
+    used[root] = True
+    queue = [root]
+    head = 0
+    while head < len(queue):
+        vertex = queue[head]
+        head += 1
+        for other in adjacency[vertex]:
+            if base[vertex] == base[other] or match[vertex] == other:
+                continue
+            if other == root or (match[other] != -1 and parent[match[other]] != -1):
+                # Contracter le cycle impair (blossom) trouvé
+                blossom_base = lowest_common_ancestor(vertex, other)
+                blossom = [False] * count
+                mark_path(vertex, blossom_base, other, blossom)
+                mark_path(other, blossom_base, vertex, blossom)
+                for position in range(count):
+                    if blossom[base[position]]:
+                        base[position] = blossom_base
+                        if not used[position]:
+                            used[position] = True
+                            queue.append(position)
+            elif parent[other] == -1:
+                parent[other] = vertex
+                if match[other] == -1:
+                    # Inverser le chemin augmentant
+                    while other != -1:
+                        previous = parent[other]
+                        next_other = match[previous]
+                        match[other] = previous
+                        match[previous] = other
+                        other = next_other
+                    return True
+                used[match[other]] = True
+                queue.append(match[other])
+    return False
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,112 @@
+"""
+This module contains the definition of the PlayedPairs class, which records the pairs of players
+who already met in a tournament.
+
+Classes:
+    PlayedPairs: A compact, symmetric record of the pairs already played.
+
+Usage:
+    played_pairs = PlayedPairs()
+    played_pairs.add("AB12345", "CD67890")
+    played_pairs.has_played("CD67890", "AB12345")
+    ("AB12345", "CD67890") in played_pairs
+"""
+
+
+class PlayedPairs:
+    """Symmetric record of the pairs of players who already met, keyed by national chess ID.
+
+    Each player gets a dense index, and each index owns a bitset (a bytearray) of the indexes of the
+    player's opponents, so membership tests are O(1) and a pair costs two bits.
+    """
+
+    def __init__(self):
+        self._indexes = {}
+        self._rows = []
+        self._count = 0
+
+    def _get_index(self, national_chess_id):
+        """Return the dense index of a player, assigning a new one the first time it is seen."""
+        index = self._indexes.get(national_chess_id)
+        if index is None:
+            index = len(self._rows)
+            self._indexes[national_chess_id] = index
+            self._rows.append(bytearray())
+        return index
+
+    def _set_bit(self, row_index, column_index):
+        row = self._rows[row_index]
+        byte_index = column_index >> 3
+        if byte_index >= len(row):
+            row.extend(bytes(byte_index + 1 - len(row)))
+        row[byte_index] |= 1 << (column_index & 7)
+
+    def _get_bit(self, row_index, column_index):
+        row = self._rows[row_index]
+        byte_index = column_index >> 3
+        return byte_index < len(row) and bool(row[byte_index] & (1 << (column_index & 7)))
+
+    def add(self, player1_id, player2_id):
+        """Record that two players met."""
+        index1 = self._get_index(player1_id)
+        index2 = self._get_index(player2_id)
+        if self._get_bit(index1, index2):
+            return
+        self._set_bit(index1, index2)
+        self._set_bit(index2, index1)
+        self._count += 1
+
+    def has_played(self, player1_id, player2_id):
+        """Return True if the two players already met."""
+        index1 = self._indexes.get(player1_id)
+        index2 = self._indexes.get(player2_id)
+        if index1 is None or index2 is None:
+            return False
+        return self._get_bit(index1, index2)
+
+    def __contains__(self, pair):
+        return self.has_played(*pair)
+
+    def __len__(self):
+        """Return the number of pairs played."""
+        return self._count
+
+    def __iter__(self):
+        """Yield each pair played once, as a (player1_id, player2_id) tuple."""
+        national_chess_ids = list(self._indexes)
+        for index1, row in enumerate(self._rows):
+            for byte_index, byte in enumerate(row):
+                while byte:
+                    bit = byte & -byte
+                    index2 = (byte_index << 3) + bit.bit_length() - 1
+                    if index2 > index1:
+                        yield national_chess_ids[index1], national_chess_ids[index2]
+                    byte ^= bit
+
+    def to_json(self):
+        """Convert the pairs to a JSON-compatible list of [player1_id, player2_id] lists."""
+        return [[player1_id, player2_id] for player1_id, player2_id in self]
+
+    @classmethod
+    def from_json(cls, json_data):
+        """Create a PlayedPairs from JSON data.
+
+        Args:
+            json_data (list): [player1_id, player2_id] lists, or the former format of
+                              {'player1': player_json, 'player2': player_json} dictionaries.
+
+        Returns:
+            PlayedPairs: The pairs played.
+        """
+        played_pairs = cls()
+        for pair_data in json_data:
+            if isinstance(pair_data, dict):
+                played_pairs.add(pair_data['player1']['national chess ID'],
+                                 pair_data['player2']['national chess ID'])
+            else:
+                played_pairs.add(*pair_data)
+        return played_pairs
+
+
+if __name__ == "__main__":
+    pass
@@ -7,19 +7,24 @@ for managing player data storage and retrieval.
 Classes:
     - Player: Represents a chess player with attributes including first name, last name, date of birth,
       and national chess ID.
+    - PlayerIdentityMap: Keeps a single Player instance per national chess ID while loading data.
     - PlayerRepository: Manages the storage and retrieval of player information.
 """
 
 
 class Player:
-    """Player"""
+    """Player
+
+    Two Player objects are equal, and have the same hash, when they have the same national chess ID.
+    """
+
+    __slots__ = ("firstname", "lastname", "birth", "national_chess_id")
 
     def __init__(self, firstname: str, lastname: str, birth: str, national_chess_id: str):
         self.firstname = firstname.title()
         self.lastname = lastname.title()
         self.birth = birth
         self.national_chess_id = national_chess_id
-        self.score = 0
 
     def __str__(self):
         return (f"Prénom : {self.firstname} "
@@ -27,19 +32,18 @@ class Player:
                 f"(Date de naissance: {self.birth}, "                
                 f"Identifiant national: {self.national_chess_id})")
 
+    def __eq__(self, other):
+        if not isinstance(other, Player):
+            return NotImplemented
+        return self.national_chess_id == other.national_chess_id
+
+    def __hash__(self):
+        return hash(self.national_chess_id)
+
     def fullname(self):
         """Retourne le nom complet du joueur."""
         return f"{self.firstname} {self.lastname}"
 
-    def calculate_total_score(self, rounds, previous_scores=None):
-        total_score = self.score
-
-        for round in rounds:
-            for match in round.matches:
-                if self in match.players:
-                    total_score += match.players[self]
-        return total_score
-
     def to_json(self):
         """Converts player data to a JSON-compatible dictionary.
 
@@ -73,3 +77,39 @@ class Player:
         player = cls(firstname, lastname, birth, national_chess_id)
 
         return player
+
+
+class PlayerIdentityMap:
+    """Identity map keeping a single Player instance per national chess ID.
+
+    Deserialization goes through the map, so every reference to a player (tournament players, played pairs,
+    matches) resolves to the same object.
+    """
+
+    def __init__(self):
+        self._players = {}
+
+    def __len__(self):
+        return len(self._players)
+
+    def get(self, national_chess_id):
+        """Return the player with this national chess ID, or None if it has not been loaded."""
+        return self._players.get(national_chess_id)
+
+    def add(self, player):
+        """Register a player, returning the instance already registered for the same national chess ID if any."""
+        return self._players.setdefault(player.national_chess_id, player)
+
+    def from_json(self, json_data):
+        """Return the Player of the JSON data, creating it only the first time its national chess ID is seen.
+
+        Args:
+            json_data (dict): Les données JSON représentant le joueur.
+
+        Returns:
+            Player: The unique Player instance for this national chess ID.
+        """
+        player = self._players.get(json_data['national chess ID'])
+        if player is None:
+            player = self.add(Player.from_json(json_data))
+        return player
@@ -0,0 +1,186 @@
+"""
+This module contains the Elo rating engine, which computes the ratings of the players from the results of
+the recorded matches.
+
+The matches are replayed round by round, in chronological order. All the games of a round are rated at once,
+from the ratings before the round, with NumPy arrays indexed by player.
+
+Classes:
+    RatingEngine: The ratings and game counts of the players.
+
+Functions:
+    expected_scores: Expected scores of players against their opponents, from their ratings.
+    parse_round_time: Parse the start time of a round, whichever format it was saved with.
+    completed_rounds: The rated games of the completed rounds of a tournament.
+
+Usage:
+    engine = RatingEngine()
+    for round_time, round_index, games in completed_rounds(tournament):
+        engine.apply_round(games)
+    engine.get_rating("AB12345")
+"""
+
+from datetime import datetime
+
+# NumPy est importé dans les méthodes qui l'utilisent : son import, long, n'est payé qu'au premier calcul
+# de classement et non au démarrage du programme
+
+DEFAULT_RATING = 1500.0
+# Coefficient K : plus élevé tant que le joueur a peu de parties classées
+PROVISIONAL_GAMES = 30
+PROVISIONAL_K = 40.0
+ESTABLISHED_K = 20.0
+
+ROUND_TIME_FORMATS = ("%d-%m-%Y %H:%M", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%d-%m-%Y %H:%M:%S")
+POINTS = {"win": 1.0, "draw": 0.5, "loss": 0.0}
+
+
+def expected_scores(ratings, opponent_ratings):
+    """Return the expected scores of players against their opponents.
+
+    Args:
+        ratings (np.ndarray): The ratings of the players.
+        opponent_ratings (np.ndarray): The ratings of their opponents.
+
+    Returns:
+        np.ndarray: The expected scores, between 0 and 1.
+    """
+    return 1.0 / (1.0 + 10.0 ** ((opponent_ratings - ratings) / 400.0))
+
+
+def parse_round_time(value):
+    """Parse the start time of a round ("31-12-2024 20:00" or "2024-12-31 20:00").
+
+    Returns:
+        datetime: The start time, or None if it is missing or cannot be parsed.
+    """
+    if not value:
+        return None
+    for time_format in ROUND_TIME_FORMATS:
+        try:
+            return datetime.strptime(value, time_format)
+        except ValueError:
+            continue
+    return None
+
+
+def completed_rounds(tournament):
+    """Yield the rated games of the completed rounds of a tournament.
+
+    A round is completed when it has matches and all of them have a result.
+
+    Args:
+        tournament (Tournament): The tournament.
+
+    Yields:
+        tuple: (round_time, round_index, games), games being (player1_id, player2_id, player1_points) tuples.
+               round_time is None if the start time of the round is unknown.
+    """
+    for round_index, round in enumerate(tournament.rounds):
+        matches = [match for match in round.matches if match.is_complete()]
+        if not matches or any(match.result is None for match in matches):
+            continue
+        games = []
+        for match in matches:
+            games.append((match.player1.national_chess_id, match.player2.national_chess_id, POINTS[match.result]))
+        yield parse_round_time(round.start_time), round_index, games
+
+
+class RatingEngine:
+    """Elo ratings of the players, stored in NumPy arrays indexed by player."""
+
+    def __init__(self):
+        import numpy as np
+
+        self._indexes = {}
+        self._national_chess_ids = []
+        self._ratings = np.empty(0)
+        self._games = np.empty(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self._national_chess_ids)
+
+    def _get_indexes(self, national_chess_ids):
+        """Return the indexes of players as an array, adding the new players with the default rating."""
+        import numpy as np
+
+        indexes = []
+        for national_chess_id in national_chess_ids:
+            index = self._indexes.get(national_chess_id)
+            if index is None:
+                index = len(self._national_chess_ids)
+                self._indexes[national_chess_id] = index
+                self._national_chess_ids.append(national_chess_id)
+            indexes.append(index)
+
+        missing = len(self._national_chess_ids) - len(self._ratings)
+        if missing > 0:
+            # Agrandir les tableaux par blocs pour ne pas les recopier à chaque nouveau joueur
+            capacity = max(missing, len(self._ratings))
+            self._ratings = np.concatenate((self._ratings, np.full(capacity, DEFAULT_RATING)))
+            self._games = np.concatenate((self._games, np.zeros(capacity, dtype=np.int64)))
+        return np.array(indexes, dtype=np.intp)
+
+    def apply_round(self, games):
+        """Rate the games of a round, all from the ratings before the round.
+
+        Args:
+            games (List[tuple]): (player1_id, player2_id, player1_points) tuples.
+        """
+        if not games:
+            return
+        import numpy as np
+
+        player1_ids, player2_ids, points = zip(*games)
+        indexes1 = self._get_indexes(player1_ids)
+        indexes2 = self._get_indexes(player2_ids)
+        points = np.array(points, dtype=float)
+
+        expected = expected_scores(self._ratings[indexes1], self._ratings[indexes2])
+        k1 = np.where(self._games[indexes1] < PROVISIONAL_GAMES, PROVISIONAL_K, ESTABLISHED_K)
+        k2 = np.where(self._games[indexes2] < PROVISIONAL_GAMES, PROVISIONAL_K, ESTABLISHED_K)
+
+        # np.add.at cumule correctement les variations d'un joueur présent plusieurs fois dans le lot
+        np.add.at(self._ratings, indexes1, k1 * (points - expected))
+        np.add.at(self._ratings, indexes2, k2 * (expected - points))
+        np.add.at(self._games, indexes1, 1)
+        np.add.at(self._games, indexes2, 1)
+
+    def get_rating(self, national_chess_id):
+        """Return the rating of a player, or the default rating without any rated game."""
+        index = self._indexes.get(national_chess_id)
+        return DEFAULT_RATING if index is None else float(self._ratings[index])
+
+    def get_ratings(self):
+        """Return a dictionary of the rating of each rated player."""
+        count = len(self._national_chess_ids)
+        return dict(zip(self._national_chess_ids, self._ratings[:count].tolist()))
+
+    def expected_score(self, player1_id, player2_id):
+        """Return the expected score of a player against another one."""
+        import numpy as np
+
+        return float(expected_scores(np.float64(self.get_rating(player1_id)),
+                                     np.float64(self.get_rating(player2_id))))
+
+    def to_json(self):
+        """Convert the ratings to a JSON-compatible dictionary of [rating, games] lists."""
+        count = len(self._national_chess_ids)
+        return {national_chess_id: [rating, games] for national_chess_id, rating, games
+                in zip(self._national_chess_ids, self._ratings[:count].tolist(), self._games[:count].tolist())}
+
+    @classmethod
+    def from_json(cls, json_data):
+        """Create a RatingEngine from the dictionary written by to_json."""
+        engine = cls()
+        national_chess_ids = list(json_data)
+        engine._get_indexes(national_chess_ids)
+        for index, national_chess_id in enumerate(national_chess_ids):
+            rating, games = json_data[national_chess_id]
+            engine._ratings[index] = rating
+            engine._games[index] = games
+        return engine
+
+
+if __name__ == "__main__":
+    pass
@@ -16,6 +16,8 @@ from model.match import Match
 class Round:
     """Class representing a round in a tournament."""
 
+    __slots__ = ("name", "matches", "played_pairs", "start_time", "end_time")
+
     def __init__(self, name, matches, start_time, end_time):
         self.name = name
         self.matches = []
@@ -0,0 +1,251 @@
+"""
+This module contains the definition of the ScoreLedger class, which keeps the scores and the tiebreaks of
+the players of a tournament up to date as results are recorded.
+
+Classes:
+    ScoreLedger: The scores, tiebreaks and standings of the players of a tournament.
+
+Usage:
+    ledger = ScoreLedger.from_rounds(tournament.players_list, tournament.rounds)
+    ledger.record_match(match)
+    ledger.correct_match(match, previous_points)
+    ledger.get_score(player)
+    ledger.get_tiebreaks(player)
+    ledger.standings()
+"""
+
+import bisect
+
+from model.crosstable import NO_OPPONENT, Crosstable
+
+
+class ScoreLedger:
+    """Scores, tiebreaks and standings of the players of a tournament.
+
+    Each player has the list of their opponents with the points of both players. The tiebreaks are
+    updated from these lists when a result is recorded:
+        - Buchholz: the sum of the scores of the opponents;
+        - Sonneborn-Berger: the sum of the scores of the opponents, weighted by the points scored against them;
+        - progressive: the sum of the scores after each round.
+
+    The standings are kept as a sorted list of (-score, -buchholz, -sonneborn_berger, -progressive, seed)
+    keys, where the seed is the position of the player in the tournament. Recording a result only moves the
+    two players of the match and their previous opponents in this list.
+    """
+
+    def __init__(self, players=()):
+        self._scores = {}
+        self._buchholz = {}
+        self._sonneborn_berger = {}
+        self._progressive = {}
+        self._opponents = {}
+        self._seeds = {}
+        self._keys = {}
+        self._players = []
+        self._standings = []
+        for player in players:
+            self.add_player(player)
+
+    @classmethod
+    def from_rounds(cls, players, rounds):
+        """Build the ledger of a tournament from the matches already played.
+
+        Args:
+            players (list): The players of the tournament, in seed order.
+            rounds (list): The rounds of the tournament, in the order they were played.
+
+        Returns:
+            ScoreLedger: The ledger with the scores and tiebreaks of all recorded matches.
+        """
+        return cls.from_crosstable(Crosstable.from_rounds(players, rounds))
+
+    @classmethod
+    def from_crosstable(cls, crosstable):
+        """Build the ledger of a tournament from the grid of its games.
+
+        The scores and the tiebreaks are computed on the whole grid at once, instead of replaying the
+        matches one by one.
+
+        Args:
+            crosstable (Crosstable): The grid of the games of the tournament.
+
+        Returns:
+            ScoreLedger: The ledger with the scores and tiebreaks of all recorded matches.
+        """
+        ledger = cls()
+        players = crosstable.players
+        for player in players:
+            ledger._register(player)
+        scores, buchholz, sonneborn_berger, progressive = crosstable.get_tiebreaks()
+        games = crosstable.get_games()
+        for index, player in enumerate(players):
+            ledger._scores[player] = scores[index]
+            ledger._buchholz[player] = buchholz[index]
+            ledger._sonneborn_berger[player] = sonneborn_berger[index]
+            ledger._progressive[player] = progressive[index]
+            ledger._opponents[player] = [(players[opponent], points, opponent_points)
+                                         for opponent, points, opponent_points in games[index]
+                                         if opponent != NO_OPPONENT]
+
+        ledger._keys = {player: ledger._get_key(player) for player in ledger._players}
+        ledger._standings = sorted(ledger._keys.values())
+        return ledger
+
+    def __len__(self):
+        return len(self._players)
+
+    def __contains__(self, player):
+        return player in self._scores
+
+    def _register(self, player):
+        seed = len(self._players)
+        self._scores[player] = 0
+        self._buchholz[player] = 0
+        self._sonneborn_berger[player] = 0
+        self._progressive[player] = 0
+        self._opponents[player] = []
+        self._seeds[player] = seed
+        self._players.append(player)
+
+    def _get_key(self, player):
+        return (-self._scores[player], -self._buchholz[player], -self._sonneborn_berger[player],
+                -self._progressive[player], self._seeds[player])
+
+    def _apply_match(self, match):
+        """Update the scores and the tiebreaks with the result of a match.
+
+        Returns:
+            set: The players whose score or tiebreaks changed.
+        """
+        player1, player2 = match.player1, match.player2
+        points1, points2 = match.points
+        affected = {player1, player2}
+
+        # Le score des deux joueurs change : mettre à jour les départages de leurs adversaires précédents
+        for player, points in ((player1, points1), (player2, points2)):
+            if not points:
+                continue
+            for opponent, _, opponent_points in self._opponents[player]:
+                self._buchholz[opponent] += points
+                self._sonneborn_berger[opponent] += opponent_points * points
+                affected.add(opponent)
+
+        self._scores[player1] += points1
+        self._scores[player2] += points2
+        self._opponents[player1].append((player2, points1, points2))
+        self._opponents[player2].append((player1, points2, points1))
+
+        for player, opponent, points in ((player1, player2, points1), (player2, player1, points2)):
+            self._buchholz[player] += self._scores[opponent]
+            self._sonneborn_berger[player] += points * self._scores[opponent]
+            self._progressive[player] += self._scores[player]
+        return affected
+
+    def _replace_result(self, match, previous_points):
+        """Replace the points previously recorded for a match by its current points.
+
+        Returns:
+            set: The players whose score or tiebreaks changed.
+        """
+        player1, player2 = match.player1, match.player2
+        affected = set()
+        for player, opponent, (old_points, old_opponent_points), (points, opponent_points) in (
+                (player1, player2, previous_points, match.points),
+                (player2, player1, previous_points[::-1], match.points[::-1])):
+            games = self._opponents[player]
+            # Dernière partie enregistrée contre cet adversaire avec l'ancien résultat
+            index = max(index for index, game in enumerate(games)
+                        if game == (opponent, old_points, old_opponent_points))
+            games[index] = (opponent, points, opponent_points)
+            self._scores[player] += points - old_points
+            # Le score cumulé change après cette partie et chacune des suivantes
+            self._progressive[player] += (points - old_points) * (len(games) - index)
+            affected.add(player)
+            affected.update(other for other, _, _ in games)
+
+        # Départages recalculés sur les parties des joueurs dont un adversaire a changé de score
+        for player in affected:
+            self._buchholz[player] = sum(self._scores[opponent] for opponent, _, _ in self._opponents[player])
+            self._sonneborn_berger[player] = sum(points * self._scores[opponent]
+                                                 for opponent, points, _ in self._opponents[player])
+        return affected
+
+    def add_player(self, player):
+        """Add a player with a score of 0 at the end of their score group."""
+        if player in self._scores:
+            return
+        self._register(player)
+        key = self._get_key(player)
+        self._keys[player] = key
+        bisect.insort(self._standings, key)
+
+    def get_score(self, player):
+        """Return the total score of a player."""
+        return self._scores[player]
+
+    def get_scores(self):
+        """Return a dictionary of the total score of each player."""
+        return dict(self._scores)
+
+    def get_tiebreaks(self, player):
+        """Return the tiebreaks of a player.
+
+        Returns:
+            tuple: (buchholz, sonneborn_berger, progressive).
+        """
+        return self._buchholz[player], self._sonneborn_berger[player], self._progressive[player]
+
+    def get_opponents(self, player):
+        """Return the opponents of a player in the order played.
+
+        Returns:
+            List[tuple]: (opponent, points, opponent_points) tuples.
+        """
+        return list(self._opponents[player])
+
+    def _move(self, player):
+        """Move a player in the standings after a change of their score or tiebreaks."""
+        old_key = self._keys[player]
+        new_key = self._get_key(player)
+        if new_key == old_key:
+            return
+        del self._standings[bisect.bisect_left(self._standings, old_key)]
+        bisect.insort(self._standings, new_key)
+        self._keys[player] = new_key
+
+    def record_match(self, match):
+        """Record the result of a match, updating the scores and the tiebreaks."""
+        for player in self._apply_match(match):
+            self._move(player)
+
+    def correct_match(self, match, previous_points):
+        """Replace the result previously recorded for a match by its current result.
+
+        Args:
+            match (Match): The match, with its corrected result.
+            previous_points (tuple): The points of both players recorded before the correction.
+        """
+        for player in self._replace_result(match, previous_points):
+            self._move(player)
+
+    def standings(self):
+        """Return the standings of the tournament.
+
+        Returns:
+            List[tuple]: (player, score) tuples, from the best ranked to the lowest ranked. Players with the
+                         same score are ranked by Buchholz, Sonneborn-Berger, progressive score, then seed.
+        """
+        return [(self._players[key[-1]], -key[0]) for key in self._standings]
+
+    def detailed_standings(self):
+        """Return the standings of the tournament with the tiebreaks.
+
+        Returns:
+            List[tuple]: (player, score, buchholz, sonneborn_berger, progressive) tuples, from the best ranked
+                         to the lowest ranked.
+        """
+        return [(self._players[key[-1]], -key[0], -key[1], -key[2], -key[3]) for key in self._standings]
+
+
+if __name__ == "__main__":
+    pass
@@ -11,13 +11,17 @@ Classes:
 """
 
 import random
-import itertools
 
 from typing import Dict, List, Optional, Set
 
 from model.round import Round
 from model.match import Match
-from model.player import Player
+from model.player import PlayerIdentityMap
+from model.pairing import pair_players
+from model.played_pairs import PlayedPairs
+from model.rating import DEFAULT_RATING
+from model.crosstable import Crosstable
+from model.score_ledger import ScoreLedger
 
 
 class Tournament:
@@ -35,7 +39,13 @@ class Tournament:
         self.current_round: int = current_round
         self.players_score: Dict[str, int] = {}
         self.players_list: List[str] = list(self.players_score.keys())
-        self.played_pairs = set()
+        self.played_pairs = PlayedPairs()
+        self._score_ledger = None
+        self._crosstable = None
+        self._players_by_fullname = None
+        self._players_by_id = None
+        # Version enregistrée dont le tournoi a été chargé (0 : jamais enregistré)
+        self.version: int = 0
 
         if players_score is None:
             players_score = {}
@@ -85,7 +95,7 @@ class Tournament:
         Returns:
             dict: A dictionary containing tournament information in a JSON-compatible format.
                   Keys include 'name', 'place', 'date_start', 'date_end', 'rounds', 'current_round',
-                  'players_list', 'players_score', and 'director_note'.
+                  'players_list', 'players_score', 'director_note', 'played_pairs' and 'version'.
         """
         return {
             'name': self.name,
@@ -96,7 +106,8 @@ class Tournament:
             'rounds': [round.to_json() for round in self.rounds],
             'current_round': self.current_round,
             'players_score': self.players_score,
-            'played_pairs': [{'player1': pair[0].to_json(), 'player2': pair[1].to_json()} for pair in self.played_pairs]
+            'played_pairs': self.played_pairs.to_json(),
+            'version': self.version
 
         }
 
@@ -104,85 +115,143 @@ class Tournament:
         """Ajoute un round au tournoi."""
         self.rounds.append(new_round)
 
-    def generate_pairs_for_round(self):
+    @property
+    def score_ledger(self):
+        """The score ledger of the tournament.
 
-        # Générer les paires pour le premier round
-        if self.current_round == 1:
-            all_pairs = list(itertools.combinations(self.players_list, 2))
-            random.shuffle(all_pairs)
+        The ledger is built from the recorded matches on first access, or when the list of players changed,
+        then updated incrementally as results are recorded.
+        """
+        if self._score_ledger is None or len(self._score_ledger) != len(self.players_list):
+            self._score_ledger = ScoreLedger.from_crosstable(self.crosstable)
+        return self._score_ledger
 
-            round_matches = []
-            paired_players = set()
+    @property
+    def crosstable(self):
+        """The crosstable of the tournament.
 
-            for pair in all_pairs:
-                player1, player2 = pair
-                # Vérifier si les deux joueurs sont déjà appariés
-                if player1 in paired_players or player2 in paired_players:
-                    continue
+        The grid is built from the matches on first access, then kept until a result is recorded or the
+        pairings or the list of players change.
+        """
+        if self._crosstable is None or len(self._crosstable) != len(self.players_list):
+            self._crosstable = Crosstable.from_rounds(self.players_list, self.rounds)
+        return self._crosstable
 
-                match_instance = Match({player1: 0, player2: 0})
-                round_matches.append(match_instance)
-                # Jouer le match
-                result = match_instance.play_match()
+    def generate_pairs_for_round(self, ratings=None):
+        """Pair the players of the current round with the Swiss pairing engine.
 
-                # Mettre à jour les paires déjà jouées et les joueurs appariés
-                self.played_pairs.add((player1, player2))
-                self.played_pairs.add((player2, player1))
+        The matches are added to the current round without result: results are recorded afterwards with
+        record_result, interactively or from a result file.
 
-                paired_players.add(player1)
-                paired_players.add(player2)
+        Args:
+            ratings (dict, optional): The Elo rating of the players by national chess ID, used to seed the
+                                      first round. Without ratings, the first round is drawn at random.
 
-            # Enregistrez les paires de matchs générées pour ce round
-            self.rounds[self.current_round].matches.extend(round_matches)
+        Returns:
+            List[Match]: The matches of the round, in board order.
 
-        else:
-            # Classer les joueurs par score
-            sorted_players = sorted(self.players_list, key=lambda x: x.score, reverse=True)
-
-            # Associer les joueurs pour les rounds suivants
-            round_matches = []
-            while len(sorted_players) >= 2:
-                player1 = sorted_players[0]
-
-                # Vérifier si les deux derniers joueurs peuvent former une paire
-                if len(sorted_players) == 2:
-                    player2 = sorted_players[1]
-                else:
-                    player2 = None
-                    # Chercher le joueur avec le score le plus proche
-                    min_diff = float('inf')
-                    for j in range(1, len(sorted_players)):
-                        if (player1, sorted_players[j]) not in self.played_pairs and \
-                                (sorted_players[j], player1) not in self.played_pairs:
-                            score_diff = abs(player1.score - sorted_players[j].score)
-                            if score_diff < min_diff:
-                                min_diff = score_diff
-                                player2 = sorted_players[j]
-                    if player2 is None:
-                        break
-
-                match_instance = Match({player1: 0, player2: 0})
-                round_matches.append(match_instance)
-                match_instance.play_match()
-
-                # Mettre à jour les paires déjà jouées
-                self.played_pairs.add((player1, player2))
-                self.played_pairs.add((player2, player1))
-
-                # Retirer les joueurs associés de la liste des joueurs triés
-                sorted_players.remove(player1)
-                if len(sorted_players) > 0:
-                    sorted_players.remove(player2)
-
-            # Enregistrez les paires de matchs générées pour ce round
-            self.rounds[self.current_round].matches.extend(round_matches)
+        Raises:
+            PairingError: If no legal pairing exists for this round.
+        """
+        return self.apply_pairings(self.compute_pairings(ratings))
+
+    def compute_pairings(self, ratings=None):
+        """Compute the pairings of the current round, without modifying the tournament.
+
+        Args:
+            ratings (dict, optional): The Elo rating of the players by national chess ID, used to seed the
+                                      first round. Without ratings, the first round is drawn at random.
+
+        Returns:
+            List[tuple]: (player1_id, player2_id) national chess ID tuples, in board order.
+
+        Raises:
+            PairingError: If no legal pairing exists for this round.
+        """
+        ledger = self.score_ledger
+        standings = [player for player, score in ledger.standings()]
+        # Premier round : les joueurs ayant tous le même score, ils sont classés par Elo (tirage au sort
+        # entre joueurs de même Elo, ou entre tous les joueurs sans classement Elo)
+        if self.current_round == 0:
+            random.shuffle(standings)
+            if ratings:
+                standings.sort(key=lambda player: -ratings.get(player.national_chess_id, DEFAULT_RATING))
+
+        return pair_players([player.national_chess_id for player in standings], self.played_pairs,
+                            {player.national_chess_id: ledger.get_score(player) for player in standings})
+
+    def apply_pairings(self, pairings):
+        """Add the matches of computed pairings to the current round.
+
+        Args:
+            pairings (List[tuple]): (player1_id, player2_id) national chess ID tuples, in board order.
+
+        Returns:
+            List[Match]: The matches of the round, in board order.
+        """
+        players_by_id = {player.national_chess_id: player for player in self.players_list}
+
+        round_matches = []
+        for player1_id, player2_id in pairings:
+            player1 = players_by_id[player1_id]
+            player2 = players_by_id[player2_id]
+
+            match_instance = Match(player1, player2)
+            round_matches.append(match_instance)
+
+            # Mettre à jour les paires déjà jouées
+            self.played_pairs.add(player1_id, player2_id)
+
+        # Enregistrez les paires de matchs générées pour ce round
+        self.rounds[self.current_round].matches.extend(round_matches)
+        self._crosstable = None
+        return round_matches
+
+    def record_result(self, match, result):
+        """Record the result of a match of the tournament, or correct it, and update the score ledger. The
+        crosstable is built again on its next access.
+
+        Args:
+            match (Match): The match.
+            result (str): The result for the first player ('win', 'loss' or 'draw').
+        """
+        match.set_result(result, self.score_ledger)
+        self._crosstable = None
+
+    def play_match(self, match):
+        """Ask the result of a match of the tournament to the user and record it (see record_result).
+
+        Returns:
+            str: The result for the first player ('win', 'loss' or 'draw').
+        """
+        result = match.play_match(self.score_ledger)
+        self._crosstable = None
+        return result
+
+    def get_pending_matches(self):
+        """Return the matches of the current round which have no result yet."""
+        return [match for match in self.rounds[self.current_round].matches if match.result is None]
+
+    def get_player_by_fullname(self, fullname):
+        """Return the player of the tournament with this full name ("First Last"), or None."""
+        if self._players_by_fullname is None or len(self._players_by_fullname) != len(self.players_list):
+            self._players_by_fullname = {player.fullname(): player for player in self.players_list}
+        return self._players_by_fullname.get(fullname)
+
+    def get_player_by_national_chess_id(self, national_chess_id):
+        """Return the player of the tournament with this national chess ID, or None."""
+        if self._players_by_id is None or len(self._players_by_id) != len(self.players_list):
+            self._players_by_id = {player.national_chess_id: player for player in self.players_list}
+        return self._players_by_id.get(national_chess_id)
 
     @classmethod
-    def from_json(cls, json_data):
+    def from_json(cls, json_data, identity_map=None):
         """Crée un objet Tournament à partir des données JSON.
 
         Args:
             json_data (dict): Les données JSON représentant le tournoi.
+            identity_map (PlayerIdentityMap, optional): The identity map resolving players by national chess ID.
+                                                        It can be shared to load several tournaments.
 
         Returns:
             Tournament: L'objet Tournament créé à partir des données JSON.
@@ -195,20 +264,15 @@ class Tournament:
         current_round = json_data['current_round']
         director_note = json_data['director_note']
 
-        # Convertir les joueurs de JSON en objets Player
+        if identity_map is None:
+            identity_map = PlayerIdentityMap()
+
+        # Convertir les joueurs de JSON en objets Player, un seul objet par identifiant national
         players_list_data = json_data['players_list']
-        players_list = [Player.from_json(player_data) for player_data in
-                        players_list_data]  # Convertir en objets Player
-
-        # Convertir les paires jouées de JSON en objets Player
-        played_pairs_data = json_data.get('played_pairs', [])
-        played_pairs = set()
-        for pair_data in played_pairs_data:
-            player1_data = pair_data['player1']
-            player2_data = pair_data['player2']
-            player1 = Player.from_json(player1_data)
-            player2 = Player.from_json(player2_data)
-            played_pairs.add((player1, player2))
+        players_list = [identity_map.from_json(player_data) for player_data in players_list_data]
+
+        # Convertir les paires jouées en identifiants nationaux
+        played_pairs = PlayedPairs.from_json(json_data.get('played_pairs', []))
 
         players_score = json_data['players_score']
         rounds_data = json_data['rounds']
@@ -220,6 +284,7 @@ class Tournament:
         tournament.played_pairs = played_pairs
         tournament.current_round = current_round
         tournament.director_note = director_note
+        tournament.version = json_data.get('version', 0)
 
         # Créer les objets Round à partir des données JSON
         rounds = [Round.from_json(round_data, tournament) for round_data in rounds_data]
@@ -233,14 +298,13 @@ class Tournament:
                 f"Current Round: {self.current_round}\nDirector Note: {self.director_note}")
 
 
-def calculate_leaderboard(tournament, previous_scores):
-    # Créez une liste de tuples (joueur, score total)
-    leaderboard = [(player, player.calculate_total_score(tournament.rounds, previous_scores))
-                   for player in tournament.players_list]
-    # Triez la liste en fonction du score total (en ordre décroissant)
-    sorted_leaderboard = sorted(leaderboard, key=lambda x: x[1], reverse=True)
+def calculate_leaderboard(tournament, previous_scores, standings=None):
+    # Le classement et les départages sont tenus à jour par le registre des scores du tournoi, sauf s'ils ont
+    # déjà été calculés (par exemple par un processus de calcul du mode multi-sections)
+    sorted_leaderboard = tournament.score_ledger.detailed_standings() if standings is None else standings
 
-    tournament.players_score = {f"{player.firstname} {player.lastname}": score for player, score in sorted_leaderboard}
+    tournament.players_score = {f"{player.firstname} {player.lastname}": score
+                                for player, score, *tiebreaks in sorted_leaderboard}
     # Affichez le classement
     # Vérifier si c'est le dernier round
     if tournament.current_round == len(tournament.rounds) - 1:
@@ -248,6 +312,7 @@ def calculate_leaderboard(tournament, previous_scores):
     else:
         print(f"\nClassement fin du round {tournament.current_round + 1} :")
 
-    # Afficher le classement
-    for i, (player, score) in enumerate(sorted_leaderboard, start=1):
-        print(f"{i}. {player.firstname} {player.lastname} : {score} points")
+    # Afficher le classement, avec les départages : Buchholz, Sonneborn-Berger et cumulatif
+    for i, (player, score, buchholz, sonneborn_berger, progressive) in enumerate(sorted_leaderboard, start=1):
+        print(f"{i}. {player.firstname} {player.lastname} : {score} points "
+              f"(Buchholz {buchholz}, S-B {sonneborn_berger}, cumulatif {progressive})")
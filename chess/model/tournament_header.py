@@ -0,0 +1,75 @@
+"""
+This module contains the definition of the TournamentHeader class, the lightweight summary of a
+tournament used by the tournament lists.
+
+Classes:
+    TournamentHeader: The name, place, dates, progress, player count and version of a tournament.
+"""
+
+
+class TournamentHeader:
+    """Summary of a tournament, without its rounds and matches."""
+
+    def __init__(self, name: str, place: str, date_start: str, date_end: str, current_round: int = 0,
+                 rounds_count: int = 0, player_count: int = 0, version: int = 0):
+        self.name: str = name
+        self.place: str = place
+        self.date_start: str = date_start
+        self.date_end: str = date_end
+        self.current_round: int = current_round
+        self.rounds_count: int = rounds_count
+        self.player_count: int = player_count
+        self.version: int = version
+
+    @property
+    def status(self):
+        """Return 'unstarted', 'unfinished' or 'finished'."""
+        if self.is_unstarted() and self.player_count == 0:
+            return "unstarted"
+        if self.is_unfinished():
+            return "unfinished"
+        return "finished"
+
+    def is_unstarted(self):
+        """Return True if no round of the tournament has been played."""
+        return self.current_round == 0
+
+    def is_unfinished(self):
+        """Return True if the tournament has players and rounds left to play."""
+        return (self.current_round < self.rounds_count and
+                (self.current_round != 0 or self.player_count > 0))
+
+    def to_json(self):
+        """Converts the header to a JSON-compatible dictionary."""
+        return {
+            'name': self.name,
+            'place': self.place,
+            'date_start': self.date_start,
+            'date_end': self.date_end,
+            'current_round': self.current_round,
+            'rounds_count': self.rounds_count,
+            'player_count': self.player_count,
+            'version': self.version,
+            'status': self.status
+        }
+
+    @classmethod
+    def from_json(cls, json_data):
+        """Crée un objet TournamentHeader à partir des données JSON de l'index."""
+        return cls(json_data['name'], json_data['place'], json_data['date_start'], json_data['date_end'],
+                   json_data['current_round'], json_data['rounds_count'], json_data['player_count'],
+                   json_data.get('version', 0))
+
+    @classmethod
+    def from_tournament_data(cls, tournament_data):
+        """Crée un objet TournamentHeader à partir des données complètes d'un tournoi."""
+        return cls(tournament_data['name'], tournament_data['place'], tournament_data['date_start'],
+                   tournament_data['date_end'], tournament_data['current_round'], len(tournament_data['rounds']),
+                   len(tournament_data['players_list']), tournament_data.get('version', 0))
+
+    def __str__(self):
+        return f"{self.name} à {self.place}"
+
+
+if __name__ == "__main__":
+    pass
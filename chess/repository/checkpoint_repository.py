@@ -0,0 +1,124 @@
+import json
+import os
+
+from repository.file_storage import atomic_write, get_file_lock
+
+
+class CheckpointRepository:
+    """Checkpoints of the round in progress of the tournaments, between two saves of the tournament.
+
+    Each pairing and each result entered is appended as one short line to a checkpoint file next to the
+    tournament storage, and flushed to disk: a crash or an interruption in the middle of a round no longer
+    loses the results already entered, without saving the whole tournament after each board. The records
+    only hold the change: (tournament, version, round, pairings) when a round is paired, then
+    (tournament, version, round, board, result) for each result.
+
+    The version is the stored version of the tournament the round was started from. Once the tournament is
+    saved, its version changes and its checkpoints are cleared; checkpoints left with another version
+    (tournament saved meanwhile by another program) are ignored.
+    """
+
+    def __init__(self, tournament_repository, filename=None):
+        """Initialize the CheckpointRepository.
+
+        Args:
+            tournament_repository: The repository of the tournaments whose rounds are checkpointed.
+            filename (str, optional): Path of the checkpoint file. Defaults to the tournament storage file name
+                                      followed by '.checkpoint'.
+        """
+        self.filename = filename or tournament_repository.filename + '.checkpoint'
+        self._lock = get_file_lock(self.filename)
+
+    def _append(self, records):
+        """Append records to the checkpoint file, and flush them to disk."""
+        lines = "".join(json.dumps(record, separators=(',', ':')) + "\n" for record in records)
+        with self._lock:
+            with open(self.filename, 'a+b') as file:
+                # Ligne tronquée par un arrêt pendant une écriture : la terminer pour ne pas perdre la suivante
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        lines = "\n" + lines
+                file.write(lines.encode("utf-8"))
+                file.flush()
+                os.fsync(file.fileno())
+
+    def _load_records(self):
+        """Load the records of the checkpoint file, in order. Unreadable lines (interrupted write) are skipped."""
+        if not os.path.exists(self.filename):
+            return []
+
+        records = []
+        with open(self.filename, 'r', encoding="utf-8") as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+
+    def save_pairings(self, tournament):
+        """Record the pairings of the current round of a tournament.
+
+        Args:
+            tournament (Tournament): The tournament, whose current round has just been paired.
+        """
+        current_round = tournament.rounds[tournament.current_round]
+        self._append([{
+            "tournament": tournament.name,
+            "version": tournament.version,
+            "round": tournament.current_round,
+            "start_time": current_round.start_time,
+            "pairings": [[match.player1.national_chess_id, match.player2.national_chess_id]
+                         for match in current_round.matches],
+        }])
+
+    def save_results(self, tournament, results):
+        """Record results of the current round of a tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+            results (List[tuple]): (board, result) tuples, the boards being numbered from 1.
+        """
+        self._append([{"tournament": tournament.name, "version": tournament.version,
+                       "round": tournament.current_round, "board": board, "result": result}
+                      for board, result in results])
+
+    def load(self, tournament):
+        """Return the checkpoint of the current round of a tournament.
+
+        Only the records of the stored version the tournament was loaded from are taken into account.
+
+        Args:
+            tournament (Tournament): The tournament, as loaded from the repository.
+
+        Returns:
+            dict: {"start_time": str, "pairings": List[list] or None, "results": {board: result}}, or None if
+                  the current round has no checkpoint.
+        """
+        checkpoint = None
+        for record in self._load_records():
+            if (record.get("tournament") != tournament.name or record.get("version") != tournament.version or
+                    record.get("round") != tournament.current_round):
+                continue
+            if checkpoint is None:
+                checkpoint = {"start_time": None, "pairings": None, "results": {}}
+            if "pairings" in record:
+                checkpoint["start_time"] = record.get("start_time")
+                checkpoint["pairings"] = record["pairings"]
+            elif "board" in record:
+                checkpoint["results"][record["board"]] = record["result"]
+        return checkpoint
+
+    def clear(self, tournament_name):
+        """Remove the checkpoints of a tournament, once it has been saved."""
+        with self._lock:
+            records = self._load_records()
+            remaining = [record for record in records if record.get("tournament") != tournament_name]
+            if len(remaining) == len(records):
+                return
+            if not remaining:
+                os.remove(self.filename)
+                return
+            with atomic_write(self.filename) as file:
+                file.writelines(json.dumps(record, separators=(',', ':')) + "\n" for record in remaining)
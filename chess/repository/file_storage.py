@@ -0,0 +1,169 @@
+"""
+This module contains the tools used by the repositories to write their files safely when several
+processes (menu, arbiter service, command line) use the same data directory.
+
+    - atomic_write writes a complete new file next to the target, flushes it to disk, then renames it over
+      the target: after a crash, the file is either the old one or the new one, never a truncated one;
+    - FileLock is an advisory lock on a '.lock' file, held around each read-modify-write: the threads of a
+      process share it like an RLock, and the other processes wait for it (fcntl on Unix, msvcrt on Windows);
+    - ConflictError is raised when a record was modified by another writer since it was read.
+
+Classes:
+    ConflictError: Raised when a record changed since it was read.
+    FileLock: Reentrant lock shared by the threads and the processes using a file.
+
+Functions:
+    atomic_write: Context manager writing a file atomically.
+    fsync_directory: Flush a directory entry (a rename) to disk.
+    get_file_lock: Return the lock of a file, shared by all the repositories of the process.
+"""
+
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows : verrouillage d'un octet du fichier de verrou avec msvcrt
+    fcntl = None
+    import msvcrt
+
+
+class ConflictError(Exception):
+    """Raised when a record was modified by another writer since it was read.
+
+    Attributes:
+        name (str): The name or identifier of the record.
+        expected_version (int): The version the writer had read.
+        stored_version (int): The version found in the storage.
+    """
+
+    def __init__(self, message, name=None, expected_version=None, stored_version=None):
+        super().__init__(message)
+        self.name = name
+        self.expected_version = expected_version
+        self.stored_version = stored_version
+
+
+def fsync_directory(directory):
+    """Flush a directory to disk, so that a rename in it survives a crash (no-op on Windows)."""
+    if os.name != "posix":
+        return
+    descriptor = os.open(directory or ".", os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+@contextmanager
+def atomic_write(filename, mode='w'):
+    """Write a file atomically: the content is written to a temporary file, flushed, then renamed.
+
+    Usage:
+        with atomic_write(filename) as file:
+            json.dump(data, file)
+
+    Args:
+        filename (str): The file to write.
+        mode (str, optional): 'w' or 'wb'. Defaults to 'w'.
+    """
+    # Nom propre au processus et au thread : deux écrivains ne partagent jamais le même fichier temporaire
+    temp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_filename, mode) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+    fsync_directory(os.path.dirname(filename))
+
+
+def _lock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        return
+    file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK abandonne après dix secondes d'attente : réessayer
+            time.sleep(0.01)
+
+
+def _unlock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        return
+    file.seek(0)
+    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """Reentrant lock shared by the threads of a process and, through an advisory lock, by the processes.
+
+    The lock file is only locked by the outermost acquisition of the process, so the methods of a repository
+    can take the lock again when they call each other.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._file = open(self.filename, 'a+b')
+                _lock_file(self._file)
+            except BaseException:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            _unlock_file(self._file)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+# Verrous partagés par toutes les instances travaillant sur un même fichier
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+
+def get_file_lock(filename):
+    """Return the lock of a data file (held on the file '<filename>.lock'), shared within the process."""
+    path = os.path.abspath(filename)
+    with _file_locks_guard:
+        if path not in _file_locks:
+            _file_locks[path] = FileLock(path + '.lock')
+        return _file_locks[path]
+
+
+if __name__ == "__main__":
+    pass
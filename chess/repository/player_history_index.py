@@ -0,0 +1,201 @@
+"""
+This module contains the inverted index of the games of each player, across all tournaments.
+
+The index maps the national chess ID of a player to the games the player played, grouped by tournament, so the
+history of a player is read in a time proportional to the player's number of games, without loading the tournaments.
+
+It is stored in an append-only file of JSON lines: each save of a tournament appends the postings of this
+tournament (the last line of a tournament replaces the previous ones), tagged with the signature of the
+tournament storage after the save. When the last signature no longer matches the storage (file edited by
+another program, interrupted write), the index is rebuilt from the tournaments.
+
+Classes:
+    PlayerHistoryIndex: The games of each player, by tournament.
+
+Functions:
+    tournament_postings: The games of each player of a tournament, from its stored data.
+"""
+
+import json
+import os
+
+from model.match import RESULT_CODES, RESULT_POINTS, result_from_scores
+from repository.file_storage import atomic_write
+
+
+def tournament_postings(tournament_data):
+    """Return the games played in a tournament, by player.
+
+    The players of a match are identified by their national chess IDs ("player_ids"), or, in the files saved
+    before the matches recorded them, by their full names.
+
+    Args:
+        tournament_data (dict): The stored data of the tournament.
+
+    Returns:
+        Dict[str, list]: For each national chess ID, the [round_index, board, opponent_id, opponent_name,
+                         points, opponent_points] lists of the games of the player, in the order played.
+                         The matches without result are not included.
+    """
+    names_by_id = {player_data['national chess ID']: f"{player_data['firstname']} {player_data['lastname']}"
+                   for player_data in tournament_data['players_list']}
+    ids_by_name = None
+    postings = {}
+    for round_index, round_data in enumerate(tournament_data['rounds']):
+        for board, match_data in enumerate(round_data['matches'], start=1):
+            scores = list(match_data['players'].values())
+            if "result" in match_data:
+                result = match_data["result"]
+            else:
+                result = result_from_scores(scores)
+            if result is None:
+                continue
+            if "player_ids" in match_data:
+                player1_id, player2_id = match_data["player_ids"]
+            else:
+                if len(scores) != 2:
+                    continue
+                if ids_by_name is None:
+                    ids_by_name = {name: national_chess_id for national_chess_id, name in names_by_id.items()}
+                player1_id, player2_id = (ids_by_name.get(name) for name in match_data['players'])
+            if player1_id not in names_by_id or player2_id not in names_by_id:
+                continue
+            points1, points2 = RESULT_POINTS[RESULT_CODES[result]]
+            name1, name2 = names_by_id[player1_id], names_by_id[player2_id]
+            postings.setdefault(player1_id, []).append([round_index, board, player2_id, name2, points1, points2])
+            postings.setdefault(player2_id, []).append([round_index, board, player1_id, name1, points2, points1])
+    return postings
+
+
+def posting_to_game(tournament_name, posting):
+    """Convert a posting into the dictionary describing a game of the player."""
+    round_index, board, opponent_id, opponent_name, points, opponent_points = posting
+    return {
+        "tournament": tournament_name,
+        "round": round_index + 1,
+        "board": board,
+        "opponent_id": opponent_id,
+        "opponent_name": opponent_name,
+        "points": points,
+        "opponent_points": opponent_points
+    }
+
+
+class PlayerHistoryIndex:
+    """Games of each player, by tournament, stored in an append-only file of JSON lines."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.signature = None
+        self._postings = {}
+        self._tournament_players = {}
+        # Position de chaque tournoi dans l'ordre d'enregistrement, pour ordonner l'historique des joueurs
+        self._positions = {}
+
+    def set_tournament(self, tournament_name, postings):
+        """Replace the games of a tournament.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            postings (dict): The postings of the tournament, as returned by tournament_postings.
+        """
+        self._positions.setdefault(tournament_name, len(self._positions))
+        for national_chess_id in self._tournament_players.pop(tournament_name, ()):
+            player_postings = self._postings[national_chess_id]
+            del player_postings[tournament_name]
+            if not player_postings:
+                del self._postings[national_chess_id]
+        for national_chess_id, player_postings in postings.items():
+            self._postings.setdefault(national_chess_id, {})[tournament_name] = player_postings
+        if postings:
+            self._tournament_players[tournament_name] = set(postings)
+
+    def get_games(self, national_chess_id):
+        """Return the games of a player, by tournament then in the order played.
+
+        Returns:
+            List[dict]: The games, as returned by posting_to_game.
+        """
+        player_postings = sorted(self._postings.get(national_chess_id, {}).items(),
+                                 key=lambda item: self._positions[item[0]])
+        return [posting_to_game(tournament_name, posting)
+                for tournament_name, postings in player_postings for posting in postings]
+
+    def get_head_to_head(self, player1_id, player2_id):
+        """Return the games of a player against another one."""
+        return [game for game in self.get_games(player1_id) if game["opponent_id"] == player2_id]
+
+    def _tournament_records(self):
+        """Return the postings of each tournament in the order recorded, rebuilt from the postings of the players."""
+        return {tournament_name: {national_chess_id: self._postings[national_chess_id][tournament_name]
+                                  for national_chess_id in self._tournament_players.get(tournament_name, ())}
+                for tournament_name in self._positions}
+
+    @staticmethod
+    def read_signature(filename, block_size=4096):
+        """Return the signature of the last line of an index file, or None if it is missing or truncated."""
+        try:
+            with open(filename, 'rb') as file:
+                end = file.seek(0, os.SEEK_END)
+                # Lire la fin du fichier par blocs jusqu'au début de la dernière ligne
+                tail = b""
+                position = end
+                while position > 0 and tail.count(b"\n") < 2:
+                    size = min(block_size, position)
+                    position -= size
+                    file.seek(position)
+                    tail = file.read(size) + tail
+        except FileNotFoundError:
+            return None
+        if not tail.endswith(b"\n"):
+            return None
+        try:
+            return json.loads(tail[:-1].rsplit(b"\n", 1)[-1]).get("signature")
+        except json.JSONDecodeError:
+            return None
+
+    @classmethod
+    def load(cls, filename):
+        """Load an index file, replaying its lines in order.
+
+        Returns:
+            PlayerHistoryIndex: The index, or None if the file is missing or its last line is truncated.
+        """
+        if not os.path.exists(filename):
+            return None
+        history_index = cls(filename)
+        with open(filename, 'r') as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    return None
+                record = json.loads(line)
+                if "tournament" in record:
+                    history_index.set_tournament(record["tournament"], record["postings"])
+                history_index.signature = record.get("signature")
+        return history_index
+
+    @staticmethod
+    def append_record(filename, tournament_name, postings, signature):
+        """Append the games of a tournament to an index file, without loading it."""
+        record = {"tournament": tournament_name, "postings": postings, "signature": signature}
+        with open(filename, 'a') as file:
+            file.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+    def append(self, tournament_name, postings, signature):
+        """Replace the games of a tournament and append them to the index file."""
+        self.set_tournament(tournament_name, postings)
+        self.append_record(self.filename, tournament_name, postings, signature)
+        self.signature = signature
+
+    def save(self, signature):
+        """Rewrite the index file with one line per tournament, followed by the signature."""
+        with atomic_write(self.filename) as file:
+            for tournament_name, postings in self._tournament_records().items():
+                record = {"tournament": tournament_name, "postings": postings}
+                file.write(json.dumps(record, separators=(',', ':')) + "\n")
+            file.write(json.dumps({"signature": signature}) + "\n")
+        self.signature = signature
+
+
+if __name__ == "__main__":
+    pass
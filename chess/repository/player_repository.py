@@ -1,7 +1,13 @@
 import os
 import json
+import bisect
+
+from operator import itemgetter
 
 from model.player import Player
+from repository.file_storage import ConflictError, atomic_write, get_file_lock
+from utils.json_stream import write_json_array
+from utils.search_index import SearchIndex
 
 
 def get_selected_player(sorted_players):
@@ -21,31 +27,158 @@ def get_selected_player(sorted_players):
             print("Veuillez indiquer un numéro valide.")
 
 
-class PlayerRepository:
-    """Repository for managing player data storage and retrieval."""
+def add_player_to_search_index(search_index, player_data):
+    """Add a player to a search index, on their last name, first name and full name."""
+    search_index.add(player_data['national chess ID'], player_data, *_player_search_texts(player_data))
+
+
+def _player_search_texts(player_data):
+    return (player_data['lastname'], player_data['firstname'],
+            f"{player_data['lastname']} {player_data['firstname']}")
+
+
+def build_player_search_index(players):
+    """Build the search index of players on their last name, first name and full name."""
+    return SearchIndex.build((player_data['national chess ID'], player_data, _player_search_texts(player_data))
+                             for player_data in players)
+
+
+class BasePlayerRepository:
+    """Part of the player repositories which does not depend on the storage: the search of the players.
+
+    The search index is built from get_player_by_alphabetical_order, provided by each storage with
+    load_players, get_player_by_national_chess_id and add_player, on the first search, then maintained by
+    add_player.
+    """
+
+    def __init__(self):
+        self._search_index = None
+
+    def _get_search_index(self):
+        """Return the search index of the players, building it on the first call."""
+        if self._search_index is None:
+            self._search_index = build_player_search_index(self.get_player_by_alphabetical_order())
+        return self._search_index
+
+    def search_players(self, query, limit=None):
+        """Search players by last name, first name or full name, ignoring accents and case.
+
+        Args:
+            query (str): The beginning or a part of the name.
+            limit (int, optional): Maximum number of players returned.
+
+        Returns:
+            List[dict]: The matching players, those whose name starts with the query first.
+        """
+        return self._get_search_index().search(query, limit)
+
+    def preload(self):
+        """Load the players and build their search index, so that the first listing or search of the session
+        does not have to read the data file."""
+        self._get_search_index()
+
+
+class PlayerRepository(BasePlayerRepository):
+    """Repository for managing player data storage and retrieval.
+
+    Players are loaded once into memory and kept with two indexes: a hash index on the national chess ID
+    and a list sorted by last name that is maintained on insertion. The cache is invalidated whenever the
+    modification time or the size of the JSON file or of its journal changes (e.g. edited by another program).
 
-    def __init__(self, filename='players.json'):
+    A search index on the last and first names is built on the first search and maintained on insertion.
+
+    Each addition appends one compact record to a journal file next to the JSON file, so its cost does not
+    depend on the number of players. Reads replay the journal after the JSON file, and the journal is folded
+    back into the JSON file once it grows past `journal_threshold` bytes. The JSON file is only ever replaced
+    atomically, and a record cut by an interrupted write is skipped when the journal is read.
+
+    Additions and reloads hold an advisory lock shared with the other processes, and additions reload the
+    files if another program changed them, so that concurrent additions are never lost.
+    """
+
+    def __init__(self, filename='players.json', journal_threshold=256 * 1024):
         """Initialize the PlayerRepository.
 
         Args:
             filename (str, optional): Name of the JSON file to store player data. Defaults to 'players.json'.
+            journal_threshold (int, optional): Journal size in bytes above which it is compacted into the
+                                               JSON file. Defaults to 256 KiB.
         """
+        super().__init__()
         data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
         self.filename = os.path.join(data_dir, filename)
+        self.journal_filename = self.filename + '.journal'
+        self.journal_threshold = journal_threshold
+        self._players = []
+        self._players_by_id = {}
+        self._sorted_players = []
+        self._file_signature = None
+        self._lock = get_file_lock(self.filename)
+
+    def _get_file_signature(self):
+        """Return the (mtime, size) signatures of the JSON file and of the journal (None for a missing file)."""
+        signature = []
+        for filename in (self.filename, self.journal_filename):
+            try:
+                stat = os.stat(filename)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _load_journal(self):
+        """Load the player records appended to the journal, in order. Unreadable lines (interrupted write)
+        are skipped."""
+        if not os.path.exists(self.journal_filename):
+            return []
+
+        records = []
+        with open(self.journal_filename, 'r', encoding="utf-8") as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+
+    def _refresh_cache(self):
+        """Reload the players from the JSON file and the journal if they changed since the last load."""
+        signature = self._get_file_signature()
+        if signature == self._file_signature:
+            return
+
+        # Relecture sous le verrou : jamais entre l'écriture du fichier JSON et la suppression du journal
+        with self._lock:
+            signature = self._get_file_signature()
+            players = []
+            if os.path.exists(self.filename):
+                with open(self.filename, 'r') as file:
+                    players = json.load(file)
+            players_by_id = {player['national chess ID']: player for player in players}
+            for player in self._load_journal():
+                # Un joueur déjà intégré au fichier JSON (compactage interrompu) n'est pas ajouté deux fois
+                if player['national chess ID'] not in players_by_id:
+                    players.append(player)
+                    players_by_id[player['national chess ID']] = player
+
+        self._players = players
+        self._players_by_id = players_by_id
+        self._sorted_players = sorted(players, key=itemgetter('lastname'))
+        self._file_signature = signature
+        self._search_index = None
 
     def load_players(self):
-        """Load players from the JSON file.
+        """Load players from the JSON file, with the journal replayed after it.
 
         Returns:
-            List[dict]: A list of dictionaries containing player information loaded from the JSON file.
-                        If the file does not exist, an empty list is returned.
-        """
-        if not os.path.exists(self.filename):
-            return []
+            List[dict]: A list of dictionaries containing player information. If no player is stored, an
+                        empty list is returned.
 
-        with open(self.filename, 'r') as file:
-            players = json.load(file)
-        return players
+        Note:
+            The list is the repository cache itself and must not be modified by the caller.
+        """
+        self._refresh_cache()
+        return self._players
 
     def get_player_by_alphabetical_order(self):
         """Get players from the repository sorted alphabetically by last name.
@@ -55,31 +188,76 @@ class PlayerRepository:
                                    by last name.
 
         Note:
-            This method retrieves player data from the repository, sorts the players alphabetically
-            by last name, and returns a list of dictionaries.
+            The sorted index is maintained in memory, so no sort is performed on each call.
+        """
+        self._refresh_cache()
+        return self._sorted_players
+
+    def get_player_by_national_chess_id(self, national_chess_id):
+        """Get a player from the repository by national chess ID.
+
+        Returns:
+            dict: The player information, or None if no player has this national chess ID.
         """
-        players = self.load_players()
-        sorted_players = sorted(players, key=lambda x: x['lastname'])
-        return sorted_players
+        self._refresh_cache()
+        return self._players_by_id.get(national_chess_id)
 
     def add_player(self, player):
         """Add a player to the repository.
 
+        The player is appended to the journal, under the lock shared with the other processes.
+
+        Raises:
+            ConflictError: If a player with the same national chess ID was already added, possibly by
+                           another program.
         """
+        player_data = player.to_json()
+        with self._lock:
+            self._refresh_cache()
+            if player_data['national chess ID'] in self._players_by_id:
+                raise ConflictError(f"Un joueur a déjà l'identifiant national {player_data['national chess ID']}.",
+                                    player_data['national chess ID'])
+            self._append_to_journal(player_data)
+
+            self._players.append(player_data)
+            self._players_by_id[player_data['national chess ID']] = player_data
+            bisect.insort_right(self._sorted_players, player_data, key=itemgetter('lastname'))
+            if self._search_index is not None:
+                add_player_to_search_index(self._search_index, player_data)
+            self._file_signature = self._get_file_signature()
+            if os.path.getsize(self.journal_filename) > self.journal_threshold:
+                self.compact()
 
-        players = self.load_players()
-        players.append(player.to_json())
+    def _append_to_journal(self, player_data):
+        """Append one compact player record to the journal, and flush it to disk."""
+        line = json.dumps(player_data, separators=(',', ':')) + "\n"
+        with self._lock:
+            with open(self.journal_filename, 'a+b') as file:
+                # Ligne tronquée par un arrêt pendant une écriture : la terminer pour ne pas perdre la suivante
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        line = "\n" + line
+                file.write(line.encode("utf-8"))
+                file.flush()
+                os.fsync(file.fileno())
 
-        with open(self.filename, 'w') as file:
-            json.dump(players, file, indent=4)
+    def compact(self):
+        """Fold the journal into the JSON file, replaced atomically, and remove the journal."""
+        with self._lock:
+            if not os.path.exists(self.journal_filename):
+                return
+            self._refresh_cache()
+            with atomic_write(self.filename) as file:
+                write_json_array(file, self._players)
+            # Si le programme s'arrête ici, les joueurs du journal déjà présents dans le fichier sont ignorés
+            os.remove(self.journal_filename)
+            self._file_signature = self._get_file_signature()
 
-    def display_players_by_index(self):
-        """Get a player from the repository by index."""
-        sorted_players = self.get_player_by_alphabetical_order()
-        print("\nListe des joueurs triés par ordre alphabétique:")
-        for i, player_data in enumerate(sorted_players):
-            print(f"{i + 1} - {player_data['lastname']} {player_data['firstname']}")
-        return sorted_players
+    def _get_search_index(self):
+        """Return the search index of the players, rebuilt if the JSON file or the journal changed."""
+        self._refresh_cache()
+        return super()._get_search_index()
 
 
 if __name__ == "__main__":
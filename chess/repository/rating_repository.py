@@ -0,0 +1,223 @@
+import hashlib
+import os
+import json
+
+from datetime import datetime
+
+from model.rating import RatingEngine, completed_rounds
+from model.tournament import Tournament
+from repository.file_storage import atomic_write
+
+
+class RatingRepository:
+    """Cache of the Elo ratings computed from the matches of all tournaments.
+
+    The cache file, next to the tournament storage, keeps the ratings, the start time of the last rated round
+    and, for each tournament, the version last rated with a digest of the games of each rated round. A
+    tournament whose version did not change is skipped. Rounds completed since then are rated incrementally; a
+    round older than the last rated one (results entered late) or a rated round whose games changed (corrected
+    result) triggers a full replay, so that the ratings always follow the chronological order of the rounds.
+    """
+
+    def __init__(self, tournament_repository, filename=None):
+        """Initialize the RatingRepository.
+
+        Args:
+            tournament_repository: The repository of the tournaments whose matches are rated.
+            filename (str, optional): Path of the cache file. Defaults to the tournament storage file name
+                                      followed by '.ratings'.
+        """
+        self.tournament_repository = tournament_repository
+        self.filename = filename or tournament_repository.filename + '.ratings'
+        self._engine = None
+        # Par tournoi : {'version': version notée, 'rounds': {index du round: empreinte de ses parties}}
+        self._rated_rounds = {}
+        self._last_time = datetime.min
+        self._synchronized = False
+
+    def _load(self):
+        """Load the cache file, once."""
+        if self._engine is not None:
+            return
+        self._engine = RatingEngine()
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r') as file:
+                data = json.load(file)
+            engine = RatingEngine.from_json(data['players'])
+            rated_rounds = {name: {'version': rated['version'],
+                                   'rounds': {int(index): digest for index, digest in rated['rounds'].items()}}
+                            for name, rated in data['rated_rounds'].items()}
+            last_time = datetime.fromisoformat(data['last_time'])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Cache illisible ou d'un format précédent : il sera reconstruit
+            return
+        self._engine, self._rated_rounds, self._last_time = engine, rated_rounds, last_time
+
+    def _save(self):
+        data = {
+            'last_time': self._last_time.isoformat(),
+            'rated_rounds': self._rated_rounds,
+            'players': self._engine.to_json()
+        }
+        with atomic_write(self.filename) as file:
+            json.dump(data, file)
+
+    def _new_rounds(self, tournament):
+        """Return the completed rounds of a tournament which are not rated yet, as (time, name, index, games,
+        digest) tuples.
+
+        Returns:
+            list: The new rounds, or None if a rated round changed or is no longer completed since it was rated.
+        """
+        rated = self._rated_rounds.get(tournament.name)
+        if rated is not None and rated['version'] == tournament.version:
+            return []
+        rated_digests = rated['rounds'] if rated is not None else {}
+        new_rounds = []
+        completed = set()
+        for round_time, round_index, games in _dated_rounds(tournament):
+            digest = _digest(games)
+            if round_index not in rated_digests:
+                new_rounds.append((round_time, tournament.name, round_index, games, digest))
+            elif rated_digests[round_index] != digest:
+                return None
+            completed.add(round_index)
+        if not completed.issuperset(rated_digests):
+            return None
+        return new_rounds
+
+    def _collect(self, tournaments):
+        """Return the rounds to rate and the version of each tournament.
+
+        Returns:
+            tuple: (new_rounds, versions), or None if the ratings must be replayed from scratch.
+        """
+        new_rounds, versions = [], {}
+        for tournament in tournaments:
+            tournament_rounds = self._new_rounds(tournament)
+            if tournament_rounds is None:
+                return None
+            new_rounds.extend(tournament_rounds)
+            versions[tournament.name] = tournament.version
+        return new_rounds, versions
+
+    def _apply(self, new_rounds, versions):
+        """Rate rounds in chronological order and record the versions of the tournaments rated.
+
+        Returns:
+            bool: False if a round is older than the last rated one, in which case nothing is rated.
+        """
+        if any(round_time < self._last_time for round_time, _, _, _, _ in new_rounds):
+            return False
+        for round_time, name, round_index, games, digest in sorted(new_rounds, key=lambda new_round: new_round[:3]):
+            self._engine.apply_round(games)
+            self._rated_rounds.setdefault(name, {'version': None, 'rounds': {}})['rounds'][round_index] = digest
+            self._last_time = round_time
+        for name, version in versions.items():
+            self._rated_rounds.setdefault(name, {'version': None, 'rounds': {}})['version'] = version
+        return True
+
+    def _is_rated(self, versions):
+        """Return True if the tournaments are all rated at these versions."""
+        return all(name in self._rated_rounds and self._rated_rounds[name]['version'] == version
+                   for name, version in versions.items())
+
+    def _iter_tournaments(self, replaced=None):
+        """Yield all the tournaments of the repository, the given tournament replacing its stored version."""
+        for tournament_data in self.tournament_repository.iter_tournaments():
+            if replaced is not None and tournament_data['name'] == replaced.name:
+                continue
+            yield Tournament.from_json(tournament_data)
+        if replaced is not None:
+            yield replaced
+
+    def rebuild(self, tournament=None):
+        """Replay the matches of all tournaments from scratch and save the cache.
+
+        Args:
+            tournament (Tournament, optional): A tournament more recent than its stored version.
+        """
+        self._engine = RatingEngine()
+        self._rated_rounds = {}
+        self._last_time = datetime.min
+        self._apply(*self._collect(self._iter_tournaments(tournament)))
+        self._save()
+        self._synchronized = True
+
+    def refresh(self):
+        """Rate the rounds completed in the repository since the last update, and save the cache."""
+        self._load()
+        collected = self._collect(self._iter_tournaments())
+        if collected is None:
+            self.rebuild()
+            return
+        new_rounds, versions = collected
+        changed = bool(new_rounds) or not self._is_rated(versions)
+        if not self._apply(new_rounds, versions):
+            self.rebuild()
+            return
+        if changed or not os.path.exists(self.filename):
+            self._save()
+        self._synchronized = True
+
+    def update_tournament(self, tournament):
+        """Rate the rounds of a tournament completed since the last update, and save the cache.
+
+        Args:
+            tournament (Tournament): The tournament, possibly more recent than its stored version.
+        """
+        self._load()
+        collected = self._collect([tournament])
+        if collected is None:
+            self.rebuild(tournament)
+            return
+        new_rounds, versions = collected
+        if not new_rounds and self._is_rated(versions):
+            return
+        if not self._apply(new_rounds, versions):
+            self.rebuild(tournament)
+            return
+        self._save()
+
+    def get_ratings(self):
+        """Return a dictionary of the rating of each rated player, by national chess ID.
+
+        The cache is synchronized with the repository on the first call.
+        """
+        if not self._synchronized:
+            self.refresh()
+        return self._engine.get_ratings()
+
+    def get_rating(self, national_chess_id):
+        """Return the rating of a player, or the default rating without any rated game."""
+        if not self._synchronized:
+            self.refresh()
+        return self._engine.get_rating(national_chess_id)
+
+
+def _dated_rounds(tournament):
+    """Yield the completed rounds of a tournament as completed_rounds does, with a time for each of them.
+
+    A round without start time takes the time of the previous round of the tournament, or the start date of the
+    tournament: it keeps its place in the chronological order instead of coming before all the rated rounds,
+    which would replay all the ratings at each update.
+    """
+    try:
+        previous_time = datetime.strptime(tournament.date_start, "%d-%m-%Y")
+    except (TypeError, ValueError):
+        previous_time = datetime.min
+    for round_time, round_index, games in completed_rounds(tournament):
+        round_time = round_time or previous_time
+        previous_time = round_time
+        yield round_time, round_index, games
+
+
+def _digest(games):
+    """Return a digest of the games of a round, which changes when a result is corrected."""
+    return hashlib.blake2b(json.dumps(games).encode(), digest_size=8).hexdigest()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,42 @@
+"""
+This module selects the storage backend used by the application.
+
+The backend is chosen with the CHESS_STORAGE_BACKEND environment variable: 'json' (default) stores the
+data in the JSON files, 'sqlite' stores it in the SQLite database of the data directory.
+"""
+
+import os
+
+from repository.player_repository import PlayerRepository
+from repository.tournament_repository import TournamentRepository
+
+BACKENDS = ("json", "sqlite")
+
+
+def create_repositories(backend=None):
+    """Create the player and tournament repositories of the selected backend.
+
+    Args:
+        backend (str, optional): 'json' or 'sqlite'. Defaults to the CHESS_STORAGE_BACKEND environment
+                                 variable, or 'json' if it is not set.
+
+    Returns:
+        tuple: The player repository and the tournament repository.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend is None:
+        backend = os.environ.get("CHESS_STORAGE_BACKEND", "json")
+    backend = backend.lower()
+
+    if backend == "json":
+        return PlayerRepository(), TournamentRepository()
+    if backend == "sqlite":
+        from repository.sqlite_repository import SQLitePlayerRepository, SQLiteTournamentRepository
+        return SQLitePlayerRepository(), SQLiteTournamentRepository()
+    raise ValueError(f"Backend de stockage inconnu : {backend} (choix possibles : {', '.join(BACKENDS)})")
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,602 @@
+"""
+SQLite storage backend for players and tournaments.
+
+This module provides repositories with the same methods as the JSON repositories, backed by a single
+SQLite database with normalized tables for players, tournaments, rounds and matches. Status queries and
+single-tournament lookups run as indexed queries instead of parsing the whole archive.
+
+Classes:
+    - SQLitePlayerRepository: Stores the players in the `players` table.
+    - SQLiteTournamentRepository: Stores the tournaments, their rounds and their matches.
+
+Functions:
+    - import_json_archive: Imports the existing JSON files into the database.
+"""
+
+import os
+import sqlite3
+import threading
+
+from model.match import RESULT_CODES, RESULT_POINTS, result_from_scores
+from model.tournament_header import TournamentHeader
+from model.played_pairs import PlayedPairs
+from repository.player_history_index import posting_to_game, tournament_postings
+from repository.player_repository import BasePlayerRepository, PlayerRepository, add_player_to_search_index
+from repository.file_storage import ConflictError
+from repository.tournament_repository import (BaseTournamentRepository,
+                                              TournamentRepository,
+                                              build_tournament_details,
+                                              check_version,
+                                              normalize_tournament_name)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    national_chess_id TEXT NOT NULL UNIQUE,
+    firstname TEXT NOT NULL,
+    lastname TEXT NOT NULL,
+    birth TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_lastname ON players (lastname);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_key TEXT NOT NULL,
+    place TEXT NOT NULL,
+    date_start TEXT NOT NULL,
+    date_end TEXT NOT NULL,
+    director_note TEXT NOT NULL,
+    current_round INTEGER NOT NULL,
+    round_count INTEGER NOT NULL,
+    player_count INTEGER NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tournaments_name_key ON tournaments (name_key);
+CREATE INDEX IF NOT EXISTS idx_tournaments_current_round ON tournaments (current_round);
+
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    national_chess_id TEXT NOT NULL REFERENCES players (national_chess_id),
+    PRIMARY KEY (tournament_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_tournament_players_player ON tournament_players (national_chess_id);
+
+CREATE TABLE IF NOT EXISTS tournament_scores (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (tournament_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS played_pairs (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    player1_id TEXT NOT NULL REFERENCES players (national_chess_id),
+    player2_id TEXT NOT NULL REFERENCES players (national_chess_id),
+    PRIMARY KEY (tournament_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    UNIQUE (tournament_id, number)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    round_id INTEGER NOT NULL REFERENCES rounds (id) ON DELETE CASCADE,
+    board INTEGER NOT NULL,
+    player1_id TEXT REFERENCES players (national_chess_id),
+    player2_id TEXT REFERENCES players (national_chess_id),
+    result TEXT CHECK (result IN ('win', 'loss', 'draw')),
+    PRIMARY KEY (round_id, board)
+);
+
+CREATE TABLE IF NOT EXISTS player_games (
+    national_chess_id TEXT NOT NULL,
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    round_number INTEGER NOT NULL,
+    board INTEGER NOT NULL,
+    opponent_id TEXT NOT NULL,
+    opponent_name TEXT NOT NULL,
+    points REAL NOT NULL,
+    opponent_points REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_player_games_player ON player_games (national_chess_id, opponent_id);
+"""
+
+# Version du schéma : 1 = table player_games remplie pour les tournois existants,
+# 2 = colonne version des tournois, 3 = joueurs des matchs par identifiant national et résultat des matchs
+SCHEMA_VERSION = 3
+
+
+def connect(database):
+    """Open the database, creating the tables if needed.
+
+    Args:
+        database (str): Path of the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: The connection, with foreign keys enabled and rows accessible by column name.
+    """
+    # Connexion partagée par les threads du programme : chaque dépôt en sérialise l'usage avec son verrou
+    connection = sqlite3.connect(database, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _get_database_path(database):
+    """Return the path of the database file, relative to the data directory."""
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+    return os.path.join(data_dir, database)
+
+
+def _score(value):
+    """Return the score as an int when it has no fractional part, as in the JSON files."""
+    return int(value) if value == int(value) else value
+
+
+def _player_row_to_json(row):
+    return {
+        'firstname': row['firstname'],
+        'lastname': row['lastname'],
+        'birth': row['birth'],
+        'national chess ID': row['national_chess_id']
+    }
+
+
+class SQLitePlayerRepository(BasePlayerRepository):
+    """Repository storing the players in a SQLite database."""
+
+    def __init__(self, database='chess.db'):
+        """Initialize the SQLitePlayerRepository.
+
+        Args:
+            database (str, optional): Name of the SQLite database file. Defaults to 'chess.db'.
+        """
+        super().__init__()
+        self.filename = _get_database_path(database)
+        self._connection = connect(self.filename)
+        self._lock = threading.RLock()
+
+    def load_players(self):
+        """Load players in insertion order.
+
+        Returns:
+            List[dict]: A list of dictionaries containing player information.
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT * FROM players ORDER BY id").fetchall()
+        return [_player_row_to_json(row) for row in rows]
+
+    def get_player_by_alphabetical_order(self):
+        """Get players sorted alphabetically by last name, using the last name index.
+
+        Returns:
+            List[Dict[str, str]]: A list of dictionaries representing player information sorted alphabetically
+                                   by last name.
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT * FROM players ORDER BY lastname, id").fetchall()
+        return [_player_row_to_json(row) for row in rows]
+
+    def get_player_by_national_chess_id(self, national_chess_id):
+        """Get a player by national chess ID.
+
+        Returns:
+            dict: The player information, or None if no player has this national chess ID.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM players WHERE national_chess_id = ?",
+                                           (national_chess_id,)).fetchone()
+        return _player_row_to_json(row) if row else None
+
+    def add_player(self, player):
+        """Add a player to the repository.
+
+        Raises:
+            ConflictError: If a player with the same national chess ID was already added.
+        """
+        player_data = player.to_json()
+        with self._lock, self._connection:
+            if _insert_player(self._connection, player_data) == 0:
+                raise ConflictError(f"Un joueur a déjà l'identifiant national {player_data['national chess ID']}.",
+                                    player_data['national chess ID'])
+        if self._search_index is not None and player_data['national chess ID'] not in self._search_index:
+            add_player_to_search_index(self._search_index, player_data)
+
+
+def _insert_player(connection, player_data):
+    """Insert a player whose national chess ID is not known yet, and return the number of rows inserted."""
+    return connection.execute(
+        "INSERT OR IGNORE INTO players (national_chess_id, firstname, lastname, birth) VALUES (?, ?, ?, ?)",
+        (player_data['national chess ID'], player_data['firstname'], player_data['lastname'],
+         player_data['birth'])).rowcount
+
+
+class SQLiteTournamentRepository(BaseTournamentRepository):
+    """Repository storing the tournaments in a SQLite database."""
+
+    def __init__(self, database='chess.db'):
+        """Initialize the SQLiteTournamentRepository.
+
+        Args:
+            database (str, optional): Name of the SQLite database file. Defaults to 'chess.db'.
+        """
+        super().__init__()
+        self.filename = _get_database_path(database)
+        self._connection = connect(self.filename)
+        self._lock = threading.RLock()
+        self._migrate()
+
+    def _migrate(self):
+        """Fill the tables added since the database was created and convert those whose definition changed."""
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        with self._connection:
+            columns = {row['name'] for row in self._connection.execute("PRAGMA table_info(tournaments)")}
+            if 'version' not in columns:
+                self._connection.execute("ALTER TABLE tournaments ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            columns = {row['name'] for row in self._connection.execute("PRAGMA table_info(matches)")}
+            if 'player1_name' in columns:
+                _migrate_match_players(self._connection)
+            if version < 1:
+                for row in self._connection.execute("SELECT * FROM tournaments").fetchall():
+                    _insert_player_games(self._connection, row['id'], self._load_tournament_data(row))
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        # Index des tables reconstruites
+        self._connection.executescript(SCHEMA)
+
+    def _get_search_signature(self):
+        """Return the version of the database (changes by other connections) and the changes of this one."""
+        with self._lock:
+            data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+            return data_version, self._connection.total_changes
+
+    def _load_tournament_data(self, row):
+        """Rebuild the JSON-compatible dictionary of a tournament from its rows (called with the lock held)."""
+        connection = self._connection
+        tournament_id = row['id']
+
+        players_list = [_player_row_to_json(player_row) for player_row in connection.execute(
+            "SELECT players.* FROM tournament_players JOIN players USING (national_chess_id) "
+            "WHERE tournament_id = ? ORDER BY position", (tournament_id,))]
+        names_by_id = {player_data['national chess ID']: f"{player_data['firstname']} {player_data['lastname']}"
+                       for player_data in players_list}
+
+        rounds = []
+        for round_row in connection.execute("SELECT * FROM rounds WHERE tournament_id = ? ORDER BY number",
+                                            (tournament_id,)).fetchall():
+            matches = []
+            for match_row in connection.execute("SELECT * FROM matches WHERE round_id = ? ORDER BY board",
+                                                (round_row['id'],)):
+                # Même forme que Match.to_json : les points découlent du résultat
+                player_ids = [match_row['player1_id'], match_row['player2_id']]
+                points = RESULT_POINTS[RESULT_CODES[match_row['result']]]
+                matches.append({
+                    "players": {names_by_id[player_id]: player_points
+                                for player_id, player_points in zip(player_ids, points) if player_id is not None},
+                    "player_ids": player_ids,
+                    "result": match_row['result']
+                })
+            rounds.append({
+                "name": round_row['name'],
+                "matches": matches,
+                "start_time": round_row['start_time'],
+                "end_time": round_row['end_time']
+            })
+
+        players_score = {score_row['player_name']: _score(score_row['score']) for score_row in connection.execute(
+            "SELECT player_name, score FROM tournament_scores WHERE tournament_id = ? ORDER BY position",
+            (tournament_id,))}
+
+        played_pairs = [[pair_row['player1_id'], pair_row['player2_id']] for pair_row in connection.execute(
+            "SELECT player1_id, player2_id FROM played_pairs WHERE tournament_id = ? ORDER BY position",
+            (tournament_id,))]
+
+        return {
+            'name': row['name'],
+            'place': row['place'],
+            'date_start': row['date_start'],
+            'date_end': row['date_end'],
+            'director_note': row['director_note'],
+            'rounds': rounds,
+            'current_round': row['current_round'],
+            'players_score': players_score,
+            'played_pairs': played_pairs,
+            'players_list': players_list,
+            'version': row['version']
+        }
+
+    def _query_tournaments(self, where="", parameters=()):
+        with self._lock:
+            rows = self._connection.execute(f"SELECT * FROM tournaments {where} ORDER BY id", parameters).fetchall()
+            return [self._load_tournament_data(row) for row in rows]
+
+    def load_tournaments(self):
+        """Load all tournaments from the database.
+
+        Returns:
+            List[dict]: A list of dictionaries containing tournament information.
+        """
+        return self._query_tournaments()
+
+    def iter_tournaments(self):
+        """Yield the tournaments one at a time, in insertion order.
+
+        Yields:
+            dict: The tournament data.
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT * FROM tournaments ORDER BY id").fetchall()
+        for row in rows:
+            with self._lock:
+                tournament_data = self._load_tournament_data(row)
+            yield tournament_data
+
+    def _query_headers(self, where="", order_by="id"):
+        with self._lock:
+            rows = self._connection.execute(f"SELECT * FROM tournaments {where} ORDER BY {order_by}").fetchall()
+        return [TournamentHeader(row['name'], row['place'], row['date_start'], row['date_end'],
+                                 row['current_round'], row['round_count'], row['player_count'], row['version'])
+                for row in rows]
+
+    def get_tournament_headers(self):
+        """Get the headers of all tournaments, without loading their rounds.
+
+        Returns:
+            List[TournamentHeader]: The headers, in insertion order.
+        """
+        return self._query_headers()
+
+    def get_tournaments_by_alphabetical_order(self):
+        """Get tournaments sorted alphabetically by name, without loading their rounds.
+
+        Returns:
+            List[TournamentHeader]: The headers of the tournaments sorted alphabetically by name.
+        """
+        return self._query_headers(order_by="name")
+
+    def get_tournament(self, tournament_name):
+        """Load the full data of a tournament.
+
+        Args:
+            tournament_name (str): The exact name of the tournament.
+
+        Returns:
+            dict: The tournament data, or None if no tournament has this name.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM tournaments WHERE name = ?", (tournament_name,)).fetchone()
+            return self._load_tournament_data(row) if row else None
+
+    def add_tournament(self, tournament):
+        """Add or update a tournament in the repository.
+
+        Args:
+            tournament (Tournament): The tournament object to be added to the repository. Its version is
+                                     incremented when the save succeeds.
+
+        Raises:
+            ConflictError: If the tournament was saved by another writer since it was loaded.
+        """
+        tournament_data = self._tournament_to_data(tournament)
+        tournament_data['version'] = tournament.version + 1
+        self.save_tournament_data(tournament_data, tournament)
+        tournament.version += 1
+
+    def save_tournament_data(self, tournament_data, tournament=None):
+        """Add or update a tournament from its JSON-compatible dictionary.
+
+        Args:
+            tournament_data (dict): The data of the tournament.
+            tournament (Tournament, optional): The tournament saved, whose version is checked against the
+                                               stored one in the same transaction as the write.
+        """
+        connection = self._connection
+        with self._lock, connection:
+            # Verrou d'écriture pris dès la lecture de la version : aucun autre écrivain ne peut s'intercaler
+            connection.execute("BEGIN IMMEDIATE")
+            if tournament is not None:
+                row = connection.execute("SELECT version FROM tournaments WHERE name = ?",
+                                         (tournament_data['name'],)).fetchone()
+                check_version(TournamentHeader(tournament_data['name'], "", "", "", version=row['version'])
+                              if row else None, tournament)
+            connection.execute(
+                "INSERT INTO tournaments (name, name_key, place, date_start, date_end, director_note, "
+                "current_round, round_count, player_count, version) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET name_key = excluded.name_key, place = excluded.place, "
+                "date_start = excluded.date_start, date_end = excluded.date_end, "
+                "director_note = excluded.director_note, current_round = excluded.current_round, "
+                "round_count = excluded.round_count, player_count = excluded.player_count, "
+                "version = excluded.version",
+                (tournament_data['name'], normalize_tournament_name(tournament_data['name']),
+                 tournament_data['place'], tournament_data['date_start'], tournament_data['date_end'],
+                 tournament_data['director_note'], tournament_data['current_round'],
+                 len(tournament_data['rounds']), len(tournament_data['players_list']),
+                 tournament_data.get('version', 0)))
+            tournament_id = connection.execute("SELECT id FROM tournaments WHERE name = ?",
+                                               (tournament_data['name'],)).fetchone()['id']
+
+            # Remplacer les lignes dépendantes du tournoi
+            for table in ("tournament_players", "tournament_scores", "played_pairs", "rounds", "player_games"):
+                connection.execute(f"DELETE FROM {table} WHERE tournament_id = ?", (tournament_id,))
+
+            ids_by_name = {}
+            for position, player_data in enumerate(tournament_data['players_list']):
+                _insert_player(connection, player_data)
+                connection.execute("INSERT INTO tournament_players VALUES (?, ?, ?)",
+                                   (tournament_id, position, player_data['national chess ID']))
+                ids_by_name[f"{player_data['firstname']} {player_data['lastname']}"] = \
+                    player_data['national chess ID']
+
+            connection.executemany("INSERT INTO tournament_scores VALUES (?, ?, ?, ?)",
+                                   [(tournament_id, position, player_name, score) for position, (player_name, score)
+                                    in enumerate(tournament_data['players_score'].items())])
+
+            played_pairs = PlayedPairs.from_json(tournament_data.get('played_pairs', []))
+            connection.executemany("INSERT INTO played_pairs VALUES (?, ?, ?, ?)",
+                                   [(tournament_id, position, player1_id, player2_id)
+                                    for position, (player1_id, player2_id) in enumerate(played_pairs)])
+
+            for number, round_data in enumerate(tournament_data['rounds']):
+                round_id = connection.execute(
+                    "INSERT INTO rounds (tournament_id, number, name, start_time, end_time) VALUES (?, ?, ?, ?, ?)",
+                    (tournament_id, number, round_data['name'], round_data.get('start_time'),
+                     round_data.get('end_time'))).lastrowid
+                matches = [(round_id, board, *_match_player_ids(match_data, ids_by_name), _match_result(match_data))
+                           for board, match_data in enumerate(round_data['matches'])]
+                connection.executemany("INSERT INTO matches VALUES (?, ?, ?, ?, ?)", matches)
+
+            _insert_player_games(connection, tournament_id, tournament_data)
+
+    def _query_games(self, where, parameters):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT tournaments.name, player_games.* FROM player_games "
+                "JOIN tournaments ON tournaments.id = player_games.tournament_id "
+                f"WHERE {where} ORDER BY tournaments.id, round_number, board", parameters).fetchall()
+        return [posting_to_game(row['name'], [row['round_number'], row['board'], row['opponent_id'],
+                                              row['opponent_name'], _score(row['points']),
+                                              _score(row['opponent_points'])])
+                for row in rows]
+
+    def get_player_history(self, national_chess_id):
+        """Get the games of a player in all tournaments, using the player_games index.
+
+        Returns:
+            List[dict]: The games, by tournament then in the order played.
+        """
+        return self._query_games("player_games.national_chess_id = ?", (national_chess_id,))
+
+    def get_head_to_head(self, player1_id, player2_id):
+        """Get the games of a player against another one, in all tournaments.
+
+        Returns:
+            List[dict]: The games, seen from the first player.
+        """
+        return self._query_games("player_games.national_chess_id = ? AND opponent_id = ?", (player1_id, player2_id))
+
+    def find_unfinished_tournaments(self):
+        """Get the headers of the tournaments which have players and rounds left to play."""
+        return self._query_headers("WHERE current_round < round_count AND (current_round != 0 OR player_count > 0)")
+
+    def find_unstarted_tournaments(self):
+        """Get the headers of the tournaments whose first round has not been played."""
+        return self._query_headers("WHERE current_round = 0")
+
+    def get_tournament_details(self, tournament_name):
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM tournaments WHERE name_key = ?",
+                                           (normalize_tournament_name(tournament_name),)).fetchone()
+            if row is None:
+                return None
+            tournament_data = self._load_tournament_data(row)
+        return build_tournament_details(tournament_data)
+
+
+def _match_player_ids(match_data, ids_by_name):
+    """Return the national chess IDs of the two players of a match, None for a missing player.
+
+    The matches saved before the IDs were recorded name their players: they are found by full name.
+    """
+    if "player_ids" in match_data:
+        return match_data["player_ids"]
+    player_ids = [ids_by_name.get(player_name) for player_name in match_data['players']]
+    return (player_ids + [None, None])[:2]
+
+
+def _match_result(match_data):
+    """Return the result of a match, taken from the scores in the files which did not record it."""
+    if "result" in match_data:
+        return match_data["result"]
+    return result_from_scores(list(match_data['players'].values()))
+
+
+def _migrate_match_players(connection):
+    """Convert the tables of a database created before the schema version 3.
+
+    The players of the matches, stored by full name with their scores, are stored by national chess ID with
+    the result of the match, and the tournament players only keep their national chess ID (their names are
+    those of the players table).
+    """
+    # Joueurs inscrits absents de la table players : y sont ajoutés avant que leurs colonnes disparaissent
+    connection.execute("INSERT OR IGNORE INTO players (national_chess_id, firstname, lastname, birth) "
+                       "SELECT national_chess_id, firstname, lastname, birth FROM tournament_players "
+                       "ORDER BY tournament_id, position")
+    ids_by_name = {}
+    for row in connection.execute("SELECT * FROM tournament_players ORDER BY tournament_id, position"):
+        ids_by_name.setdefault(row['tournament_id'], {})[f"{row['firstname']} {row['lastname']}"] = \
+            row['national_chess_id']
+
+    matches = []
+    for row in connection.execute("SELECT rounds.tournament_id, matches.* FROM matches "
+                                  "JOIN rounds ON rounds.id = matches.round_id").fetchall():
+        players = {row[name_column]: _score(row[score_column])
+                   for name_column, score_column in (('player1_name', 'score1'), ('player2_name', 'score2'))
+                   if row[name_column] is not None}
+        match_data = {"players": players}
+        matches.append((row['round_id'], row['board'],
+                        *_match_player_ids(match_data, ids_by_name.get(row['tournament_id'], {})),
+                        _match_result(match_data)))
+
+    # Tables recréées avec leur nouvelle définition, que le schéma complète ensuite de ses index
+    connection.execute("DROP TABLE matches")
+    connection.execute("ALTER TABLE tournament_players RENAME TO tournament_players_v2")
+    for statement in SCHEMA.split(";"):
+        if "CREATE TABLE IF NOT EXISTS matches" in statement or \
+                "CREATE TABLE IF NOT EXISTS tournament_players" in statement:
+            connection.execute(statement)
+    connection.execute("INSERT INTO tournament_players SELECT tournament_id, position, national_chess_id "
+                       "FROM tournament_players_v2")
+    connection.execute("DROP TABLE tournament_players_v2")
+    connection.executemany("INSERT INTO matches VALUES (?, ?, ?, ?, ?)", matches)
+
+
+def _insert_player_games(connection, tournament_id, tournament_data):
+    """Insert the games of each player of a tournament in the player_games index."""
+    connection.executemany(
+        "INSERT INTO player_games VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [(national_chess_id, tournament_id, *posting)
+         for national_chess_id, postings in tournament_postings(tournament_data).items() for posting in postings])
+
+
+def import_json_archive(players_filename='players.json', tournaments_filename='tournament.json',
+                        database='chess.db'):
+    """Import the players and tournaments of the JSON files into the SQLite database.
+
+    Args:
+        players_filename (str, optional): Name of the JSON file of players. Defaults to 'players.json'.
+        tournaments_filename (str, optional): Name of the JSON file of tournaments. Defaults to 'tournament.json'.
+        database (str, optional): Name of the SQLite database file. Defaults to 'chess.db'.
+
+    Returns:
+        tuple: The number of players and the number of tournaments imported.
+    """
+    players = PlayerRepository(players_filename).load_players()
+    tournaments = TournamentRepository(tournaments_filename).load_tournaments()
+
+    player_repository = SQLitePlayerRepository(database)
+    with player_repository._connection as connection:
+        for player_data in players:
+            _insert_player(connection, player_data)
+
+    tournament_repository = SQLiteTournamentRepository(database)
+    for tournament_data in tournaments:
+        tournament_repository.save_tournament_data(tournament_data)
+
+    return len(players), len(tournaments)
+
+
+if __name__ == "__main__":
+    players_count, tournaments_count = import_json_archive()
+    print(f"{players_count} joueurs et {tournaments_count} tournois importés.")
@@ -1,65 +1,85 @@
 import os
 import json
+import pickle
+import threading
 
 from typing import List
-from unidecode import unidecode
 
-from model.tournament import Tournament
+from model.tournament_header import TournamentHeader
+from repository.file_storage import ConflictError, atomic_write, get_file_lock
+from repository.player_history_index import PlayerHistoryIndex, tournament_postings
+from utils.json_stream import iter_json_array, write_json_array
+from utils.search_index import SearchIndex
 
+# En-tête du fichier binaire : le format est vérifié avant de lire les tournois
+BINARY_SNAPSHOT_HEADER = {"format": "chess-tournaments", "version": 1}
 
-class TournamentRepository:
-    """Repository for managing tournament data storage and retrieval."""
 
-    def __init__(self, filename='tournament.json'):
-        """Initialize the TournamentRepository.
+class BaseTournamentRepository:
+    """Part of the tournament repositories which does not depend on the storage.
 
-        Args:
-            filename (str, optional): Name of the JSON file to store tournament data. Defaults to 'tournament.json'.
-        """
-        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-        self.filename = os.path.join(data_dir, filename)
+    The search in the tournament names, the lists of unstarted and unfinished tournaments and the details of
+    a tournament rely on the methods each storage provides: iter_tournaments, get_tournament_headers,
+    get_tournaments_by_alphabetical_order, add_tournament, get_player_history, get_head_to_head and
+    _get_search_signature (a value which changes whenever the tournaments are modified).
+    """
+
+    def __init__(self):
+        self._search_index = None
+        self._search_signature = None
 
     def load_tournaments(self):
-        """Load tournaments from the JSON file.
+        """Load all the tournaments.
 
-       Returns:
-           List[dict]: A list of dictionaries containing tournament information loaded from the JSON file.
-                       If the file does not exist, an empty list is returned.
-       """
-        if not os.path.exists(self.filename):
-            return []
+        Returns:
+            List[dict]: A list of dictionaries containing tournament information. If no tournament is stored,
+                        an empty list is returned.
+        """
+        return list(self.iter_tournaments())
 
-        with open(self.filename, 'r') as file:
-            tournaments = json.load(file)
-        return tournaments
+    def _get_search_index(self):
+        """Return the search index of the tournament headers, rebuilding it if the tournaments changed."""
+        signature = self._get_search_signature()
+        if self._search_index is None or signature != self._search_signature:
+            self._search_index = SearchIndex.build((header.name, header, (header.name,))
+                                                   for header in self.get_tournament_headers())
+            self._search_signature = signature
+        return self._search_index
 
-    def get_tournaments_by_alphabetical_order(self):
-        """Get tournaments from the repository sorted alphabetically by name.
+    def search_tournaments(self, query, limit=None):
+        """Search tournaments by name, ignoring accents and case.
 
-        Returns:
-            List[str]: A list of tournament names sorted alphabetically.
+        Args:
+            query (str): The beginning or a part of the name.
+            limit (int, optional): Maximum number of tournaments returned.
 
-        Note:
-            This method retrieves tournament data from the repository, sorts the tournaments alphabetically
-            by name, and returns a list of tournament names.
+        Returns:
+            List[TournamentHeader]: The headers of the matching tournaments, those whose name starts with
+                                    the query first.
         """
-        tournaments = self.load_tournaments()
-        sorted_tournaments = sorted(tournaments, key=lambda x: x['name'])
-        formatted_output = []
-        for tournament_data in sorted_tournaments:
-            tournament = Tournament(**tournament_data)
-            formatted_output.append(tournament)
+        return self._get_search_index().search(query, limit)
 
-        return formatted_output
+    def find_tournament_by_name(self, tournament_name):
+        """Return the header of the tournament with this name, accents and case ignored, or None."""
+        headers = self._get_search_index().find_exact(tournament_name)
+        return headers[0] if headers else None
 
-    def add_tournament(self, tournament):
-        """Add a tournament to the repository.
+    def get_tournament(self, tournament_name):
+        """Load the full data of a tournament.
 
         Args:
-            tournament (Tournament): The tournament object to be added to the repository.
+            tournament_name (str): The exact name of the tournament.
 
+        Returns:
+            dict: The tournament data, or None if no tournament has this name.
         """
-        tournaments = self.load_tournaments()
+        for tournament_data in self.iter_tournaments():
+            if tournament_data["name"] == tournament_name:
+                return tournament_data
+        return None
+
+    def _tournament_to_data(self, tournament):
+        """Convert a tournament into the dictionary stored in the repository."""
         tournament_data = tournament.to_json()
 
         # Convertir les joueurs en JSON
@@ -69,15 +89,6 @@ class TournamentRepository:
             players_json.append(player_json)
         tournament_data["players_list"] = players_json
 
-        # Convertir les paires jouées en JSON
-        played_pairs_json = []
-        for pair in tournament.played_pairs:
-            player1_json = pair[0].to_json()
-            player2_json = pair[1].to_json()
-            played_pair_json = {"player1": player1_json, "player2": player2_json}
-            played_pairs_json.append(played_pair_json)
-        tournament_data["played_pairs"] = played_pairs_json
-
         # Convertir les rounds en JSON
         rounds_json = []
         for round in tournament.rounds:
@@ -85,16 +96,7 @@ class TournamentRepository:
             rounds_json.append(round_json)
         tournament_data["rounds"] = rounds_json
 
-        # Recherchez le tournoi existant et mettez à jour ses données s'il existe déjà
-        for i, existing_tournament in enumerate(tournaments):
-            if existing_tournament["name"] == tournament.name:
-                tournaments[i] = tournament_data
-                break
-        else:
-            tournaments.append(tournament_data)
-
-        with open(self.filename, 'w') as file:
-            json.dump(tournaments, file, indent=4)
+        return tournament_data
 
     def resume_unstarted_tournament(self):
         unstarted_tournaments = self.find_unstarted_tournaments()
@@ -103,23 +105,15 @@ class TournamentRepository:
             return
         print("\nTournois non débuté :")
         for idx, tournament in enumerate(unstarted_tournaments, 1):
-            print(f"{idx}. {tournament['name']} à {tournament['place']}")
+            print(f"{idx}. {tournament.name} à {tournament.place}")
         choice = int(input("Choisissez le numéro du tournoi dont vous souhaitez renseigner les joueurs : "))
         chosen_tournament = unstarted_tournaments[choice - 1]
-        print(f"\nVous avez choisi le tournoi {chosen_tournament['name']} à {chosen_tournament['place']}")
-        return chosen_tournament
+        print(f"\nVous avez choisi le tournoi {chosen_tournament.name} à {chosen_tournament.place}")
+        return self.get_tournament(chosen_tournament.name)
 
     def find_unfinished_tournaments(self):
-        tournaments = self.load_tournaments()
-        unfinished_tournaments = []
-
-        for tournament in tournaments:
-            round_count = len(tournament["rounds"])
-            round_count = int(round_count)
-            if (tournament["current_round"] < round_count and
-                    (tournament["current_round"] != 0 or len(tournament["players_list"]) > 0)):
-                unfinished_tournaments.append(tournament)
-        return unfinished_tournaments
+        """Get the headers of the tournaments which have players and rounds left to play."""
+        return [header for header in self.get_tournament_headers() if header.is_unfinished()]
 
     def resume_tournament(self):
         unfinished_tournaments = self.find_unfinished_tournaments()
@@ -128,59 +122,526 @@ class TournamentRepository:
             return
         print("\nTournois non terminés :")
         for idx, tournament in enumerate(unfinished_tournaments, 1):
-            print(f"{idx}. {tournament['name']} à {tournament['place']}")
+            print(f"{idx}. {tournament.name} à {tournament.place}")
         choice = int(input("Choisissez le numéro du tournoi à reprendre : "))
         chosen_tournament = unfinished_tournaments[choice - 1]
-        print(f"\nVous avez choisi de reprendre le tournoi {chosen_tournament['name']} à {chosen_tournament['place']}")
-        return chosen_tournament
+        print(f"\nVous avez choisi de reprendre le tournoi {chosen_tournament.name} à {chosen_tournament.place}")
+        return self.get_tournament(chosen_tournament.name)
 
     def find_unstarted_tournaments(self):
-        tournaments = self.load_tournaments()
-        unstarted_tournaments = []
-
-        for tournament in tournaments:
-            if tournament["current_round"] == 0:
-                unstarted_tournaments.append(tournament)
-        return unstarted_tournaments
+        """Get the headers of the tournaments whose first round has not been played."""
+        return [header for header in self.get_tournament_headers() if header.is_unstarted()]
 
     def get_tournament_details(self, tournament_name):
-        for tournament_data in self.load_tournaments():
-            tournament_name_normalized = unidecode(tournament_data['name'].title())
-            if tournament_name_normalized == unidecode(tournament_name.title()):
-                tournament_details = {
-                    "name": tournament_data["name"],
-                    "place": tournament_data["place"],
-                    "date_start": tournament_data["date_start"],
-                    "date_end": tournament_data["date_end"],
-                    "director_note": tournament_data["director_note"],
-                    "players_score": tournament_data['players_score'],
-                    "rounds": tournament_data['rounds'],
-                    "players_list": tournament_data['players_list']
-                }
-                current_round = tournament_data['current_round']
-                rounds_count = len(tournament_data['rounds'])
-                if current_round + 1 == rounds_count:
-                    tournament_details["tournament_status"] = " Tournoi terminé"
-                else:
-                    tournament_details["tournament_status"] = f"Round actuel : {current_round + 1} sur {rounds_count}"
-
-                # Créer une nouvelle liste pour stocker les détails des rounds joués
-                played_rounds_details = []
-
-                # Ajout des détails des rounds joués
-                for idx, round_data in enumerate(tournament_data['rounds']):
-                    round_details = {
-                        "name": round_data['name'],
-                        "start_time": round_data.get('start_time', None),
-                        "end_time": round_data.get('end_time', None),
-                        "matches": round_data.get('matches', [])
-                    }
-                    played_rounds_details.append(round_details)
-
-                tournament_details["played_rounds"] = played_rounds_details
-                return tournament_details
-        return None
+        header = self.find_tournament_by_name(tournament_name)
+        if header is None:
+            return None
+        tournament_data = self.get_tournament(header.name)
+        return build_tournament_details(tournament_data) if tournament_data else None
+
+    def preload(self):
+        """Build the search index of the tournament names, so that the first search of the session does not
+        have to read the tournaments."""
+        self._get_search_index()
+
+
+class TournamentRepository(BaseTournamentRepository):
+    """Repository for managing tournament data storage and retrieval.
+
+    In journal mode, each save appends one compact record to a journal file next to the JSON snapshot.
+    Reads replay the journal over the snapshot, and the journal is folded back into the snapshot in a
+    background thread once it grows past `journal_threshold` bytes.
+
+    A header index (name, place, dates, progress, player count) is maintained next to the snapshot, so
+    the tournament lists do not load the rounds and matches of every tournament. The headers are also kept
+    in memory in a search index on the normalized tournament names.
+
+    The games of each player are kept in an inverted index (see PlayerHistoryIndex), updated on each save.
+
+    An optional binary snapshot (pickle, one record per tournament) is written next to the JSON snapshot each
+    time the JSON snapshot is rewritten. It is read instead of the JSON file when it is newer, as parsing it is
+    much faster; the JSON file remains the reference and the export format.
+
+    The writes hold an advisory lock shared with the other processes, and the files are replaced atomically.
+    Each tournament has a version number, incremented on each save: saving a tournament which was saved by
+    another writer since it was loaded raises a ConflictError instead of overwriting the other changes.
+    """
+
+    def __init__(self, filename='tournament.json', use_journal=True, journal_threshold=1024 * 1024,
+                 use_binary_snapshot=True):
+        """Initialize the TournamentRepository.
+
+        Args:
+            filename (str, optional): Name of the JSON file to store tournament data. Defaults to 'tournament.json'.
+            use_journal (bool, optional): Append saves to a journal instead of rewriting the JSON file.
+                                          Defaults to True.
+            journal_threshold (int, optional): Journal size in bytes above which it is compacted into the
+                                               JSON file. Defaults to 1 MiB.
+            use_binary_snapshot (bool, optional): Keep a binary copy of the JSON snapshot and read it instead of
+                                                  the JSON file. Defaults to True.
+        """
+        super().__init__()
+        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+        self.filename = os.path.join(data_dir, filename)
+        self.journal_filename = self.filename + '.journal'
+        self.index_filename = self.filename + '.index'
+        self.history_filename = self.filename + '.history'
+        self.binary_filename = self.filename + '.pickle'
+        self.use_binary_snapshot = use_binary_snapshot
+        self.use_journal = use_journal
+        self.journal_threshold = journal_threshold
+        self._lock = get_file_lock(self.filename)
+        self._background_thread = None
+        self._headers = None
+        self._headers_signature = None
+        self._sorted_headers = None
+        self._history_index = None
+
+    def _iter_snapshot(self):
+        """Yield the tournaments stored in the snapshot, one at a time.
+
+        The binary snapshot is read if it is newer than the JSON file; otherwise the JSON file is read, and
+        the binary snapshot is rebuilt in the background.
+        """
+        if not os.path.exists(self.filename):
+            return
+
+        if self.use_binary_snapshot:
+            binary_file = self._open_binary_snapshot()
+            if binary_file is not None:
+                with binary_file:
+                    yield from iter_binary_records(binary_file)
+                return
+            self._start_background_task(self.write_binary_snapshot, "tournament-binary-snapshot")
+
+        with open(self.filename, 'r') as file:
+            yield from iter_json_array(file)
+
+    def _binary_snapshot_is_current(self):
+        """Return True if the binary snapshot was written after the JSON snapshot."""
+        try:
+            return os.stat(self.binary_filename).st_mtime_ns >= os.stat(self.filename).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+    def _open_binary_snapshot(self):
+        """Open the binary snapshot and read its header.
 
+        Returns:
+            file: The file, positioned on the first tournament, or None if the snapshot is missing, out of date
+                  or in another format.
+        """
+        if not self._binary_snapshot_is_current():
+            return None
+        file = open(self.binary_filename, 'rb')
+        try:
+            header = pickle.load(file)
+        except Exception:
+            # Fichier tronqué ou illisible : le fichier JSON sera lu à sa place
+            header = None
+        if header != BINARY_SNAPSHOT_HEADER:
+            file.close()
+            return None
+        return file
+
+    def write_binary_snapshot(self):
+        """Write the binary snapshot from the JSON snapshot, if it is missing or out of date."""
+        with self._lock:
+            if not os.path.exists(self.filename):
+                return
+            binary_file = self._open_binary_snapshot()
+            if binary_file is not None:
+                binary_file.close()
+                return
+            with atomic_write(self.binary_filename, 'wb') as binary_file:
+                with open(self.filename, 'r') as file:
+                    for _ in write_binary_records(binary_file, iter_json_array(file)):
+                        pass
+
+    def _write_snapshot(self, tournaments):
+        """Write the JSON snapshot, and the binary snapshot in the same pass over the tournaments."""
+        if not self.use_binary_snapshot:
+            with atomic_write(self.filename) as file:
+                write_json_array(file, tournaments)
+            return
+        # Le fichier binaire est remplacé après le fichier JSON, il est donc plus récent que lui
+        with atomic_write(self.binary_filename, 'wb') as binary_file:
+            with atomic_write(self.filename) as file:
+                write_json_array(file, write_binary_records(binary_file, tournaments))
+
+    def _load_journal(self):
+        """Load the tournament records appended to the journal, in order.
+
+        A truncated line (interrupted write) is skipped, the records appended after it are still read.
+        """
+        if not os.path.exists(self.journal_filename):
+            return []
+
+        records = []
+        with open(self.journal_filename, 'r', encoding="utf-8") as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+
+    def iter_tournaments(self):
+        """Yield the tournaments one at a time, with the journal replayed over the JSON file.
+
+        The JSON file is read incrementally, so only one tournament of the snapshot is in memory at a time
+        and a search can stop as soon as it finds its tournament.
+
+        Yields:
+            dict: The tournament data, in storage order.
+        """
+        # Dernière version de chaque tournoi présent dans le journal
+        journal = {}
+        for tournament_data in self._load_journal():
+            journal[tournament_data["name"]] = tournament_data
+
+        for tournament_data in self._iter_snapshot():
+            yield journal.pop(tournament_data["name"], tournament_data)
+        yield from journal.values()
+
+    def compact(self):
+        """Fold the journal into the JSON snapshot and empty the journal."""
+        with self._lock:
+            if not os.path.exists(self.journal_filename):
+                return
+            history_index = self._get_current_history_index()
+            headers = self._load_headers()
+            self._write_snapshot(self.iter_tournaments())
+            # Si le programme s'arrête ici, rejouer le journal sur le nouveau fichier donne le même résultat
+            os.remove(self.journal_filename)
+            self._save_headers(headers)
+            if history_index is not None:
+                history_index.save(self._get_source_signature())
+
+    def _start_background_task(self, target, name):
+        """Start a background task (compaction, binary snapshot) if none is already running."""
+        if self._background_thread is not None and self._background_thread.is_alive():
+            return
+        self._background_thread = threading.Thread(target=target, name=name)
+        self._background_thread.start()
+
+    def _schedule_compaction(self):
+        """Start a background compaction if no background task is already running."""
+        self._start_background_task(self.compact, "tournament-compaction")
+
+    def wait_for_compaction(self):
+        """Wait for the end of the background compaction or binary snapshot, if one is running."""
+        if self._background_thread is not None:
+            self._background_thread.join()
+
+    def _append_to_journal(self, tournament_data):
+        """Append one compact tournament record to the journal, and flush it to disk.
+
+        A crash during the write leaves at most a truncated last line, which is skipped when reading.
+        """
+        line = json.dumps(tournament_data, separators=(',', ':')) + "\n"
+        with self._lock:
+            with open(self.journal_filename, 'a+b') as file:
+                # Ligne tronquée par un arrêt pendant une écriture : la terminer pour ne pas perdre la suivante
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        line = "\n" + line
+                file.write(line.encode("utf-8"))
+                file.flush()
+                os.fsync(file.fileno())
+
+    def _get_source_signature(self):
+        """Return the modification times and sizes of the snapshot and the journal."""
+        signature = []
+        for filename in (self.filename, self.journal_filename):
+            try:
+                stat = os.stat(filename)
+                signature.extend([stat.st_mtime_ns, stat.st_size])
+            except FileNotFoundError:
+                signature.extend([None, None])
+        return signature
+
+    def _load_headers(self):
+        """Load the header index, rebuilding it if it is missing or out of date.
+
+        The headers are kept in memory, and the index file is only read again when the tournaments change.
+
+        Returns:
+            Dict[str, TournamentHeader]: The headers of the tournaments, by name (a copy, which the caller
+                                         may modify).
+        """
+        with self._lock:
+            signature = self._get_source_signature()
+            if self._headers is not None and self._headers_signature == signature:
+                return dict(self._headers)
+
+            if os.path.exists(self.index_filename):
+                with open(self.index_filename, 'r') as file:
+                    index_data = json.load(file)
+                if index_data["signature"] == signature:
+                    self._headers = {header_data["name"]: TournamentHeader.from_json(header_data)
+                                     for header_data in index_data["headers"]}
+                    self._headers_signature = signature
+                    return dict(self._headers)
+
+            headers = {tournament_data["name"]: TournamentHeader.from_tournament_data(tournament_data)
+                       for tournament_data in self.iter_tournaments()}
+            self._save_headers(headers)
+            return dict(headers)
+
+    def _save_headers(self, headers):
+        """Write the header index, tagged with the current signature of the snapshot and the journal."""
+        index_data = {
+            "signature": self._get_source_signature(),
+            "headers": [header.to_json() for header in headers.values()]
+        }
+        with atomic_write(self.index_filename) as file:
+            json.dump(index_data, file)
+        self._headers = dict(headers)
+        self._headers_signature = index_data["signature"]
+
+    def get_tournament_headers(self):
+        """Get the headers of all tournaments from the header index.
+
+        Returns:
+            List[TournamentHeader]: The headers, in storage order.
+        """
+        return list(self._load_headers().values())
+
+    def get_tournaments_by_alphabetical_order(self):
+        """Get tournaments from the repository sorted alphabetically by name.
+
+        Returns:
+            List[TournamentHeader]: The headers of the tournaments sorted alphabetically by name.
+
+        Note:
+            Only the header index is read: the rounds and matches of the tournaments are not loaded. The
+            sorted list is kept until the tournaments change, and must not be modified by the caller.
+        """
+        with self._lock:
+            headers = self._load_headers()
+            if self._sorted_headers is None or self._sorted_headers[0] != self._headers_signature:
+                self._sorted_headers = (self._headers_signature,
+                                        sorted(headers.values(), key=lambda header: header.name))
+            return self._sorted_headers[1]
+
+    def _get_search_signature(self):
+        """Return a value which changes whenever the tournaments are modified."""
+        return self._get_source_signature()
+
+    def preload(self):
+        """Load the headers, the search index and the player history index, so that the first listing or
+        search of the session does not have to read the data files."""
+        super().preload()
+        self._load_history_index()
+
+    def _history_index_is_loaded(self):
+        """Return True if the player history index in memory is up to date with the tournaments."""
+        return (self._history_index is not None and
+                self._history_index.signature == self._get_source_signature())
+
+    def _history_file_is_current(self):
+        """Return True if the player history index file is up to date with the tournaments."""
+        return PlayerHistoryIndex.read_signature(self.history_filename) == self._get_source_signature()
+
+    def _get_current_history_index(self):
+        """Return the player history index if it is up to date with the tournaments, without rebuilding it.
+
+        Returns:
+            PlayerHistoryIndex: The index, or None if it is missing or out of date.
+        """
+        if self._history_index_is_loaded():
+            return self._history_index
+        if not self._history_file_is_current():
+            return None
+        self._history_index = PlayerHistoryIndex.load(self.history_filename)
+        return self._history_index
+
+    def _load_history_index(self):
+        """Return the player history index, rebuilding it from the tournaments if it is out of date."""
+        with self._lock:
+            history_index = self._get_current_history_index()
+            if history_index is None:
+                history_index = PlayerHistoryIndex(self.history_filename)
+                for tournament_data in self.iter_tournaments():
+                    history_index.set_tournament(tournament_data['name'], tournament_postings(tournament_data))
+                history_index.save(self._get_source_signature())
+                self._history_index = history_index
+            return history_index
+
+    def get_player_history(self, national_chess_id):
+        """Get the games of a player in all tournaments.
+
+        Args:
+            national_chess_id (str): The national chess ID of the player.
+
+        Returns:
+            List[dict]: The games, by tournament then in the order played, with the keys 'tournament',
+                        'round', 'board', 'opponent_id', 'opponent_name', 'points' and 'opponent_points'.
+        """
+        return self._load_history_index().get_games(national_chess_id)
+
+    def get_head_to_head(self, player1_id, player2_id):
+        """Get the games of a player against another one, in all tournaments.
 
-if __name__ == "__main__":
-    pass
+        Returns:
+            List[dict]: The games, seen from the first player, as returned by get_player_history.
+        """
+        return self._load_history_index().get_head_to_head(player1_id, player2_id)
+
+    def add_tournament(self, tournament):
+        """Add a tournament to the repository.
+
+        In journal mode, the tournament is appended to the journal, so the cost of a save does not depend
+        on the size of the archive.
+
+        Args:
+            tournament (Tournament): The tournament object to be added to the repository. Its version is
+                                     incremented when the save succeeds.
+
+        Raises:
+            ConflictError: If the tournament was saved by another writer since it was loaded.
+        """
+        tournament_data = self._tournament_to_data(tournament)
+        tournament_data['version'] = tournament.version + 1
+
+        with self._lock:
+            search_index_is_current = (self._search_index is not None and
+                                       self._search_signature == self._get_search_signature())
+            history_index_is_loaded = self._history_index_is_loaded()
+            history_file_is_current = history_index_is_loaded or self._history_file_is_current()
+            headers = self._load_headers()
+            check_version(headers.get(tournament.name), tournament)
+            header = TournamentHeader.from_tournament_data(tournament_data)
+            headers[tournament.name] = header
+            if self.use_journal:
+                self._append_to_journal(tournament_data)
+            else:
+                self._rewrite_snapshot(tournament_data)
+            self._save_headers(headers)
+
+            # Mettre à jour les index plutôt que de les reconstruire à la prochaine recherche
+            if search_index_is_current:
+                self._search_index.add(header.name, header, header.name)
+                self._search_signature = self._get_search_signature()
+            # L'index de l'historique n'est complété que s'il était à jour ; sinon il sera reconstruit
+            if history_index_is_loaded:
+                self._history_index.append(tournament.name, tournament_postings(tournament_data),
+                                           self._get_source_signature())
+            elif history_file_is_current:
+                PlayerHistoryIndex.append_record(self.history_filename, tournament.name,
+                                                 tournament_postings(tournament_data), self._get_source_signature())
+
+        tournament.version += 1
+        if self.use_journal and self._get_journal_size() > self.journal_threshold:
+            self._schedule_compaction()
+
+    def _get_journal_size(self):
+        try:
+            return os.path.getsize(self.journal_filename)
+        except FileNotFoundError:
+            return 0
+
+    def _rewrite_snapshot(self, tournament_data):
+        """Update a tournament by rewriting the whole JSON file."""
+        with self._lock:
+            tournaments = self.load_tournaments()
+
+            # Recherchez le tournoi existant et mettez à jour ses données s'il existe déjà
+            for i, existing_tournament in enumerate(tournaments):
+                if existing_tournament["name"] == tournament_data["name"]:
+                    tournaments[i] = tournament_data
+                    break
+            else:
+                tournaments.append(tournament_data)
+
+            self._write_snapshot(tournaments)
+
+            # Le journal éventuel a été intégré au fichier
+            if os.path.exists(self.journal_filename):
+                os.remove(self.journal_filename)
+
+
+def write_binary_records(file, tournaments):
+    """Write the binary snapshot header then each tournament, yielding the tournaments as they are written."""
+    pickle.dump(BINARY_SNAPSHOT_HEADER, file)
+    for tournament_data in tournaments:
+        # Un enregistrement par tournoi : la lecture reste tournoi par tournoi, comme celle du JSON
+        pickle.dump(tournament_data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        yield tournament_data
+
+
+def iter_binary_records(file):
+    """Yield the records of a binary snapshot, after its header."""
+    while True:
+        try:
+            record = pickle.load(file)
+        except EOFError:
+            return
+        yield record
+
+
+def check_version(stored_header, tournament):
+    """Raise a ConflictError if the stored tournament is not the version the tournament was loaded from.
+
+    A tournament which was never saved (version 0) while a tournament with the same name is stored with a
+    version is a new tournament reusing the name, which is reported as such rather than as a concurrent edit.
+    Tournaments saved before the versions were introduced are stored with version 0 and cannot be told apart.
+
+    Args:
+        stored_header (TournamentHeader): The header of the stored tournament, or None if it is not stored yet.
+        tournament (Tournament): The tournament about to be saved.
+    """
+    if stored_header is None or stored_header.version == tournament.version:
+        return
+    if tournament.version == 0:
+        raise ConflictError(f"Un tournoi nommé {tournament.name} existe déjà. Choisissez un autre nom.",
+                            tournament.name, tournament.version, stored_header.version)
+    raise ConflictError(f"Le tournoi {tournament.name} a été modifié par un autre programme "
+                        f"(version {stored_header.version}, chargée : {tournament.version}). "
+                        f"Rechargez-le avant de l'enregistrer.",
+                        tournament.name, tournament.version, stored_header.version)
+
+
+def normalize_tournament_name(tournament_name):
+    """Return the accent-free, title-cased form used to compare tournament names."""
+    from unidecode import unidecode
+
+    return unidecode(tournament_name.title())
+
+
+def build_tournament_details(tournament_data):
+    """Build the details displayed for a tournament from its stored data."""
+    tournament_details = {
+        "name": tournament_data["name"],
+        "place": tournament_data["place"],
+        "date_start": tournament_data["date_start"],
+        "date_end": tournament_data["date_end"],
+        "director_note": tournament_data["director_note"],
+        "players_score": tournament_data['players_score'],
+        "rounds": tournament_data['rounds'],
+        "players_list": tournament_data['players_list']
+    }
+    current_round = tournament_data['current_round']
+    rounds_count = len(tournament_data['rounds'])
+    if current_round + 1 == rounds_count:
+        tournament_details["tournament_status"] = " Tournoi terminé"
+    else:
+        tournament_details["tournament_status"] = f"Round actuel : {current_round + 1} sur {rounds_count}"
+
+    # Créer une nouvelle liste pour stocker les détails des rounds joués
+    played_rounds_details = []
+
+    # Ajout des détails des rounds joués
+    for idx, round_data in enumerate(tournament_data['rounds']):
+        round_details = {
+            "name": round_data['name'],
+            "start_time": round_data.get('start_time', None),
+            "end_time": round_data.get('end_time', None),
+            "matches": round_data.get('matches', [])
+        }
+        played_rounds_details.append(round_details)
+
+    tournament_details["played_rounds"] = played_rounds_details
+    return tournament_details
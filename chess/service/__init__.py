@@ -0,0 +1,6 @@
+"""Arbiter service package."""
+
+# Adresse par défaut du service, définie ici pour que la ligne de commande n'importe pas le serveur ni le client
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
@@ -0,0 +1,133 @@
+"""
+This module contains the client of the arbiter service, and the console terminal used by an arbiter to
+enter the results of their boards.
+
+Classes:
+    ArbiterClientError: Raised when the service refuses a request or cannot be reached.
+    ArbiterClient: The requests to the service, over HTTP/JSON.
+
+Functions:
+    run_arbiter_terminal: Enter the results of the current round of a tournament, board by board.
+"""
+
+import json
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+from service import DEFAULT_URL
+
+
+class ArbiterClientError(Exception):
+    """Raised when the arbiter service refuses a request or cannot be reached.
+
+    Attributes:
+        status (int): The HTTP status of the response, or None if the service could not be reached.
+        errors (List[str]): The details sent by the service.
+    """
+
+    def __init__(self, message, status=None, errors=None):
+        super().__init__(message)
+        self.status = status
+        self.errors = errors or []
+
+
+class ArbiterClient:
+    """Client of the arbiter service."""
+
+    def __init__(self, url=DEFAULT_URL, timeout=10):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, method, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = Request(self.url + path, data=data, method=method,
+                          headers={"Content-Type": "application/json"})
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except HTTPError as error:
+            try:
+                content = json.loads(error.read())
+            except ValueError:
+                content = {}
+            raise ArbiterClientError(content.get("error", str(error)), error.code, content.get("errors"))
+        except URLError as error:
+            raise ArbiterClientError(f"Service des arbitres injoignable ({self.url}) : {error.reason}")
+
+    @staticmethod
+    def _tournament_path(tournament_name, action=""):
+        return f"/tournaments/{quote(tournament_name, safe='')}" + (f"/{action}" if action else "")
+
+    def list_players(self, query=None):
+        return self._request("GET", "/players" + (f"?{urlencode({'q': query})}" if query else ""))
+
+    def get_player_history(self, national_chess_id):
+        return self._request("GET", f"/players/{quote(national_chess_id, safe='')}/history")
+
+    def list_tournaments(self):
+        return self._request("GET", "/tournaments")
+
+    def get_tournament(self, tournament_name):
+        return self._request("GET", self._tournament_path(tournament_name))
+
+    def get_round(self, tournament_name):
+        return self._request("GET", self._tournament_path(tournament_name, "round"))
+
+    def generate_pairings(self, tournament_name):
+        return self._request("POST", self._tournament_path(tournament_name, "pairings"), {})
+
+    def submit_results(self, tournament_name, results):
+        """Send results of the current round.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            results (List[dict]): The results, e.g. [{"board": 1, "result": "win"}].
+        """
+        return self._request("POST", self._tournament_path(tournament_name, "results"), {"results": results})
+
+
+def display_boards(round_data):
+    """Affiche les échiquiers du round en cours et leurs résultats."""
+    print(f"\n{round_data['tournament']} - Round {round_data['round']}/{round_data['rounds']} :")
+    for board in round_data["boards"]:
+        result = board["result"] or "en attente"
+        print(f"{board['board']}. {board['player1']} contre {board['player2']} : {result}")
+
+
+def run_arbiter_terminal(client, tournament_name):
+    """Saisit les résultats du round en cours d'un tournoi depuis un terminal d'arbitre.
+
+    Les résultats sont envoyés échiquier par échiquier au service, qui clôt le round quand tous sont saisis.
+    """
+    while True:
+        try:
+            round_data = client.get_round(tournament_name)
+            if round_data["finished"]:
+                print("Ce tournoi est terminé.")
+                return
+            if not round_data["boards"]:
+                if input("\nLe round n'est pas encore apparié. Générer les appariements ? (y/n): ").lower() != "y":
+                    return
+                round_data = client.generate_pairings(tournament_name)
+            display_boards(round_data)
+
+            board = input("\nÉchiquier (vide pour actualiser, q pour quitter) : ").strip()
+            if board.lower() == "q":
+                return
+            if not board:
+                continue
+            result = input("Résultat du premier joueur (win/loss/draw) : ").strip()
+            response = client.submit_results(tournament_name, [{"board": board, "result": result}])
+            if response["round_closed"]:
+                print("Tous les résultats sont saisis : le round est terminé.")
+        except ArbiterClientError as error:
+            print(error)
+            for detail in error.errors:
+                print(f"  - {detail}")
+            if error.status is None or error.status == 404:
+                return
+
+
+if __name__ == "__main__":
+    pass
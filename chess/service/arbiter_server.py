@@ -0,0 +1,194 @@
+"""
+This module contains the local HTTP/JSON server of the arbiter service, based on asyncio.
+
+Several arbiter terminals (on the club network, or on the same computer) send their requests concurrently.
+The reads are answered in worker threads; the writes (pairings, results) are put in a queue consumed by a
+single writer, so that they are applied and saved one at a time, in the order received.
+
+Routes (the names are URL-encoded):
+    GET  /players[?q=text]                  The players, or those whose name matches the search.
+    GET  /players/<national chess ID>/history   The games of a player in all tournaments.
+    GET  /tournaments                       The headers of the tournaments.
+    GET  /tournaments/<name>                The data of a tournament.
+    GET  /tournaments/<name>/round          The boards of the current round, with their results.
+    POST /tournaments/<name>/pairings       Generate the pairings of the current round.
+    POST /tournaments/<name>/results        Record results: {"results": [{"board": 1, "result": "win"}]}.
+
+Classes:
+    ArbiterServer: The HTTP server and its writer queue.
+
+Functions:
+    serve: Run the server until it is interrupted.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from service import DEFAULT_HOST, DEFAULT_PORT
+from service.arbiter_service import ServiceError
+
+MAX_BODY_SIZE = 1024 * 1024
+
+
+class ArbiterServer:
+    """HTTP/JSON server exposing an ArbiterService to the arbiter terminals."""
+
+    def __init__(self, service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.service = service
+        self.host = host
+        self.port = port
+        self._server = None
+        self._write_queue = None
+        self._writer_task = None
+        # Un seul thread d'écriture : les modifications sont appliquées et enregistrées une par une
+        self._write_executor = ThreadPoolExecutor(max_workers=1)
+
+    async def start(self):
+        """Start listening and the writer task.
+
+        Returns:
+            tuple: The host and the port listened to (useful with port 0, which picks a free port).
+        """
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._run_writer())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Service des arbitres à l'écoute sur http://{self.host}:{self.port}")
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Stop listening, then let the writer finish the writes already queued."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._writer_task is not None:
+            await self._write_queue.join()
+            self._writer_task.cancel()
+        self._write_executor.shutdown()
+
+    async def _run_writer(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            function, args, future = await self._write_queue.get()
+            try:
+                result = await loop.run_in_executor(self._write_executor, function, *args)
+            except Exception as error:
+                if not future.cancelled():
+                    future.set_exception(error)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self._write_queue.task_done()
+
+    async def _read(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def _write(self, function, *args):
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put((function, args, future))
+        return await future
+
+    async def _dispatch(self, method, target, body):
+        """Call the service operation of a request.
+
+        Returns:
+            tuple: The HTTP status and the JSON payload of the response.
+        """
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+        query = parse_qs(url.query)
+
+        if parts[0] == "players" and len(parts) == 1 and method == "GET":
+            return HTTPStatus.OK, await self._read(self.service.list_players, query.get("q", [""])[0])
+        if parts[0] == "players" and len(parts) == 3 and parts[2] == "history" and method == "GET":
+            return HTTPStatus.OK, await self._read(self.service.get_player_history, parts[1])
+        if parts[0] == "tournaments" and len(parts) == 1 and method == "GET":
+            return HTTPStatus.OK, await self._read(self.service.list_tournaments)
+        if parts[0] == "tournaments" and len(parts) == 2 and method == "GET":
+            return HTTPStatus.OK, await self._read(self.service.get_tournament, parts[1])
+        if parts[0] == "tournaments" and len(parts) == 3:
+            tournament_name, action = parts[1], parts[2]
+            if action == "round" and method == "GET":
+                return HTTPStatus.OK, await self._read(self.service.get_round, tournament_name)
+            if action == "pairings" and method == "POST":
+                return HTTPStatus.OK, await self._write(self.service.generate_pairings, tournament_name)
+            if action == "results" and method == "POST":
+                try:
+                    payload = json.loads(body or b"{}")
+                except json.JSONDecodeError as error:
+                    raise ServiceError(f"Corps JSON invalide : {error}")
+                entries = payload.get("results") if isinstance(payload, dict) else payload
+                if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+                    raise ServiceError("Le corps doit contenir une liste de résultats.")
+                return HTTPStatus.OK, await self._write(self.service.submit_results, tournament_name, entries)
+        raise ServiceError(f"Route inconnue : {method} {url.path}", status=HTTPStatus.NOT_FOUND)
+
+    async def _read_request(self, reader):
+        """Read an HTTP request.
+
+        Returns:
+            tuple: The method, the target and the body, or None if the client closed the connection.
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY_SIZE:
+            raise ServiceError("Requête trop volumineuse.", status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, body
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            request = await self._read_request(reader)
+            if request is None:
+                writer.close()
+                return
+            status, payload = await self._dispatch(*request)
+        except ServiceError as error:
+            status, payload = error.status, {"error": str(error), "errors": error.errors}
+        except (ValueError, asyncio.IncompleteReadError):
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": "Requête invalide.", "errors": []}
+        except Exception as error:
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error), "errors": []}
+
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        status = HTTPStatus(status)
+        writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                     f"Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode("latin-1") + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Run the arbiter server until it is interrupted (Ctrl+C)."""
+    server = ArbiterServer(service, host, port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nService des arbitres arrêté.")
+
+
+if __name__ == "__main__":
+    pass
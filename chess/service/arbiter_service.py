@@ -0,0 +1,192 @@
+"""
+This module contains the operations offered to the arbiter terminals by the local service: reading the
+players and tournaments, generating the pairings of a round and recording results.
+
+The service keeps the tournaments being played in memory, so that the results sent board by board by
+several arbiters are applied to the same Tournament objects, then saved. It is called by the server: the
+writes are serialized by its writer queue, and a lock keeps the reads consistent with them.
+
+Classes:
+    ServiceError: Raised when a request cannot be answered, with the HTTP status to return.
+    ArbiterService: The operations of the service, on top of the tournament controller.
+"""
+
+import threading
+from datetime import datetime
+
+from model.pairing import PairingError
+from model.tournament import Tournament
+from repository.file_storage import ConflictError
+from utils.result_import import ResultImportError, validate_results
+
+
+class ServiceError(Exception):
+    """Raised when a request to the service cannot be answered.
+
+    Attributes:
+        status (int): The HTTP status of the response.
+        errors (List[str]): The details of the problem (e.g. one message per invalid result).
+    """
+
+    def __init__(self, message, status=400, errors=None):
+        super().__init__(message)
+        self.status = status
+        self.errors = errors or []
+
+
+def match_to_board(board, match):
+    """Describe a match of a round for the arbiter terminals."""
+    player1, player2 = match.player1, match.player2
+    return {
+        "board": board,
+        "player1": player1.fullname(),
+        "player1_id": player1.national_chess_id,
+        "player2": player2.fullname(),
+        "player2_id": player2.national_chess_id,
+        "result": match.result,
+        "score": list(match.points) if match.result is not None else None
+    }
+
+
+class ArbiterService:
+    """Operations of the arbiter service, using the repositories and the tournament controller.
+
+    The tournaments are kept in memory while the service runs, and reloaded from the storage when another
+    program saved them meanwhile (the stored version no longer matches the one loaded). Every change made by
+    the service is saved at once, so a reload never drops a change of the service; a save which loses the
+    race with another program is refused (version conflict) and the tournament is reloaded.
+    """
+
+    def __init__(self, tournament_controller):
+        self.tournament_controller = tournament_controller
+        self.tournament_repository = tournament_controller.tournament_repository
+        self.player_repository = tournament_controller.player_repository
+        self._tournaments = {}
+        self._lock = threading.RLock()
+
+    def _get_tournament(self, tournament_name):
+        """Return the Tournament object of a tournament, loading it on first use or when its stored version
+        changed."""
+        header = self.tournament_repository.find_tournament_by_name(tournament_name)
+        if header is None:
+            raise ServiceError(f"Tournoi introuvable : {tournament_name}", status=404)
+        tournament = self._tournaments.get(header.name)
+        if tournament is None or tournament.version != header.version:
+            tournament = Tournament.from_json(self.tournament_repository.get_tournament(header.name))
+            self._tournaments[header.name] = tournament
+        return tournament
+
+    def _get_tournament_in_progress(self, tournament_name):
+        tournament = self._get_tournament(tournament_name)
+        if tournament.current_round >= len(tournament.rounds):
+            raise ServiceError(f"Le tournoi {tournament.name} est terminé.", status=409)
+        return tournament
+
+    def _save(self, tournament):
+        """Save a tournament; if another program saved it meanwhile, forget the changes and reload it.
+
+        The Elo ratings are only updated with the closed rounds once the save succeeded (see
+        TournamentController.save_tournament).
+        """
+        try:
+            self.tournament_controller.save_tournament(tournament)
+        except ConflictError as error:
+            del self._tournaments[tournament.name]
+            raise ServiceError(f"{error} Modification annulée, renvoyez-la.", status=409)
+
+    def list_players(self, query=None):
+        """Return the players, sorted by name, or those matching a search on their names."""
+        with self._lock:
+            if query:
+                return self.player_repository.search_players(query)
+            return self.player_repository.get_player_by_alphabetical_order()
+
+    def get_player_history(self, national_chess_id):
+        """Return the games of a player in all tournaments."""
+        with self._lock:
+            return self.tournament_repository.get_player_history(national_chess_id)
+
+    def list_tournaments(self):
+        """Return the headers of the tournaments, sorted by name."""
+        with self._lock:
+            return [header.to_json() for header in self.tournament_repository.get_tournaments_by_alphabetical_order()]
+
+    def get_tournament(self, tournament_name):
+        """Return the data of a tournament, with its players."""
+        with self._lock:
+            tournament = self._get_tournament(tournament_name)
+            tournament_data = tournament.to_json()
+            tournament_data["players_list"] = [player.to_json() for player in tournament.players_list]
+            return tournament_data
+
+    def _describe_round(self, tournament):
+        if tournament.current_round >= len(tournament.rounds):
+            return {"tournament": tournament.name, "round": None, "rounds": len(tournament.rounds),
+                    "finished": True, "boards": []}
+        current_round = tournament.rounds[tournament.current_round]
+        return {
+            "tournament": tournament.name,
+            "round": tournament.current_round + 1,
+            "rounds": len(tournament.rounds),
+            "finished": False,
+            "boards": [match_to_board(board, match) for board, match in enumerate(current_round.matches, 1)]
+        }
+
+    def get_round(self, tournament_name):
+        """Return the boards of the current round of a tournament, with the results already recorded."""
+        with self._lock:
+            return self._describe_round(self._get_tournament(tournament_name))
+
+    def generate_pairings(self, tournament_name):
+        """Generate and save the pairings of the current round, if it is not already paired.
+
+        Returns:
+            dict: The current round, as returned by get_round.
+        """
+        with self._lock:
+            tournament = self._get_tournament_in_progress(tournament_name)
+            current_round = tournament.rounds[tournament.current_round]
+            if not current_round.matches:
+                if current_round.start_time is None:
+                    current_round.start_time = datetime.now().strftime("%d-%m-%Y %H:%M")
+                try:
+                    tournament.generate_pairs_for_round(self.tournament_controller.get_seed_ratings(tournament))
+                except PairingError as error:
+                    current_round.start_time = None
+                    raise ServiceError(str(error), status=409)
+                self._save(tournament)
+            return self._describe_round(tournament)
+
+    def submit_results(self, tournament_name, entries):
+        """Record results of the current round, closing the round once every board has a result.
+
+        The entries are all checked before being applied: if one is invalid, none is recorded.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+            entries (List[dict]): The results, as in a result file: {"board": 1, "result": "win"}.
+
+        Returns:
+            dict: The number of results recorded, whether the round was closed, and the current round.
+        """
+        with self._lock:
+            tournament = self._get_tournament_in_progress(tournament_name)
+            matches = tournament.rounds[tournament.current_round].matches
+            if not matches:
+                raise ServiceError("Les appariements de ce round n'ont pas encore été générés.", status=409)
+            try:
+                results = validate_results(matches, entries, partial=True)
+            except ResultImportError as error:
+                raise ServiceError("Résultats refusés.", errors=error.errors)
+
+            for match, result in results:
+                tournament.record_result(match, result)
+            round_closed = not tournament.get_pending_matches()
+            if round_closed:
+                self.tournament_controller.close_round(tournament)
+            self._save(tournament)
+            return {"recorded": len(results), "round_closed": round_closed, **self._describe_round(tournament)}
+
+
+if __name__ == "__main__":
+    pass
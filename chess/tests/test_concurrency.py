@@ -0,0 +1,212 @@
+"""
+Tests of the concurrent writes to the JSON data files.
+
+Each test works in a temporary data directory: a tournament saved by another process or thread since it was
+loaded must be refused with a ConflictError, and the data files must hold exactly the writes that succeeded.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from model.player import Player
+from model.tournament import Tournament
+from repository.file_storage import ConflictError
+from repository.player_repository import PlayerRepository
+from repository.tournament_repository import TournamentRepository
+
+TOURNAMENT_NAME = "Open De Printemps"
+
+
+def create_tournament():
+    return Tournament(name=TOURNAMENT_NAME, place="Lyon", date_start="01-04-2025", date_end="02-04-2025",
+                      director_note="Création")
+
+
+def save_director_note(filename, use_journal, director_note):
+    """Load the tournament, change its note and save it (executed in another process).
+
+    Returns:
+        int: The version of the tournament after the save.
+    """
+    repository = TournamentRepository(filename, use_journal=use_journal)
+    tournament = Tournament.from_json(repository.get_tournament(TOURNAMENT_NAME))
+    tournament.director_note = director_note
+    repository.add_tournament(tournament)
+    return tournament.version
+
+
+def add_players(filename, worker, count, journal_threshold):
+    """Add players with IDs of their own (executed in another process)."""
+    repository = PlayerRepository(filename, journal_threshold=journal_threshold)
+    for index in range(count):
+        repository.add_player(Player(f"Joueur{index}", f"Processus{worker}", "01-01-2000",
+                                     f"W{worker}{index:04d}"))
+
+
+def read_stored_players(filename):
+    """Return the players as stored in the JSON file and its journal, read without the repository cache."""
+    players = []
+    if os.path.exists(filename):
+        with open(filename, 'r') as file:
+            players = json.load(file)
+    if os.path.exists(filename + '.journal'):
+        with open(filename + '.journal', 'r') as file:
+            players.extend(json.loads(line) for line in file)
+    return players
+
+
+def read_stored_tournaments(filename, use_journal):
+    """Return the tournaments as stored in the files, read without the repository caches."""
+    tournaments = []
+    if os.path.exists(filename):
+        with open(filename, 'r') as file:
+            tournaments = json.load(file)
+    if use_journal and os.path.exists(filename + '.journal'):
+        with open(filename + '.journal', 'r') as file:
+            # Le journal est rejoué sur le fichier : le dernier enregistrement de chaque tournoi l'emporte
+            journal = {}
+            for line in file:
+                record = json.loads(line)
+                journal[record["name"]] = record
+        tournaments = [journal.pop(tournament["name"], tournament) for tournament in tournaments]
+        tournaments.extend(journal.values())
+    return tournaments
+
+
+class TournamentConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.filename = os.path.join(self.directory.name, "tournament.json")
+
+    def assert_stored(self, use_journal, version, director_note):
+        tournaments = read_stored_tournaments(self.filename, use_journal)
+        self.assertEqual([tournament["name"] for tournament in tournaments], [TOURNAMENT_NAME])
+        self.assertEqual(tournaments[0]["version"], version)
+        self.assertEqual(tournaments[0]["director_note"], director_note)
+
+    def test_stale_save_after_another_process_is_refused(self):
+        for use_journal in (True, False):
+            with self.subTest(use_journal=use_journal):
+                if os.path.exists(self.filename + '.journal'):
+                    os.remove(self.filename + '.journal')
+                if os.path.exists(self.filename):
+                    os.remove(self.filename)
+                repository = TournamentRepository(self.filename, use_journal=use_journal)
+                repository.add_tournament(create_tournament())
+                stale = Tournament.from_json(repository.get_tournament(TOURNAMENT_NAME))
+
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    version = executor.submit(save_director_note, self.filename, use_journal,
+                                              "Autre programme").result()
+                self.assertEqual(version, 2)
+
+                stale.director_note = "Modification perdue"
+                with self.assertRaises(ConflictError) as context:
+                    repository.add_tournament(stale)
+                self.assertEqual((context.exception.expected_version, context.exception.stored_version), (1, 2))
+                self.assertEqual(stale.version, 1)
+                self.assert_stored(use_journal, 2, "Autre programme")
+
+                # Rechargé, le tournoi peut de nouveau être enregistré
+                reloaded = Tournament.from_json(repository.get_tournament(TOURNAMENT_NAME))
+                reloaded.director_note = "Après rechargement"
+                repository.add_tournament(reloaded)
+                self.assert_stored(use_journal, 3, "Après rechargement")
+
+    def test_simultaneous_saves_of_the_same_version(self):
+        repository = TournamentRepository(self.filename)
+        repository.add_tournament(create_tournament())
+        copies = [Tournament.from_json(repository.get_tournament(TOURNAMENT_NAME)) for _ in range(2)]
+        barrier = threading.Barrier(len(copies))
+        saved, conflicts = [], []
+
+        def save(tournament, director_note):
+            tournament.director_note = director_note
+            # Deux instances du dépôt, comme deux programmes : seul le verrou sur le fichier les départage
+            writer = TournamentRepository(self.filename)
+            barrier.wait()
+            try:
+                writer.add_tournament(tournament)
+                saved.append(director_note)
+            except ConflictError:
+                conflicts.append(director_note)
+
+        threads = [threading.Thread(target=save, args=(tournament, f"Arbitre {index}"))
+                   for index, tournament in enumerate(copies)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(len(conflicts), 1)
+        self.assert_stored(True, 2, saved[0])
+
+    def test_new_tournament_with_a_stored_name(self):
+        repository = TournamentRepository(self.filename)
+        repository.add_tournament(create_tournament())
+
+        duplicate = create_tournament()
+        duplicate.director_note = "Doublon"
+        with self.assertRaises(ConflictError) as context:
+            repository.add_tournament(duplicate)
+        self.assertIn("existe déjà", str(context.exception))
+        self.assert_stored(True, 1, "Création")
+
+
+class PlayerConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.filename = os.path.join(self.directory.name, "players.json")
+
+    def test_additions_from_several_processes(self):
+        workers, count = 4, 25
+        expected_ids = sorted(f"W{worker}{index:04d}" for worker in range(workers) for index in range(count))
+        # Petit seuil : les processus compactent le journal pendant que les autres y ajoutent des joueurs
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(add_players, self.filename, worker, count, 1000)
+                           for worker in range(workers)]:
+                future.result()
+
+        players = read_stored_players(self.filename)
+        self.assertEqual(sorted(player['national chess ID'] for player in players), expected_ids)
+
+        # L'identifiant d'un joueur ajouté par un autre processus est refusé
+        repository = PlayerRepository(self.filename)
+        with self.assertRaises(ConflictError):
+            repository.add_player(Player("Autre", "Joueur", "01-01-2000", "W00000"))
+
+        repository.compact()
+        self.assertFalse(os.path.exists(self.filename + '.journal'))
+        with open(self.filename, 'r') as file:
+            self.assertEqual(sorted(player['national chess ID'] for player in json.load(file)), expected_ids)
+
+    def test_addition_after_a_truncated_record(self):
+        repository = PlayerRepository(self.filename)
+        for index in range(3):
+            repository.add_player(Player(f"Joueur{index}", "Arrêt", "01-01-2000", f"TR{index:05d}"))
+        # Dernier enregistrement coupé, comme par un arrêt pendant son écriture
+        with open(self.filename + '.journal', 'r+b') as file:
+            file.truncate(os.path.getsize(self.filename + '.journal') - 10)
+
+        repository = PlayerRepository(self.filename)
+        self.assertEqual([player['national chess ID'] for player in repository.load_players()],
+                         ["TR00000", "TR00001"])
+        repository.add_player(Player("Joueur3", "Arrêt", "01-01-2000", "TR00003"))
+        self.assertEqual([player['national chess ID'] for player in PlayerRepository(self.filename).load_players()],
+                         ["TR00000", "TR00001", "TR00003"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests of the crosstable against a small event computed by hand.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import unittest
+
+from model.crosstable import NO_OPPONENT, Crosstable, format_cell
+from model.match import Match
+from model.player import Player
+from model.round import Round
+from model.score_ledger import ScoreLedger
+
+
+def create_round(name, matches):
+    round = Round(name, [], None, None)
+    for match in matches:
+        round.add_match(match)
+    return round
+
+
+class CrosstableTest(unittest.TestCase):
+    """Round robin of four players, then a round paired but not played yet.
+
+    Round 1: A - B 1-0, C - D 1/2.   Round 2: A - C 1/2, B - D 1-0.   Round 3: A - D 0-1, B - C 0-1.
+
+    Player  Score  Buchholz         Sonneborn-Berger              Progressive
+    A       1.5    1 + 2 + 1.5      1×1 + 0.5×2 + 0×1.5 = 2       1 + 1.5 + 1.5 = 4
+    B       1      1.5 + 1.5 + 2    0×1.5 + 1×1.5 + 0×2 = 1.5     0 + 1 + 1 = 2
+    C       2      1.5 + 1.5 + 1    0.5×1.5 + 0.5×1.5 + 1×1 = 2.5 0.5 + 1 + 2 = 3.5
+    D       1.5    2 + 1 + 1.5      0.5×2 + 0×1 + 1×1.5 = 2.5     0.5 + 0.5 + 1.5 = 2.5
+
+    A and D have the same score and Buchholz: D is ranked first on Sonneborn-Berger.
+    """
+
+    def setUp(self):
+        self.players = [Player(name, "Grille", "01-01-2000", f"CT0000{index}")
+                        for index, name in enumerate(("A", "B", "C", "D"))]
+        a, b, c, d = self.players
+        rounds = [create_round("Round 1", [Match(a, b, "win"), Match(c, d, "draw")]),
+                  create_round("Round 2", [Match(a, c, "draw"), Match(b, d, "win")]),
+                  create_round("Round 3", [Match(a, d, "loss"), Match(b, c, "loss")]),
+                  create_round("Round 4", [Match(c, a), Match(d, b)])]
+        self.crosstable = Crosstable.from_rounds(self.players, rounds)
+
+    def test_scores_and_tiebreaks(self):
+        scores, buchholz, sonneborn_berger, progressive = self.crosstable.get_tiebreaks()
+        self.assertEqual(scores, [1.5, 1, 2, 1.5])
+        self.assertEqual(buchholz, [4.5, 5, 4, 4.5])
+        self.assertEqual(sonneborn_berger, [2, 1.5, 2.5, 2.5])
+        self.assertEqual(progressive, [4, 2, 3.5, 2.5])
+
+    def test_standings(self):
+        a, b, c, d = self.players
+        self.assertEqual(self.crosstable.detailed_standings(),
+                         [(c, 2, 4, 2.5, 3.5), (d, 1.5, 4.5, 2.5, 2.5), (a, 1.5, 4.5, 2, 4), (b, 1, 5, 1.5, 2)])
+        # Le registre des scores reconstruit depuis la grille donne le même classement
+        self.assertEqual(ScoreLedger.from_crosstable(self.crosstable).detailed_standings(),
+                         self.crosstable.detailed_standings())
+
+    def test_rows_designate_opponents_by_rank(self):
+        rows = [(rank, player.firstname, [format_cell(*cell) for cell in cells], score)
+                for rank, player, cells, score in self.crosstable.rows()]
+        self.assertEqual(rows, [(1, "C", ["2=", "3=", "4+", "3?"], 2),
+                                (2, "D", ["1=", "4-", "3+", "4?"], 1.5),
+                                (3, "A", ["4+", "1=", "2-", "1?"], 1.5),
+                                (4, "B", ["3-", "2+", "1-", "2?"], 1)])
+
+    def test_games_with_a_result(self):
+        games = self.crosstable.get_games()
+        # Le round 4 n'a pas de résultat : ses parties n'y figurent pas
+        self.assertEqual(games[0], [(1, 1, 0), (2, 0.5, 0.5), (3, 0, 1)])
+        self.assertEqual(games[3], [(2, 0.5, 0.5), (1, 0, 1), (0, 1, 0)])
+
+    def test_seed_order_when_everything_is_equal(self):
+        a, b, c, d = self.players
+        crosstable = Crosstable.from_rounds(self.players, [create_round("Round 1", [Match(c, a, "draw"),
+                                                                                     Match(b, d, "draw")])])
+        self.assertEqual([player for player, *_ in crosstable.detailed_standings()], [a, b, c, d])
+
+    def test_incomplete_match(self):
+        a, b, c, d = self.players
+        # Adversaire introuvable au chargement du tournoi : les points comptent, pas les départages
+        crosstable = Crosstable.from_rounds([a, b, c], [create_round("Round 1", [Match(a, None, "win"),
+                                                                                  Match(b, c, "loss")])])
+        self.assertEqual(crosstable.get_games()[0], [(NO_OPPONENT, 1, None)])
+        scores, buchholz, sonneborn_berger, progressive = crosstable.get_tiebreaks()
+        self.assertEqual((scores[0], buchholz[0], sonneborn_berger[0], progressive[0]), (1, 0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Tests of the streamed reading and writing of JSON arrays.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import io
+import json
+import unittest
+
+from utils.json_stream import iter_json_array, write_json_array
+
+ELEMENTS = [
+    {"name": "Open \"Printemps\" [2025]", "rounds": [{"matches": [{"players": {"Jean Dupont": 1, "Anne": 0}}]}]},
+    {"name": "Chemin C:\\échecs\\, fin ]", "note": "Ligne 1\nLigne 2\t\u00e9\u2654 \U0001F600", "empty": {}},
+    [[], [[1, 2.5], {"a": [None, True, False]}], "]", "[", ",", "\\", "\""],
+    "chaîne seule",
+    -12.75e-3,
+    1e3,
+    123456789,
+    None,
+]
+
+
+class IterJsonArrayTest(unittest.TestCase):
+
+    def read(self, content, chunk_size):
+        return list(iter_json_array(io.StringIO(content), chunk_size))
+
+    def test_nested_and_escaped_elements_for_every_chunk_size(self):
+        # Les coupures du tampon tombent au milieu des chaînes, des échappements et des nombres
+        for content in (json.dumps(ELEMENTS), json.dumps(ELEMENTS, indent=4),
+                        json.dumps(ELEMENTS, ensure_ascii=False), json.dumps(ELEMENTS, separators=(",", ":"))):
+            for chunk_size in range(1, 40):
+                with self.subTest(chunk_size=chunk_size, length=len(content)):
+                    self.assertEqual(self.read(content, chunk_size), ELEMENTS)
+
+    def test_empty_array_and_empty_file(self):
+        self.assertEqual(self.read("  [ \n ]  ", 1), [])
+        self.assertEqual(self.read("", 4), [])
+
+    def test_invalid_content(self):
+        for content in ('{"name": "A"}', '[{"name": "A"}, ', '[{"name": "A"'):
+            with self.subTest(content=content):
+                with self.assertRaises(ValueError):
+                    self.read(content, 4)
+
+    def test_written_array_is_read_back(self):
+        file = io.StringIO()
+        write_json_array(file, iter(ELEMENTS))
+        self.assertEqual(file.getvalue(), json.dumps(ELEMENTS, indent=4))
+        file.seek(0)
+        self.assertEqual(list(iter_json_array(file, 16)), ELEMENTS)
+
+        file = io.StringIO()
+        write_json_array(file, [])
+        self.assertEqual(file.getvalue(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
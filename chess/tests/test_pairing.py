@@ -0,0 +1,94 @@
+"""
+Tests of the Swiss pairing engine.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import itertools
+import random
+import unittest
+
+from model.pairing import PairingError, pair_players
+
+PLAYERS = ["A", "B", "C", "D", "E", "F", "G", "H"]
+
+
+def all_pairs_except(players, allowed):
+    """Return the pairs of players already played: all of them except the allowed ones."""
+    return {pair for pair in itertools.combinations(players, 2) if pair not in allowed and pair[::-1] not in allowed}
+
+
+class PairPlayersTest(unittest.TestCase):
+
+    def assert_legal(self, pairings, standings, played_pairs):
+        """Check that every player is paired once, with an opponent not met yet."""
+        self.assertEqual(sorted(player for pair in pairings for player in pair), sorted(standings))
+        for player1, player2 in pairings:
+            self.assertNotIn((player1, player2), played_pairs)
+            self.assertNotIn((player2, player1), played_pairs)
+
+    def test_top_half_plays_bottom_half(self):
+        self.assertEqual(pair_players(PLAYERS, set()), [("A", "E"), ("B", "F"), ("C", "G"), ("D", "H")])
+
+    def test_no_rematch_over_a_tournament(self):
+        rng = random.Random(7)
+        played_pairs = set()
+        scores = dict.fromkeys(PLAYERS, 0)
+        # 7 rounds : chaque joueur rencontre tous les autres une fois
+        for _ in range(len(PLAYERS) - 1):
+            standings = sorted(PLAYERS, key=lambda player: -scores[player])
+            pairings = pair_players(standings, played_pairs, scores)
+            self.assert_legal(pairings, standings, played_pairs)
+            for player1, player2 in pairings:
+                played_pairs.add((player1, player2))
+                scores[rng.choice((player1, player2))] += 1
+        self.assertEqual(len(played_pairs), len(PLAYERS) * (len(PLAYERS) - 1) // 2)
+
+    def test_score_groups_with_floaters(self):
+        standings = ["A", "B", "C", "D", "E", "F"]
+        scores = {"A": 2, "B": 1, "C": 1, "D": 1, "E": 0, "F": 0}
+        # A, seul de son groupe, descend dans le groupe suivant ; D, resté seul, descend dans le dernier
+        self.assertEqual(pair_players(standings, set(), scores), [("A", "B"), ("C", "D"), ("E", "F")])
+        self.assertEqual(pair_players(standings, {("A", "B")}, scores), [("A", "C"), ("B", "D"), ("E", "F")])
+        self.assertEqual(pair_players(standings, {("A", "B"), ("C", "D")}, scores),
+                         [("A", "C"), ("B", "D"), ("E", "F")])
+        self.assertEqual(pair_players(standings, {("A", "B"), ("A", "C"), ("B", "D")}, scores),
+                         [("A", "D"), ("B", "C"), ("E", "F")])
+
+    def test_matching_fallback_when_the_search_budget_is_exhausted(self):
+        # Deux triangles reliés par une seule paire possible : le seul appariement passe par C - D
+        standings = ["A", "B", "C", "D", "E", "F"]
+        allowed = {("A", "B"), ("B", "C"), ("A", "C"), ("C", "D"), ("D", "E"), ("E", "F"), ("D", "F")}
+        played_pairs = all_pairs_except(standings, allowed)
+        expected = [("A", "B"), ("C", "D"), ("E", "F")]
+        self.assertEqual(pair_players(standings, played_pairs), expected)
+        for search_budget in (0, 1, 3):
+            with self.subTest(search_budget=search_budget):
+                pairings = pair_players(standings, played_pairs, search_budget=search_budget)
+                self.assert_legal(pairings, standings, played_pairs)
+                self.assertEqual(sorted(pairings), expected)
+
+    def test_matching_fallback_on_a_larger_event(self):
+        rng = random.Random(3)
+        standings = [f"P{index:02d}" for index in range(40)]
+        played_pairs = {pair for pair in itertools.combinations(standings, 2) if rng.random() < 0.7}
+        pairings = pair_players(standings, played_pairs, search_budget=5)
+        self.assert_legal(pairings, standings, played_pairs)
+
+    def test_no_legal_pairing(self):
+        standings = ["A", "B", "C", "D"]
+        # A a déjà rencontré tous les autres joueurs
+        played_pairs = {("A", "B"), ("C", "A"), ("A", "D")}
+        for search_budget in (None, 0):
+            with self.subTest(search_budget=search_budget):
+                with self.assertRaises(PairingError):
+                    pair_players(standings, played_pairs, search_budget=search_budget)
+
+    def test_odd_number_of_players(self):
+        with self.assertRaises(PairingError):
+            pair_players(["A", "B", "C"], set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests of the record of the pairs already played.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import itertools
+import unittest
+
+from model.played_pairs import PlayedPairs
+
+
+def player_json(national_chess_id):
+    return {"firstname": "Jean", "lastname": "Dupont", "birth": "01-01-1990", "national chess ID": national_chess_id}
+
+
+class PlayedPairsTest(unittest.TestCase):
+
+    def test_pairs_are_symmetric(self):
+        played_pairs = PlayedPairs()
+        played_pairs.add("AA00001", "AA00002")
+        played_pairs.add("AA00002", "AA00001")
+        self.assertEqual(len(played_pairs), 1)
+        self.assertIn(("AA00002", "AA00001"), played_pairs)
+        self.assertTrue(played_pairs.has_played("AA00001", "AA00002"))
+        self.assertFalse(played_pairs.has_played("AA00001", "AA00003"))
+        self.assertNotIn(("AA00003", "AA00004"), played_pairs)
+
+    def test_json_round_trip(self):
+        # Plus de huit joueurs : les bits des adversaires occupent plusieurs octets
+        players = [f"AA{index:05d}" for index in range(20)]
+        pairs = {pair for index, pair in enumerate(itertools.combinations(players, 2)) if index % 3 == 0}
+        played_pairs = PlayedPairs()
+        for player1_id, player2_id in pairs:
+            played_pairs.add(player1_id, player2_id)
+
+        json_data = played_pairs.to_json()
+        self.assertEqual(len(json_data), len(pairs))
+        self.assertEqual({frozenset(pair) for pair in json_data}, {frozenset(pair) for pair in pairs})
+
+        reloaded = PlayedPairs.from_json(json_data)
+        self.assertEqual(len(reloaded), len(pairs))
+        for player1_id, player2_id in itertools.combinations(players, 2):
+            expected = (player1_id, player2_id) in pairs
+            self.assertEqual(reloaded.has_played(player1_id, player2_id), expected)
+            self.assertEqual(reloaded.has_played(player2_id, player1_id), expected)
+        self.assertEqual({frozenset(pair) for pair in reloaded.to_json()}, {frozenset(pair) for pair in pairs})
+
+    def test_legacy_dict_format(self):
+        # Ancien format : les deux joueurs de chaque paire enregistrés en entier
+        json_data = [{"player1": player_json("AA00001"), "player2": player_json("AA00002")},
+                     {"player1": player_json("AA00003"), "player2": player_json("AA00001")},
+                     {"player1": player_json("AA00002"), "player2": player_json("AA00001")}]
+        played_pairs = PlayedPairs.from_json(json_data)
+        self.assertEqual(len(played_pairs), 2)
+        self.assertIn(("AA00001", "AA00003"), played_pairs)
+        self.assertNotIn(("AA00002", "AA00003"), played_pairs)
+        self.assertEqual(played_pairs.to_json(), [["AA00001", "AA00002"], ["AA00001", "AA00003"]])
+
+    def test_mixed_formats(self):
+        played_pairs = PlayedPairs.from_json([["AA00001", "AA00002"],
+                                              {"player1": player_json("AA00003"), "player2": player_json("AA00004")}])
+        self.assertEqual(sorted(map(tuple, played_pairs.to_json())), [("AA00001", "AA00002"), ("AA00003", "AA00004")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests of the games of each player taken from the stored tournaments.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import os
+import unittest
+
+from model.match import Match
+from model.player import Player
+from model.round import Round
+from model.tournament import Tournament
+from repository.player_history_index import tournament_postings
+from repository.tournament_repository import TournamentRepository
+
+
+def create_homonyms_tournament():
+    """A tournament in which two players have the same name, and play each other then other players."""
+    players = [Player("Jean", "Dupont", "01-01-1990", "AA00001"),
+               Player("Jean", "Dupont", "02-02-1992", "AA00002"),
+               Player("Anne", "Martin", "03-03-1993", "AA00003"),
+               Player("Paul", "Durand", "04-04-1994", "AA00004")]
+    tournament = Tournament(name="Homonymes", place="Lyon", date_start="01-04-2025", date_end="02-04-2025")
+    tournament.players_list = players
+    for name, matches in (("Round 1", [Match(players[1], players[2], "win"), Match(players[0], players[3], "loss")]),
+                          ("Round 2", [Match(players[0], players[1], "draw"), Match(players[2], players[3])])):
+        round = Round(name, [], None, None)
+        for match in matches:
+            round.add_match(match)
+        tournament.add_round(round)
+    return tournament
+
+
+class TournamentPostingsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tournament_data = TournamentRepository(os.devnull)._tournament_to_data(create_homonyms_tournament())
+
+    def test_homonyms_keep_their_own_games(self):
+        postings = tournament_postings(self.tournament_data)
+        self.assertEqual(postings["AA00001"], [[0, 2, "AA00004", "Paul Durand", 0, 1],
+                                               [1, 1, "AA00002", "Jean Dupont", 0.5, 0.5]])
+        self.assertEqual(postings["AA00002"], [[0, 1, "AA00003", "Anne Martin", 1, 0],
+                                               [1, 1, "AA00001", "Jean Dupont", 0.5, 0.5]])
+        # Le match sans résultat n'est pas compté
+        self.assertEqual(postings["AA00003"], [[0, 1, "AA00002", "Jean Dupont", 0, 1]])
+
+    def test_homonyms_are_reloaded_at_their_place(self):
+        tournament = Tournament.from_json(self.tournament_data)
+        first_round = tournament.rounds[0]
+        self.assertEqual([match.player1.national_chess_id for match in first_round.matches], ["AA00002", "AA00001"])
+        self.assertEqual([match.result for match in first_round.matches], ["win", "loss"])
+
+    def test_matches_saved_without_ids(self):
+        # Fichiers enregistrés avant les identifiants : les joueurs sont retrouvés par leur nom complet, ce qui
+        # ne distingue pas les homonymes (le dernier inscrit sous ce nom est retenu)
+        for round_data in self.tournament_data["rounds"]:
+            for match_data in round_data["matches"]:
+                del match_data["player_ids"]
+        postings = tournament_postings(self.tournament_data)
+        self.assertEqual(postings["AA00003"], [[0, 1, "AA00002", "Jean Dupont", 0, 1]])
+        self.assertNotIn("AA00001", postings)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests of the cache of the Elo ratings.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from model.match import Match
+from model.player import Player
+from model.round import Round
+from model.tournament import Tournament
+from repository.rating_repository import RatingRepository
+from repository.tournament_repository import TournamentRepository
+
+PLAYERS = [Player(f"Joueur{index}", "Elo", "01-01-2000", f"EL{index:05d}") for index in range(4)]
+
+
+def create_tournament(name, date_start, rounds):
+    """A tournament of the four players, rounds being (start_time, results of the boards) tuples."""
+    tournament = Tournament(name=name, place="Lyon", date_start=date_start, date_end=date_start)
+    tournament.players_list = list(PLAYERS)
+    for number, (start_time, results) in enumerate(rounds):
+        round = Round(f"Round {number + 1}", [], None, None)
+        round.start_time = start_time
+        for board, result in enumerate(results):
+            round.add_match(Match(PLAYERS[(board + number) % 4], PLAYERS[(board + number + 2) % 4], result))
+        tournament.add_round(round)
+    tournament.current_round = len(rounds)
+    return tournament
+
+
+class RatingRepositoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.tournament_repository = TournamentRepository(os.path.join(self.directory.name, "tournament.json"))
+
+    def save(self, tournament):
+        self.tournament_repository.add_tournament(tournament)
+
+    def assert_same_as_replay(self, repository):
+        """Check the cached ratings against ratings replayed from scratch in another cache file."""
+        replayed = RatingRepository(self.tournament_repository, os.path.join(self.directory.name, "replay.ratings"))
+        replayed.rebuild()
+        self.assertEqual(repository.get_ratings(), replayed.get_ratings())
+
+    def test_undated_rounds_do_not_replay_the_ratings(self):
+        self.save(create_tournament("Daté", "01-03-2025", [("01-03-2025 10:00", ["win", "draw"]),
+                                                           ("01-03-2025 14:00", ["loss", "win"])]))
+        repository = RatingRepository(self.tournament_repository)
+        repository.refresh()
+
+        # Tournoi plus récent dont les rounds n'ont pas d'heure de début : ils prennent sa date de début
+        undated = create_tournament("Sans heure", "02-04-2025", [(None, ["win", "win"])])
+        self.save(undated)
+        with mock.patch.object(repository, "rebuild", wraps=repository.rebuild) as rebuild:
+            repository.update_tournament(undated)
+            undated.rounds.append(create_tournament("", "", [(None, ["draw", "loss"])]).rounds[0])
+            undated.current_round += 1
+            self.save(undated)
+            repository.update_tournament(undated)
+            # Cache relu par un autre programme : rien à noter de nouveau
+            RatingRepository(self.tournament_repository).refresh()
+        rebuild.assert_not_called()
+        self.assert_same_as_replay(repository)
+
+    def test_corrected_result_is_rated_again(self):
+        tournament = create_tournament("Corrigé", "01-03-2025", [("01-03-2025 10:00", ["win", "draw"])])
+        self.save(tournament)
+        repository = RatingRepository(self.tournament_repository)
+        repository.update_tournament(tournament)
+        ratings = repository.get_ratings()
+
+        tournament.record_result(tournament.rounds[0].matches[0], "loss")
+        self.save(tournament)
+        repository.update_tournament(tournament)
+        self.assertNotEqual(repository.get_ratings(), ratings)
+        self.assert_same_as_replay(repository)
+
+        # Correction enregistrée par un autre programme : relue avec le cache
+        tournament.record_result(tournament.rounds[0].matches[1], "win")
+        self.save(tournament)
+        reloaded = RatingRepository(self.tournament_repository)
+        self.assert_same_as_replay(reloaded)
+
+    def test_unchanged_tournaments_are_not_rated_again(self):
+        self.save(create_tournament("Stable", "01-03-2025", [("01-03-2025 10:00", ["win", "draw"])]))
+        RatingRepository(self.tournament_repository).refresh()
+
+        repository = RatingRepository(self.tournament_repository)
+        with mock.patch("repository.rating_repository.completed_rounds") as completed_rounds, \
+                mock.patch.object(repository, "_save") as save:
+            repository.refresh()
+        completed_rounds.assert_not_called()
+        save.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
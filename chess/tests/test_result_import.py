@@ -0,0 +1,74 @@
+"""
+Tests of the import of the results of a round.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import io
+import unittest
+
+from model.match import Match
+from model.player import Player
+from utils.result_import import ResultImportError, read_results, validate_results
+
+
+def create_matches():
+    players = [Player(f"Joueur{index}", "Import", "01-01-2000", f"RI{index:05d}") for index in range(6)]
+    return [Match(players[0], players[1]), Match(players[2], players[3]), Match(players[4], players[5])]
+
+
+class ValidateResultsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.matches = create_matches()
+
+    def assert_errors(self, entries, expected, partial=False):
+        with self.assertRaises(ResultImportError) as context:
+            validate_results(self.matches, entries, partial)
+        self.assertEqual(len(context.exception.errors), len(expected))
+        for error, text in zip(context.exception.errors, expected):
+            self.assertIn(text, error)
+
+    def test_complete_round(self):
+        entries = read_results(io.StringIO("board,result\n3,1/2-1/2\n1,1-0\n2,loss\n"))
+        self.assertEqual(validate_results(self.matches, entries),
+                         [(self.matches[0], "win"), (self.matches[1], "loss"), (self.matches[2], "draw")])
+
+    def test_missing_boards(self):
+        entries = [{"board": 2, "result": "win"}]
+        self.assert_errors(entries, ["échiquier 1", "échiquier 3"])
+        # Résultats envoyés échiquier par échiquier : les autres peuvent manquer
+        self.assertEqual(validate_results(self.matches, entries, partial=True), [(self.matches[1], "win")])
+
+    def test_missing_board_already_recorded(self):
+        self.matches[0].set_result("draw")
+        entries = [{"board": 2, "result": "win"}, {"board": 3, "result": "loss"}]
+        self.assertEqual(validate_results(self.matches, entries), [(self.matches[1], "win"), (self.matches[2], "loss")])
+
+    def test_duplicate_boards(self):
+        entries = [{"board": 1, "result": "win"}, {"board": 2, "result": "win"}, {"board": "1", "result": "loss"},
+                   {"board": 3, "result": "draw"}]
+        self.assert_errors(entries, ["Ligne 3 : l'échiquier 1 a déjà un résultat"])
+
+    def test_unknown_boards(self):
+        entries = [{"board": 0, "result": "win"}, {"board": 4, "result": "win"}, {"board": "deux", "result": "win"},
+                   {"board": 1, "result": "win"}, {"board": 2, "result": "win"}, {"board": 3, "result": "win"}]
+        self.assert_errors(entries, ["Ligne 1 : l'échiquier 0 n'existe pas", "Ligne 2 : l'échiquier 4 n'existe pas",
+                                     "Ligne 3 : numéro d'échiquier invalide"])
+
+    def test_every_problem_is_reported_at_once(self):
+        entries = [{"board": 1, "result": "gagné"}, {"board": 1, "result": "win"},
+                   {"board": 2, "result": "win", "player1": "Joueur3 Import", "player2": "Joueur2 Import"}]
+        # L'échiquier 1 est mentionné : seul l'échiquier 3 est signalé manquant
+        self.assert_errors(entries, ["Ligne 1 : résultat invalide", "Ligne 2 : l'échiquier 1 a déjà un résultat",
+                                     "Ligne 3 : l'échiquier 2 oppose Joueur2 Import à Joueur3 Import",
+                                     "Résultat manquant pour l'échiquier 3"])
+
+    def test_result_already_recorded(self):
+        self.matches[1].set_result("win")
+        self.assert_errors([{"board": 2, "result": "loss"}], ["l'échiquier 2 est déjà enregistré"], partial=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests of the incremental score ledger against the ledger rebuilt from the crosstable.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+
+from model.player import Player
+from model.round import Round
+from model.score_ledger import ScoreLedger
+from model.tournament import Tournament
+
+RESULTS = ("win", "loss", "draw")
+
+
+def create_tournament(player_count):
+    tournament = Tournament(name="Registre", place="Lyon", date_start="01-04-2025", date_end="02-04-2025")
+    tournament.players_list = [Player(f"Joueur{index}", "Registre", "01-01-2000", f"SL{index:05d}")
+                               for index in range(player_count)]
+    return tournament
+
+
+def start_round(tournament, number):
+    tournament.rounds.append(Round(f"Round {number + 1}", [], None, None))
+    tournament.current_round = number
+    return tournament.generate_pairs_for_round()
+
+
+class ScoreLedgerTest(unittest.TestCase):
+
+    def assert_same_ledger(self, tournament):
+        """Check the incremental ledger of the tournament against a ledger rebuilt from scratch."""
+        ledger = tournament.score_ledger
+        rebuilt = ScoreLedger.from_crosstable(tournament.crosstable)
+        self.assertEqual(ledger.detailed_standings(), rebuilt.detailed_standings())
+        for player in tournament.players_list:
+            self.assertEqual(ledger.get_score(player), rebuilt.get_score(player))
+            self.assertEqual(ledger.get_tiebreaks(player), rebuilt.get_tiebreaks(player))
+            self.assertEqual(ledger.get_opponents(player), rebuilt.get_opponents(player))
+
+    def test_results_recorded_one_by_one(self):
+        rng = random.Random(5)
+        tournament = create_tournament(12)
+        for number in range(5):
+            for match in start_round(tournament, number):
+                tournament.record_result(match, rng.choice(RESULTS))
+                self.assert_same_ledger(tournament)
+
+    def test_corrected_results(self):
+        rng = random.Random(11)
+        tournament = create_tournament(10)
+        for number in range(4):
+            for match in start_round(tournament, number):
+                tournament.record_result(match, rng.choice(RESULTS))
+        self.assert_same_ledger(tournament)
+
+        # Corrections dans un round déjà joué puis dans le dernier : les adversaires des deux joueurs changent
+        # de départages, et les parties jouées après la partie corrigée de score cumulé
+        for number, board, result in ((0, 0, "loss"), (1, 2, "draw"), (3, 4, "win"), (0, 0, "win"), (2, 1, "draw")):
+            match = tournament.rounds[number].matches[board]
+            with self.subTest(round=number, board=board, previous=match.result, result=result):
+                tournament.record_result(match, result)
+                self.assert_same_ledger(tournament)
+
+    def test_correction_then_new_results(self):
+        rng = random.Random(2)
+        tournament = create_tournament(8)
+        first_round = start_round(tournament, 0)
+        for match in first_round:
+            tournament.record_result(match, "win")
+        tournament.record_result(first_round[1], "loss")
+        for match in start_round(tournament, 1):
+            tournament.record_result(match, rng.choice(RESULTS))
+        self.assert_same_ledger(tournament)
+
+
+if __name__ == "__main__":
+    unittest.main()
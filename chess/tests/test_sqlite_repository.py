@@ -0,0 +1,155 @@
+"""
+Tests of the SQLite storage of the tournaments.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from model.tournament import Tournament
+from repository import sqlite_repository
+from repository.sqlite_repository import SCHEMA, SCHEMA_VERSION, SQLiteTournamentRepository
+from tests.test_player_history_index import create_homonyms_tournament
+
+# Tables des matchs et des joueurs inscrits avant la version 3 du schéma
+SCHEMA_V2_TABLES = """
+CREATE TABLE tournament_players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    national_chess_id TEXT NOT NULL REFERENCES players (national_chess_id),
+    firstname TEXT NOT NULL,
+    lastname TEXT NOT NULL,
+    birth TEXT NOT NULL,
+    PRIMARY KEY (tournament_id, position)
+);
+CREATE TABLE matches (
+    round_id INTEGER NOT NULL REFERENCES rounds (id) ON DELETE CASCADE,
+    board INTEGER NOT NULL,
+    player1_name TEXT,
+    score1 REAL,
+    player2_name TEXT,
+    score2 REAL,
+    PRIMARY KEY (round_id, board)
+);
+"""
+
+PLAYERS = [("AA00003", "Anne", "Martin", "03-03-1993"), ("AA00004", "Paul", "Durand", "04-04-1994")]
+
+
+class SQLiteTournamentRepositoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.database = os.path.join(self.directory.name, "chess.db")
+
+    def open_repository(self):
+        repository = SQLiteTournamentRepository(self.database)
+        self.addCleanup(repository._connection.close)
+        return repository
+
+    def test_matches_are_stored_by_national_chess_id(self):
+        repository = self.open_repository()
+        repository.add_tournament(create_homonyms_tournament())
+
+        rows = repository._connection.execute(
+            "SELECT rounds.number, board, player1_id, player2_id, result FROM matches "
+            "JOIN rounds ON rounds.id = matches.round_id ORDER BY rounds.number, board").fetchall()
+        self.assertEqual([tuple(row) for row in rows], [(0, 0, "AA00002", "AA00003", "win"),
+                                                         (0, 1, "AA00001", "AA00004", "loss"),
+                                                         (1, 0, "AA00001", "AA00002", "draw"),
+                                                         (1, 1, "AA00003", "AA00004", None)])
+
+        # Les homonymes sont relus à leur place, avec le résultat enregistré
+        tournament = Tournament.from_json(self.open_repository().get_tournament("Homonymes"))
+        matches = [match for round in tournament.rounds for match in round.matches]
+        self.assertEqual([(match.player1.national_chess_id, match.player2.national_chess_id, match.result)
+                          for match in matches], [tuple(row)[2:] for row in rows])
+
+    def test_migration_of_a_version_2_database(self):
+        connection = sqlite3.connect(self.database)
+        # Schéma actuel, sauf les deux tables d'avant la version 3
+        connection.executescript(SCHEMA.replace("EXISTS tournament_players", "EXISTS tournament_players_v3")
+                                 .replace("EXISTS matches", "EXISTS matches_v3")
+                                 .replace("ON tournament_players", "ON tournament_players_v3"))
+        connection.executescript("DROP TABLE tournament_players_v3; DROP TABLE matches_v3;" + SCHEMA_V2_TABLES)
+        with connection:
+            connection.executemany("INSERT INTO players (national_chess_id, firstname, lastname, birth) "
+                                   "VALUES (?, ?, ?, ?)", PLAYERS)
+            connection.execute("INSERT INTO tournaments VALUES (1, 'Ancien', 'ancien', 'Lyon', '01-04-2025', "
+                               "'02-04-2025', '', 1, 1, 2, 1)")
+            connection.executemany("INSERT INTO tournament_players VALUES (1, ?, ?, ?, ?, ?)",
+                                   [(position, *player) for position, player in enumerate(PLAYERS)])
+            connection.executemany("INSERT INTO tournament_scores VALUES (1, ?, ?, ?)",
+                                   [(0, "Anne Martin", 0.5), (1, "Paul Durand", 0.5)])
+            connection.execute("INSERT INTO rounds VALUES (1, 1, 0, 'Round 1', NULL, NULL)")
+            connection.execute("INSERT INTO matches VALUES (1, 0, 'Anne Martin', 0.5, 'Paul Durand', 0.5)")
+            connection.execute("PRAGMA user_version = 2")
+        connection.close()
+
+        repository = self.open_repository()
+        self.assertEqual(repository._connection.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+        self.assertEqual(tuple(repository._connection.execute("SELECT * FROM matches").fetchone()),
+                         (1, 0, "AA00003", "AA00004", "draw"))
+        match_data = repository.get_tournament("Ancien")["rounds"][0]["matches"][0]
+        self.assertEqual(match_data, {"players": {"Anne Martin": 0.5, "Paul Durand": 0.5},
+                                      "player_ids": ["AA00003", "AA00004"], "result": "draw"})
+
+    def test_reads_during_saves_from_other_threads(self):
+        # Un seul dépôt, comme dans le service : lectures et enregistrements viennent de threads différents
+        repository = self.open_repository()
+        tournament = create_homonyms_tournament()
+        repository.add_tournament(tournament)
+        done = threading.Event()
+        errors, inconsistent = [], []
+        insert_player = sqlite_repository._insert_player
+
+        def slow_insert_player(connection, player_data):
+            # Enregistrement ralenti : les lectures tombent au milieu de sa transaction
+            time.sleep(0.001)
+            return insert_player(connection, player_data)
+
+        def save():
+            try:
+                for _ in range(50):
+                    tournament.director_note = f"Note {tournament.version + 1}"
+                    repository.add_tournament(tournament)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                done.set()
+
+        def read():
+            try:
+                while not done.is_set():
+                    tournament_data = repository.get_tournament("Homonymes")
+                    # Jamais un enregistrement à moitié écrit : la note et les joueurs vont avec la version
+                    if (tournament_data["director_note"] not in ("", f"Note {tournament_data['version']}")
+                            or len(tournament_data["players_list"]) != 4
+                            or sum(len(round_data["matches"]) for round_data in tournament_data["rounds"]) != 4):
+                        inconsistent.append(tournament_data["version"])
+                    repository.get_tournament_headers()
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=save)] + [threading.Thread(target=read) for _ in range(2)]
+        with mock.patch.object(sqlite_repository, "_insert_player", slow_insert_player):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(inconsistent, [])
+        self.assertEqual(repository.get_tournament("Homonymes")["version"], 51)
+
+
+if __name__ == "__main__":
+    unittest.main()
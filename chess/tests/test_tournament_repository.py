@@ -0,0 +1,78 @@
+"""
+Tests of the journal of the JSON tournament repository.
+
+Usage:
+    python -m unittest discover tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from model.tournament import Tournament
+from repository.tournament_repository import TournamentRepository
+
+
+def create_tournament(name):
+    return Tournament(name=name, place="Lyon", date_start="01-04-2025", date_end="02-04-2025",
+                      director_note=f"Note {name}")
+
+
+class JournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.filename = os.path.join(self.directory.name, "tournament.json")
+
+    def truncate_last_record(self, repository):
+        """Cut the last record of the journal in the middle, as a crash during its write would."""
+        size = os.path.getsize(repository.journal_filename)
+        with open(repository.journal_filename, 'r+b') as file:
+            file.truncate(size - 20)
+
+    def test_save_after_a_truncated_record(self):
+        repository = TournamentRepository(self.filename, use_binary_snapshot=False)
+        repository.add_tournament(create_tournament("A"))
+        repository.add_tournament(create_tournament("B"))
+        self.truncate_last_record(repository)
+
+        repository = TournamentRepository(self.filename, use_binary_snapshot=False)
+        repository.add_tournament(create_tournament("C"))
+        repository.add_tournament(create_tournament("D"))
+
+        reloaded = TournamentRepository(self.filename, use_binary_snapshot=False)
+        self.assertEqual([data["name"] for data in reloaded.load_tournaments()], ["A", "C", "D"])
+        self.assertEqual(reloaded.get_tournament("C")["director_note"], "Note C")
+        self.assertEqual([header.name for header in reloaded.get_tournament_headers()], ["A", "C", "D"])
+
+        # Le journal intégré au fichier JSON, les enregistrements qui suivaient la ligne tronquée y sont
+        reloaded.compact()
+        self.assertFalse(os.path.exists(reloaded.journal_filename))
+        with open(self.filename, 'r') as file:
+            self.assertEqual([data["name"] for data in json.load(file)], ["A", "C", "D"])
+        self.assertEqual([header.name for header in reloaded.get_tournament_headers()], ["A", "C", "D"])
+
+    def test_truncated_record_of_a_saved_tournament(self):
+        repository = TournamentRepository(self.filename, use_binary_snapshot=False)
+        tournament = create_tournament("A")
+        repository.add_tournament(tournament)
+        tournament.director_note = "Modifiée"
+        repository.add_tournament(tournament)
+        self.truncate_last_record(repository)
+
+        # La version précédente est relue, puis un nouvel enregistrement la remplace
+        repository = TournamentRepository(self.filename, use_binary_snapshot=False)
+        stored = Tournament.from_json(repository.get_tournament("A"))
+        self.assertEqual((stored.version, stored.director_note), (1, "Note A"))
+        stored.director_note = "Après l'arrêt"
+        repository.add_tournament(stored)
+
+        reloaded = TournamentRepository(self.filename, use_binary_snapshot=False)
+        self.assertEqual(reloaded.get_tournament("A")["director_note"], "Après l'arrêt")
+        self.assertEqual(reloaded.get_tournament("A")["version"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+This module contains functions to read and write a JSON array one element at a time, so that large
+files can be processed with constant memory.
+
+Functions:
+    iter_json_array: Yield the elements of a JSON array stored in a file.
+    write_json_array: Write elements as a JSON array formatted like json.dump(..., indent=4).
+"""
+
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(file, chunk_size=64 * 1024):
+    """Yield the elements of the JSON array stored in a text file, one at a time.
+
+    Args:
+        file: A file object opened in text mode, positioned at the start of the array.
+        chunk_size (int, optional): Number of characters read at a time. Defaults to 64 KiB.
+
+    Yields:
+        The decoded elements of the array, in order.
+
+    Raises:
+        ValueError: If the file does not contain a JSON array.
+    """
+    buffer = file.read(chunk_size)
+    eof = not buffer
+    position = _skip(buffer, 0, _WHITESPACE)
+    if position == len(buffer):
+        return
+    if buffer[position] != "[":
+        raise ValueError("Le fichier ne contient pas un tableau JSON.")
+    position += 1
+
+    while True:
+        position = _skip(buffer, position, _WHITESPACE + ",")
+        while position == len(buffer) and not eof:
+            buffer, position, eof = _read_more(file, buffer, position, chunk_size)
+            position = _skip(buffer, position, _WHITESPACE + ",")
+        if position == len(buffer):
+            raise ValueError("Tableau JSON incomplet.")
+        if buffer[position] == "]":
+            return
+
+        try:
+            element, end = _decoder.raw_decode(buffer, position)
+            # Un nombre (ou true, false, null) n'est complet que suivi d'un séparateur : coupé par la fin du
+            # tampon, "1." ou "2e" seraient décodés 1 et 2
+            complete = (eof or isinstance(element, (dict, list, str)) or
+                        (end < len(buffer) and buffer[end] in _WHITESPACE + ",]"))
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+
+        if not complete:
+            # Lire au moins autant que le tampon actuel pour ne pas redécoder trop souvent le même élément
+            buffer, position, eof = _read_more(file, buffer, position, max(chunk_size, len(buffer)))
+            continue
+
+        yield element
+        position = end
+
+
+def _skip(buffer, position, characters):
+    while position < len(buffer) and buffer[position] in characters:
+        position += 1
+    return position
+
+
+def _read_more(file, buffer, position, size):
+    """Drop the consumed part of the buffer and append the next chunk of the file."""
+    chunk = file.read(size)
+    return buffer[position:] + chunk, 0, not chunk
+
+
+def write_json_array(file, elements):
+    """Write elements to a text file as a JSON array, one element at a time.
+
+    The output is identical to json.dump(list(elements), file, indent=4).
+
+    Args:
+        file: A file object opened in text mode.
+        elements: An iterable of JSON-compatible values.
+    """
+    separator = "[\n"
+    for element in elements:
+        file.write(separator)
+        file.write("\n".join("    " + line for line in json.dumps(element, indent=4).split("\n")))
+        separator = ",\n"
+    file.write("[]" if separator == "[\n" else "\n]")
+
+
+if __name__ == "__main__":
+    pass
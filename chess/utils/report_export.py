@@ -0,0 +1,263 @@
+"""
+This module exports the pairings, the standings and the full reports of tournaments to CSV files and to
+static HTML pages, to publish them after each round.
+
+The rows of the reports are produced by generators and written to the output stream one at a time. A report
+of the whole archive takes the tournaments from an iterator (e.g. TournamentRepository.iter_tournaments),
+so only one tournament is in memory at a time, whatever the size of the archive.
+
+Reports:
+    pairings   The boards of a round of a tournament.
+    standings  The standings of a tournament, with the tiebreaks.
+    crosstable The crosstable of a tournament: one row per player, one column per round.
+    report     The details, standings, crosstable and rounds of tournaments (in CSV: one row per game).
+
+Classes:
+    ReportExportError: Raised when a report cannot be produced.
+
+Functions:
+    iter_pairing_rows: The boards of a round.
+    iter_standing_rows: The standings of a tournament.
+    iter_crosstable_rows: The crosstable of a tournament.
+    iter_game_rows: The games of several tournaments.
+    iter_csv_report: The lines of a report in CSV.
+    iter_html_report: The chunks of a report in HTML.
+    write_report: Write a report to a stream.
+"""
+
+import csv
+import io
+from html import escape
+
+from model.crosstable import format_cell
+
+REPORTS = ("pairings", "standings", "crosstable", "report")
+FORMATS = ("csv", "html")
+
+# Colonnes des rapports : nom de la colonne CSV et titre de la colonne HTML
+PAIRING_COLUMNS = (("round", "Round"), ("board", "Échiquier"), ("player1", "Joueur 1"),
+                   ("player1_id", "Identifiant"), ("player2", "Joueur 2"), ("player2_id", "Identifiant"),
+                   ("score", "Score"))
+STANDING_COLUMNS = (("rank", "Rang"), ("player", "Joueur"), ("national_chess_id", "Identifiant"),
+                    ("points", "Points"), ("buchholz", "Buchholz"), ("sonneborn_berger", "Sonneborn-Berger"),
+                    ("progressive", "Cumulatif"))
+GAME_COLUMNS = (("tournament", "Tournoi"),) + PAIRING_COLUMNS
+# Les colonnes des rounds de la grille américaine dépendent du tournoi (voir get_crosstable_columns)
+CROSSTABLE_COLUMNS = (("rank", "Rang"), ("player", "Joueur"), ("national_chess_id", "Identifiant"))
+
+HTML_HEADER = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; margin-bottom: 1.5em; }}
+th, td {{ border: 1px solid #999; padding: 0.2em 0.6em; text-align: left; }}
+th {{ background: #eee; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+"""
+HTML_FOOTER = "</body>\n</html>\n"
+
+
+class ReportExportError(Exception):
+    """Raised when a report cannot be produced (e.g. a round which does not exist)."""
+
+
+def get_default_round(tournament):
+    """Return the index of the last round of a tournament which has pairings.
+
+    Raises:
+        ReportExportError: If no round has been paired yet.
+    """
+    for round_index in range(len(tournament.rounds) - 1, -1, -1):
+        if tournament.rounds[round_index].matches:
+            return round_index
+    raise ReportExportError(f"Aucun round du tournoi {tournament.name} n'a encore été apparié.")
+
+
+def _match_row(round_number, board, match):
+    player1, player2 = match.player1, match.player2
+    score = "{}-{}".format(*match.points) if match.result is not None else ""
+    return (round_number, board, player1.fullname(), player1.national_chess_id, player2.fullname(),
+            player2.national_chess_id, score)
+
+
+def iter_pairing_rows(tournament, round_index):
+    """Yield the boards of a round: (round, board, player1, player1_id, player2, player2_id, score).
+
+    The score is empty for the boards without result. The matches whose players were not found in the
+    tournament (damaged data) are left out.
+    """
+    for board, match in enumerate(tournament.rounds[round_index].matches, 1):
+        if match.is_complete():
+            yield _match_row(round_index + 1, board, match)
+
+
+def iter_standing_rows(tournament):
+    """Yield the standings: (rank, player, national_chess_id, points, buchholz, sonneborn_berger, progressive)."""
+    for rank, (player, score, buchholz, sonneborn_berger, progressive) in enumerate(
+            tournament.crosstable.detailed_standings(), 1):
+        yield rank, player.fullname(), player.national_chess_id, score, buchholz, sonneborn_berger, progressive
+
+
+def get_crosstable_columns(tournament):
+    """Return the columns of the crosstable of a tournament: rank, player, one column per round, points."""
+    round_columns = tuple((f"round{number}", f"R{number}") for number in range(1, len(tournament.rounds) + 1))
+    return CROSSTABLE_COLUMNS + round_columns + (("points", "Points"),)
+
+
+def iter_crosstable_rows(tournament):
+    """Yield the rows of the crosstable, in standings order: (rank, player, national_chess_id, *cells, points).
+
+    A cell gives the rank of the opponent and the result of the player ("5+", "3=", "2-"), see format_cell.
+    """
+    for rank, player, cells, score in tournament.crosstable.rows():
+        yield (rank, player.fullname(), player.national_chess_id,
+               *(format_cell(opponent_rank, points) for opponent_rank, points in cells), score)
+
+
+def iter_game_rows(tournaments):
+    """Yield the games of tournaments, one tournament at a time: (tournament, *pairing row)."""
+    for tournament in tournaments:
+        for round_index in range(len(tournament.rounds)):
+            for row in iter_pairing_rows(tournament, round_index):
+                yield (tournament.name,) + row
+
+
+def iter_csv_lines(columns, rows):
+    """Yield the lines of a CSV file: the header, then one line per row."""
+    buffer = io.StringIO()
+    # Fins de ligne "\n" : le fichier peut être ouvert en mode texte, sans newline=''
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in _with_header(columns, rows):
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _with_header(columns, rows):
+    yield [name for name, _ in columns]
+    yield from rows
+
+
+def iter_html_table(columns, rows):
+    """Yield the chunks of an HTML table: the header, then one chunk per row."""
+    yield "<table>\n<thead><tr>" + "".join(f"<th>{escape(label)}</th>" for _, label in columns)
+    yield "</tr></thead>\n<tbody>\n"
+    for row in rows:
+        yield "<tr>" + "".join(f"<td>{escape(str(value))}</td>" for value in row) + "</tr>\n"
+    yield "</tbody>\n</table>\n"
+
+
+def iter_html_tournament(tournament):
+    """Yield the chunks of the HTML report of a tournament: details, standings, crosstable, then the paired
+    rounds."""
+    yield f"<h2>{escape(tournament.name)}</h2>\n"
+    played_rounds = min(tournament.current_round, len(tournament.rounds))
+    yield (f"<p>{escape(tournament.place)}, du {escape(tournament.date_start)} au {escape(tournament.date_end)}"
+           f" &ndash; {len(tournament.players_list)} joueurs, {played_rounds} round(s) joué(s) sur "
+           f"{len(tournament.rounds)}</p>\n")
+    if tournament.director_note:
+        yield f"<p>Notes du directeur : {escape(tournament.director_note)}</p>\n"
+    yield "<h3>Classement</h3>\n"
+    yield from iter_html_table(STANDING_COLUMNS, iter_standing_rows(tournament))
+    yield "<h3>Grille américaine</h3>\n"
+    yield from iter_html_table(get_crosstable_columns(tournament), iter_crosstable_rows(tournament))
+    for round_index, round in enumerate(tournament.rounds):
+        if not round.matches:
+            continue
+        yield f"<h3>{escape(round.name)}</h3>\n"
+        yield from iter_html_table(PAIRING_COLUMNS, iter_pairing_rows(tournament, round_index))
+
+
+def iter_csv_report(report, tournaments, round_index=None):
+    """Yield the lines of a report in CSV.
+
+    Args:
+        report (str): 'pairings', 'standings', 'crosstable' or 'report'.
+        tournaments (Iterable[Tournament]): The tournament of the report (one, except for 'report').
+        round_index (int, optional): The round of the pairings. Defaults to the last paired round.
+    """
+    if report == "report":
+        yield from iter_csv_lines(GAME_COLUMNS, iter_game_rows(tournaments))
+        return
+    tournament = next(iter(tournaments))
+    if report == "standings":
+        yield from iter_csv_lines(STANDING_COLUMNS, iter_standing_rows(tournament))
+    elif report == "crosstable":
+        yield from iter_csv_lines(get_crosstable_columns(tournament), iter_crosstable_rows(tournament))
+    else:
+        round_index = get_default_round(tournament) if round_index is None else round_index
+        yield from iter_csv_lines(PAIRING_COLUMNS, iter_pairing_rows(tournament, round_index))
+
+
+def iter_html_report(report, tournaments, round_index=None, title=None):
+    """Yield the chunks of a report as a static HTML page.
+
+    Args:
+        report (str): 'pairings', 'standings', 'crosstable' or 'report'.
+        tournaments (Iterable[Tournament]): The tournament of the report (one, except for 'report').
+        round_index (int, optional): The round of the pairings. Defaults to the last paired round.
+        title (str, optional): The title of the page. Defaults to the name of the tournament.
+    """
+    if report == "report":
+        yield HTML_HEADER.format(title=escape(title or "Tournois"))
+        for tournament in tournaments:
+            yield from iter_html_tournament(tournament)
+        yield HTML_FOOTER
+        return
+
+    tournament = next(iter(tournaments))
+    if report == "standings":
+        yield HTML_HEADER.format(title=escape(title or f"{tournament.name} - Classement"))
+        yield from iter_html_table(STANDING_COLUMNS, iter_standing_rows(tournament))
+    elif report == "crosstable":
+        yield HTML_HEADER.format(title=escape(title or f"{tournament.name} - Grille américaine"))
+        yield from iter_html_table(get_crosstable_columns(tournament), iter_crosstable_rows(tournament))
+    else:
+        round_index = get_default_round(tournament) if round_index is None else round_index
+        round_name = tournament.rounds[round_index].name
+        yield HTML_HEADER.format(title=escape(title or f"{tournament.name} - Appariements du {round_name}"))
+        yield from iter_html_table(PAIRING_COLUMNS, iter_pairing_rows(tournament, round_index))
+    yield HTML_FOOTER
+
+
+def write_report(stream, report, file_format, tournaments, round_index=None):
+    """Write a report to a text stream, chunk by chunk.
+
+    Args:
+        stream: The output stream (an open file or sys.stdout).
+        report (str): 'pairings', 'standings', 'crosstable' or 'report'.
+        file_format (str): 'csv' or 'html'.
+        tournaments (Iterable[Tournament]): The tournaments of the report, consumed one at a time.
+        round_index (int, optional): The round of the pairings. Defaults to the last paired round.
+
+    Raises:
+        ReportExportError: If the report or the format is unknown, or the round does not exist or has no
+                           pairings.
+    """
+    if report not in REPORTS:
+        raise ReportExportError(f"Rapport inconnu : {report} (choix possibles : {', '.join(REPORTS)})")
+    if file_format not in FORMATS:
+        raise ReportExportError(f"Format inconnu : {file_format} (choix possibles : {', '.join(FORMATS)})")
+
+    if report == "pairings" and round_index is not None:
+        # Vérifier le round avant d'écrire quoi que ce soit
+        tournament = next(iter(tournaments))
+        if not 0 <= round_index < len(tournament.rounds):
+            raise ReportExportError(f"Le tournoi {tournament.name} n'a pas de round {round_index + 1}.")
+        if not tournament.rounds[round_index].matches:
+            raise ReportExportError(f"Le round {round_index + 1} du tournoi {tournament.name} n'est pas apparié.")
+        tournaments = [tournament]
+
+    chunks = iter_csv_report if file_format == "csv" else iter_html_report
+    stream.writelines(chunks(report, tournaments, round_index))
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,151 @@
+"""
+This module contains the functions used to import the results of a round from a CSV or JSON file,
+instead of entering them match by match.
+
+A result file has one entry per board, numbered from 1 in the order of the pairings:
+
+    CSV:  board,result[,player1,player2]
+    JSON: [{"board": 1, "result": "win", "player1": "First Last", "player2": "First Last"}, ...]
+
+The result is given for the first player of the board: 'win', 'loss' or 'draw' (or '1-0', '0-1', '1/2-1/2').
+The player names are optional; when present, they are checked against the pairings.
+
+Functions:
+    read_results: Read the result entries of a CSV or JSON stream.
+    validate_results: Check the entries against the matches of the round, in one pass.
+"""
+
+import csv
+import json
+
+RESULT_ALIASES = {
+    "win": "win",
+    "1-0": "win",
+    "loss": "loss",
+    "0-1": "loss",
+    "draw": "draw",
+    "1/2-1/2": "draw",
+    "0.5-0.5": "draw",
+}
+
+
+class ResultImportError(Exception):
+    """Raised when a result file cannot be read or does not match the pairings.
+
+    Attributes:
+        errors (List[str]): All the problems found in the file.
+    """
+
+    def __init__(self, errors):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+def read_results(stream, file_format=None):
+    """Read the result entries of a round.
+
+    Args:
+        stream: A text stream (an open file or sys.stdin).
+        file_format (str, optional): 'csv' or 'json'. By default, the format is detected from the content.
+
+    Returns:
+        List[dict]: The entries, with the keys 'board', 'result' and optionally 'player1' and 'player2'.
+
+    Raises:
+        ResultImportError: If the content cannot be parsed.
+    """
+    content = stream.read()
+    if file_format is None:
+        file_format = "json" if content.lstrip()[:1] in ("[", "{") else "csv"
+
+    if file_format == "json":
+        try:
+            entries = json.loads(content)
+        except json.JSONDecodeError as error:
+            raise ResultImportError([f"Fichier JSON invalide : {error}"])
+        if isinstance(entries, dict):
+            entries = entries.get("results", [])
+        if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+            raise ResultImportError(["Le fichier JSON doit contenir une liste de résultats."])
+        return entries
+
+    rows = [row for row in csv.reader(content.splitlines()) if row and any(cell.strip() for cell in row)]
+    if rows and rows[0][0].strip().lower() == "board":
+        rows = rows[1:]
+    entries = []
+    for row in rows:
+        entry = {"board": row[0].strip(), "result": row[1].strip() if len(row) > 1 else ""}
+        if len(row) > 3:
+            entry["player1"] = row[2].strip()
+            entry["player2"] = row[3].strip()
+        entries.append(entry)
+    return entries
+
+
+def validate_results(matches, entries, partial=False):
+    """Check result entries against the matches of a round.
+
+    Every problem is collected before raising, so the whole file can be corrected at once.
+
+    Args:
+        matches (List[Match]): The matches of the round, in board order.
+        entries (List[dict]): The entries read by read_results.
+        partial (bool, optional): If True, the matches without result may be left out (results sent board
+                                  by board by several arbiters).
+
+    Returns:
+        List[tuple]: (match, result) tuples, the result being 'win', 'loss' or 'draw'.
+
+    Raises:
+        ResultImportError: If an entry is invalid, a board is unknown or given twice, or a match has no result
+                           (unless partial is True).
+    """
+    errors = []
+    results = {}
+    # Échiquiers mentionnés dans le fichier, y compris ceux dont la ligne est erronée
+    seen_boards = set()
+
+    for line, entry in enumerate(entries, start=1):
+        try:
+            board = int(entry.get("board"))
+        except (TypeError, ValueError):
+            errors.append(f"Ligne {line} : numéro d'échiquier invalide ({entry.get('board')!r}).")
+            continue
+        if not 1 <= board <= len(matches):
+            errors.append(f"Ligne {line} : l'échiquier {board} n'existe pas dans ce round.")
+            continue
+        if board in seen_boards:
+            errors.append(f"Ligne {line} : l'échiquier {board} a déjà un résultat.")
+            continue
+        seen_boards.add(board)
+
+        result = RESULT_ALIASES.get(str(entry.get("result", "")).strip().lower())
+        if result is None:
+            errors.append(f"Ligne {line} : résultat invalide ({entry.get('result')!r}), "
+                          f"utilisez 'win', 'loss' ou 'draw'.")
+            continue
+
+        match = matches[board - 1]
+        if "player1" in entry or "player2" in entry:
+            expected = [player.fullname() for player, _ in match.seats()]
+            given = [entry.get("player1"), entry.get("player2")]
+            if given != expected:
+                errors.append(f"Ligne {line} : l'échiquier {board} oppose {expected[0]} à {expected[1]}, "
+                              f"pas {given[0]} à {given[1]}.")
+                continue
+        if match.result is not None:
+            errors.append(f"Ligne {line} : le résultat de l'échiquier {board} est déjà enregistré.")
+            continue
+        results[board] = result
+
+    for board, match in enumerate(matches, start=1):
+        if not partial and match.result is None and board not in seen_boards:
+            errors.append(f"Résultat manquant pour l'échiquier {board}.")
+
+    if errors:
+        raise ResultImportError(errors)
+    return [(matches[board - 1], result) for board, result in sorted(results.items())]
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,207 @@
+"""
+This module contains a search index on names, used to find players and tournaments by prefix or substring,
+without accents and case-insensitively.
+
+Each entry has one or several texts (e.g. last name and first name), whose normalized keys are computed once:
+    - a list of (key, entry) pairs sorted by key answers prefix searches with a binary search;
+    - a trigram index (every 3-character substring of the keys) answers substring searches by intersecting
+      the entries of the trigrams of the query.
+
+Classes:
+    SearchIndex: Prefix and substring search on the normalized texts of entries.
+
+Functions:
+    normalize_search_key: Return the accent-free, case-folded form of a text.
+
+Usage:
+    index = SearchIndex()
+    index.add("AB12345", player_data, player_data['lastname'], player_data['firstname'])
+    index.search("dupo")
+"""
+
+import bisect
+import heapq
+import re
+import unicodedata
+
+from functools import lru_cache
+
+_SEPARATORS = re.compile(r"[\s\-_']+")
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+
+@lru_cache(maxsize=65536)
+def normalize_search_key(text):
+    """Return the accent-free, case-folded form of a text, with hyphens and spaces collapsed into one space."""
+    if not text.isascii():
+        # Les lettres accentuées sont décomposées puis leurs accents retirés ; unidecode, plus lent, ne sert
+        # que pour les autres caractères (ß, ø, alphabets non latins...)
+        decomposed = _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text))
+        if decomposed.isascii():
+            text = decomposed
+        else:
+            # Import différé : unidecode charge ses tables au premier appel, inutile pour les noms latins
+            from unidecode import unidecode
+            text = unidecode(decomposed)
+    return _SEPARATORS.sub(" ", text.casefold()).strip()
+
+
+def _trigrams(key):
+    """Return the 3-character substrings of a key, or the key itself if it is shorter."""
+    if len(key) < 3:
+        return {key} if key else set()
+    return {key[position:position + 3] for position in range(len(key) - 2)}
+
+
+def _entry_trigrams(keys):
+    """Return the trigrams of all the keys of an entry, each one once."""
+    return set().union(*map(_trigrams, keys))
+
+
+class SearchIndex:
+    """Prefix and substring search on the normalized texts of entries."""
+
+    def __init__(self):
+        self._values = {}
+        self._keys = {}
+        self._sorted_keys = []
+        self._trigrams = {}
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, entry_id):
+        return entry_id in self._values
+
+    def add(self, entry_id, value, *texts):
+        """Add an entry, or replace the entry with the same identifier.
+
+        Args:
+            entry_id: The identifier of the entry (a national chess ID, a tournament name...).
+            value: The value returned by the searches.
+            *texts: The texts on which the entry is searched.
+        """
+        if entry_id in self._values:
+            self.remove(entry_id)
+        keys = tuple(dict.fromkeys(normalize_search_key(text) for text in texts if text))
+        self._values[entry_id] = value
+        self._keys[entry_id] = keys
+        for key in keys:
+            bisect.insort(self._sorted_keys, (key, entry_id))
+        for trigram in _entry_trigrams(keys):
+            self._trigrams.setdefault(trigram, set()).add(entry_id)
+
+    @classmethod
+    def build(cls, entries):
+        """Build an index from many entries at once, sorting the keys only once.
+
+        Args:
+            entries: An iterable of (entry_id, value, texts) tuples, texts being a sequence of texts.
+
+        Returns:
+            SearchIndex: The index.
+        """
+        search_index = cls()
+        for entry_id, value, texts in entries:
+            keys = tuple(dict.fromkeys(normalize_search_key(text) for text in texts if text))
+            search_index._values[entry_id] = value
+            search_index._keys[entry_id] = keys
+            search_index._sorted_keys.extend((key, entry_id) for key in keys)
+            for trigram in _entry_trigrams(keys):
+                search_index._trigrams.setdefault(trigram, set()).add(entry_id)
+        search_index._sorted_keys.sort()
+        return search_index
+
+    def remove(self, entry_id):
+        """Remove an entry, if present."""
+        if entry_id not in self._values:
+            return
+        del self._values[entry_id]
+        keys = self._keys.pop(entry_id)
+        for key in keys:
+            del self._sorted_keys[bisect.bisect_left(self._sorted_keys, (key, entry_id))]
+        for trigram in _entry_trigrams(keys):
+            entries = self._trigrams[trigram]
+            entries.discard(entry_id)
+            if not entries:
+                del self._trigrams[trigram]
+
+    def find_exact(self, text):
+        """Return the values of the entries having a text equal to the given one, accents and case ignored."""
+        key = normalize_search_key(text)
+        position = bisect.bisect_left(self._sorted_keys, (key,))
+        values = []
+        while position < len(self._sorted_keys) and self._sorted_keys[position][0] == key:
+            values.append(self._values[self._sorted_keys[position][1]])
+            position += 1
+        return values
+
+    def _prefix_ids(self, key, limit=None):
+        entry_ids = {}
+        position = bisect.bisect_left(self._sorted_keys, (key,))
+        while position < len(self._sorted_keys) and (limit is None or len(entry_ids) < limit):
+            entry_key, entry_id = self._sorted_keys[position]
+            if not entry_key.startswith(key):
+                break
+            entry_ids[entry_id] = None
+            position += 1
+        return list(entry_ids)
+
+    def _substring_ids(self, key):
+        if len(key) < 3:
+            # Requête courte : elle est contenue dans un trigramme (ou une clé courte) de chaque entrée trouvée
+            entry_ids = set()
+            for trigram, entries in self._trigrams.items():
+                if key in trigram:
+                    entry_ids |= entries
+            return entry_ids
+
+        postings = []
+        for trigram in _trigrams(key):
+            entries = self._trigrams.get(trigram)
+            if not entries:
+                return set()
+            postings.append(entries)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        # Les trigrammes peuvent être présents sans être consécutifs : vérifier chaque candidat
+        return {entry_id for entry_id in candidates if any(key in entry_key for entry_key in self._keys[entry_id])}
+
+    def prefix_search(self, text, limit=None):
+        """Return the values of the entries having a text starting with the given one, sorted by text."""
+        key = normalize_search_key(text)
+        return [self._values[entry_id] for entry_id in self._prefix_ids(key, limit)]
+
+    def _sorted_ids(self, entry_ids, limit=None):
+        """Sort entries by their keys, keeping only the first ones if a limit is given."""
+        if limit is None:
+            return sorted(entry_ids, key=self._keys.__getitem__)
+        return heapq.nsmallest(limit, entry_ids, key=self._keys.__getitem__)
+
+    def substring_search(self, text, limit=None):
+        """Return the values of the entries having a text containing the given one, sorted by first text."""
+        key = normalize_search_key(text)
+        return [self._values[entry_id] for entry_id in self._sorted_ids(self._substring_ids(key), limit)]
+
+    def search(self, text, limit=None):
+        """Return the values of the entries matching a text: prefix matches first, then substring matches.
+
+        Args:
+            text (str): The searched text. Accents, case and hyphens are ignored.
+            limit (int, optional): Maximum number of values returned.
+
+        Returns:
+            list: The values of the matching entries.
+        """
+        key = normalize_search_key(text)
+        if not key:
+            return []
+        entry_ids = self._prefix_ids(key, limit)
+        if limit is None or len(entry_ids) < limit:
+            others = self._substring_ids(key).difference(entry_ids)
+            entry_ids.extend(self._sorted_ids(others, None if limit is None else limit - len(entry_ids)))
+        return [self._values[entry_id] for entry_id in entry_ids]
+
+
+if __name__ == "__main__":
+    pass
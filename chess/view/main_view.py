@@ -9,4 +9,7 @@ class MainView:
         print("5. Créer un nouveau tournoi")
         print("6. Ajouter des joueurs à un tournoi non commencé")
         print("7. Reprendre un tournoi non terminé")
-        print("8. Quitter")
+        print("8. Jouer plusieurs sections en parallèle")
+        print("9. Historique d'un joueur / face-à-face")
+        print("10. Exporter appariements, classements et rapports (CSV, HTML)")
+        print("11. Quitter")
@@ -0,0 +1,102 @@
+"""
+This module contains the paginated display of long lists (players, tournaments) in the console.
+
+Each page is rendered as one block of text and written to the standard output in a single call, instead of
+one print per line. The lists sorted by name are browsed with jumps to a page or to a letter: the position
+of the letter is found by a binary search in the sorted list, without reading the entries before it.
+
+Classes:
+    Pager: A list displayed page by page.
+
+Functions:
+    write_lines: Write lines to the standard output in a single call.
+"""
+
+import bisect
+import sys
+
+PAGE_SIZE = 20
+
+
+def write_lines(lines):
+    """Écrit des lignes sur la sortie standard en un seul appel."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+    sys.stdout.flush()
+
+
+class Pager:
+    """A list displayed page by page, with jumps to a page or, for a sorted list, to a letter.
+
+    Attributes:
+        items (list): The entries, in display order.
+        format_item (callable): Returns the line of an entry from its number (starting at 1) and the entry.
+        title (str): The line displayed above each page.
+        sort_key (callable): The key the entries are sorted on, or None if they are not sorted (no letter
+                             jumps).
+        page_size (int): The number of entries per page.
+    """
+
+    def __init__(self, items, format_item, title, sort_key=None, page_size=PAGE_SIZE):
+        self.items = items
+        self.format_item = format_item
+        self.title = title
+        self.sort_key = sort_key
+        self.page_size = page_size
+
+    @property
+    def page_count(self):
+        return max(1, -(-len(self.items) // self.page_size))
+
+    def render_page(self, page):
+        """Return the text of a page (numbered from 0), the entries keeping their number in the whole list."""
+        start = page * self.page_size
+        lines = [self.title]
+        lines.extend(self.format_item(number, item) for number, item in
+                     enumerate(self.items[start:start + self.page_size], start + 1))
+        if self.page_count > 1:
+            lines.append(f"Page {page + 1}/{self.page_count}")
+        return lines
+
+    def find_page(self, prefix):
+        """Return the page of the first entry whose sort key is at or after a prefix (binary search)."""
+        position = bisect.bisect_left(self.items, prefix, key=self.sort_key)
+        return min(position, len(self.items) - 1) // self.page_size
+
+    def _next_page(self, page, choice):
+        """Return the page asked for by the user, None to stop browsing, or the same page if the choice is
+        invalid."""
+        if choice == "":
+            return page + 1 if page + 1 < self.page_count else None
+        if choice == "q":
+            return None
+        if choice == "-":
+            return max(page - 1, 0)
+        if choice.isdigit():
+            if 1 <= int(choice) <= self.page_count:
+                return int(choice) - 1
+            print(f"Le numéro de page doit être compris entre 1 et {self.page_count}.")
+            return page
+        if self.sort_key is not None:
+            # Les noms commencent par une majuscule : "d" ou "dup" cherchent "D" ou "Dup"
+            return self.find_page(choice[0].upper() + choice[1:])
+        print("Choix invalide.")
+        return page
+
+    def browse(self):
+        """Display the list page by page, until the user stops or goes past the last page.
+
+        A list which fits on one page is displayed without asking anything.
+        """
+        page = 0
+        while page is not None:
+            write_lines(self.render_page(page))
+            if self.page_count == 1:
+                return
+            prompt = "[Entrée] page suivante, - précédente, numéro de page"
+            if self.sort_key is not None:
+                prompt += ", lettre ou début du nom"
+            page = self._next_page(page, input(f"{prompt}, q pour terminer : ").strip())
+
+
+if __name__ == "__main__":
+    pass
@@ -1,4 +1,7 @@
+from operator import itemgetter
+
 from utils.formatvalidator import validate_date_format, validate_national_chess_id_format
+from view.pagination import Pager
 
 
 def get_player_info_from_user():
@@ -35,10 +38,80 @@ def get_player_info_from_user():
     return firstname, lastname, birth, national_chess_id
 
 
+def get_player_search_query():
+    """Demande le début ou une partie du nom du joueur recherché (vide pour la liste complète)."""
+    return input("\nRechercher un joueur par nom ou prénom (laisser vide pour la liste complète) : ").strip()
+
+
+def format_player_line(index, player_data):
+    return f"{index} - {player_data['lastname']} {player_data['firstname']}"
+
+
+def display_players_found(players, sort_key=None):
+    """Affiche les joueurs trouvés, numérotés, page par page.
+
+    Args:
+        players (List[dict]): Les joueurs.
+        sort_key (callable, optional): La clé de tri de la liste, qui permet d'aller directement à une lettre.
+    """
+    Pager(players, format_player_line, "\nJoueurs trouvés :", sort_key).browse()
+
+
+def display_player_details(player_data):
+    """Affiche le nom, la date de naissance et l'identifiant national d'un joueur."""
+    print("\nDétails du joueur :\n")
+    print(f"Nom: {player_data['lastname']} {player_data['firstname']}")
+    print(f"Date de naissance: {player_data['birth']}")
+    print(f"Identifiant national d'échecs: {player_data['national chess ID']}")
+
+
+def ask_head_to_head():
+    """Demande si l'utilisateur veut le face-à-face avec un autre joueur."""
+    while True:
+        choice = input("\nAfficher le face-à-face avec un autre joueur ? (y/n): ").lower()
+        if choice in ("y", "n"):
+            return choice == "y"
+        print("Choix invalide. Veuillez entrer 'y' pour oui ou 'n' pour non.")
+
+
+def display_player_history(player, games):
+    """Affiche les parties d'un joueur, tournoi par tournoi."""
+    if not games:
+        print(f"\n{player.firstname} {player.lastname} n'a encore joué aucune partie.")
+        return
+    print(f"\nHistorique de {player.firstname} {player.lastname} ({len(games)} parties) :")
+    tournament_name = None
+    for game in games:
+        if game["tournament"] != tournament_name:
+            tournament_name = game["tournament"]
+            print(f"\n{tournament_name}")
+        print(f"  Round {game['round']}, échiquier {game['board']} : {game['points']} - "
+              f"{game['opponent_points']} contre {game['opponent_name']} ({game['opponent_id']})")
+
+
+def display_head_to_head(player, opponent, games):
+    """Affiche les parties entre deux joueurs et le bilan du premier (victoires, nulles, défaites)."""
+    print(f"\nFace-à-face {player.firstname} {player.lastname} - {opponent.firstname} {opponent.lastname} :")
+    if not games:
+        print("Ces joueurs ne se sont jamais rencontrés.")
+        return
+    for game in games:
+        print(f"  {game['tournament']}, round {game['round']} : {game['points']} - {game['opponent_points']}")
+    wins = sum(1 for game in games if game["points"] > game["opponent_points"])
+    losses = sum(1 for game in games if game["points"] < game["opponent_points"])
+    print(f"Bilan : {wins} victoire(s), {len(games) - wins - losses} nulle(s), {losses} défaite(s)")
+
+
 class PlayerView:
     def __init__(self, player_repository):
         self.player_repository = player_repository
 
     def show_players(self):
-        self.player_repository.load_players()
-        self.player_repository.display_players_by_index()
+        """Affiche les joueurs triés par ordre alphabétique, page par page, et retourne leur liste."""
+        sorted_players = self.player_repository.get_player_by_alphabetical_order()
+        if not sorted_players:
+            print("Aucun joueur enregistré pour le moment.")
+        else:
+            Pager(sorted_players, format_player_line, "\nListe des joueurs triés par ordre alphabétique:",
+                  itemgetter('lastname')).browse()
+        return sorted_players
@@ -1,13 +1,17 @@
+from model.crosstable import format_cell
 from utils.formatvalidator import validate_date_format
+from view.pagination import Pager, write_lines
 
 
-def display_tournament_list(tournaments):
-    """Affiche la liste des tournois."""
-    formatted_output = tournaments
+def display_tournament_list(tournaments, sort_key=None):
+    """Affiche la liste des tournois, page par page.
 
-    print("\nListe des tournois:")
-    for index, tournament in enumerate(formatted_output, 1):
-        print(f"{index}. {tournament.name} à {tournament.place}")
+    Args:
+        tournaments (List[TournamentHeader]): Les tournois.
+        sort_key (callable, optional): La clé de tri de la liste, qui permet d'aller directement à une lettre.
+    """
+    Pager(tournaments, lambda index, tournament: f"{index}. {tournament.name} à {tournament.place}",
+          "\nListe des tournois:", sort_key).browse()
 
 
 def get_tournament_index_from_user(total_tournaments):
@@ -24,6 +28,24 @@ def get_tournament_index_from_user(total_tournaments):
             print("L'index doit être un nombre entier.")
 
 
+def get_tournament_choice_from_user(total_tournaments):
+    """Ask the user for the index of a tournament, or for a part of its name.
+
+    Returns:
+        int or str: The index of the tournament, or the searched text.
+    """
+    while True:
+        choice = input("\nEntrez l'index du tournoi dont vous souhaitez voir les détails, "
+                       "ou une partie de son nom : ").strip()
+        if choice.isdigit():
+            index = int(choice)
+            if 1 <= index <= total_tournaments:
+                return index
+            print(f"L'index doit être compris entre 1 et {total_tournaments}.")
+        elif choice:
+            return choice
+
+
 def prompt_add_players():
     """Demande à l'utilisateur s'il souhaite ajouter des joueurs au tournoi."""
     while True:
@@ -68,6 +90,109 @@ def ask_to_play_next_round():
     return play_next_round == "y"
 
 
+def display_round_pairings(matches):
+    """Affiche les appariements d'un round, numérotés par échiquier."""
+    print("Appariements :")
+    for board, match in enumerate(matches, 1):
+        print(f"  Échiquier {board} : {match.player1.fullname()} contre {match.player2.fullname()}")
+
+
+def display_crosstable(crosstable):
+    """Affiche la grille américaine d'un tournoi, dans l'ordre du classement.
+
+    Chaque case donne le rang de l'adversaire et le résultat du joueur : "5+" (gain), "3=" (nulle), "2-" (perte)
+    ou "4?" (partie sans résultat).
+    """
+    rounds_count = crosstable.cells.shape[1]
+    lines = ["Grille américaine :",
+             f"  {'Rg':>3}  {'Joueur':<30}" + "".join(f"{f'R{number}':>6}" for number in range(1, rounds_count + 1))
+             + f"{'Pts':>6}"]
+    for rank, player, cells, score in crosstable.rows():
+        lines.append(f"  {rank:>3}  {player.fullname()[:30]:<30}"
+                     + "".join(f"{format_cell(*cell):>6}" for cell in cells) + f"{score:>6g}")
+    write_lines(lines)
+
+
+def display_result_template(matches):
+    """Affiche un modèle CSV de fichier de résultats pour les appariements du round."""
+    print("board,result,player1,player2")
+    for board, match in enumerate(matches, 1):
+        print(f"{board},,{match.player1.fullname()},{match.player2.fullname()}")
+
+
+def ask_result_entry_mode():
+    """Demande comment saisir les résultats du round : match par match (1) ou depuis un fichier (2)."""
+    while True:
+        choice = input("Saisir les résultats match par match (1) ou importer un fichier CSV/JSON (2) ? : ")
+        if choice in ["1", "2"]:
+            return choice
+        print("Veuillez effectuer un choix valide.")
+
+
+def get_result_file_path():
+    """Demande le chemin du fichier de résultats (vide pour revenir à la saisie match par match)."""
+    return input("Chemin du fichier de résultats (laisser vide pour une saisie match par match) : ").strip()
+
+
+def ask_export_report():
+    """Demande le rapport à exporter.
+
+    Returns:
+        tuple: Le rapport ('pairings', 'standings', 'crosstable' ou 'report') et True s'il porte sur tous les
+               tournois.
+    """
+    while True:
+        print("\nExporter : appariements du dernier round (1), classement (2), grille américaine (3), rapport "
+              "complet d'un tournoi (4) ou rapport de tous les tournois (5) ?")
+        choice = input("Votre choix : ")
+        if choice in ("1", "2", "3", "4", "5"):
+            return ("pairings", "standings", "crosstable", "report", "report")[int(choice) - 1], choice == "5"
+        print("Veuillez effectuer un choix valide.")
+
+
+def ask_export_format():
+    """Demande le format du rapport : CSV ou HTML."""
+    while True:
+        file_format = input("Format du fichier (csv/html) : ").strip().lower()
+        if file_format in ("csv", "html"):
+            return file_format
+        print("Veuillez entrer 'csv' ou 'html'.")
+
+
+def get_export_file_path(default_name):
+    """Demande le chemin du fichier à écrire (vide pour le nom proposé)."""
+    return input(f"Chemin du fichier (laisser vide pour {default_name}) : ").strip() or default_name
+
+
+def display_import_errors(errors):
+    """Affiche les erreurs trouvées dans un fichier de résultats."""
+    print("Le fichier de résultats n'a pas été appliqué :")
+    for error in errors:
+        print(f"  - {error}")
+
+
+def get_section_indexes_from_user(total_tournaments):
+    """Demande les index des sections à jouer ensemble, séparés par des virgules (au moins deux)."""
+    while True:
+        indexes_input = input("\nEntrez les index des sections à jouer, séparés par des virgules (ex. 1,3) : ")
+        parts = [part.strip() for part in indexes_input.split(",") if part.strip()]
+        if not all(part.isdigit() for part in parts):
+            print("Les index doivent être des nombres entiers.")
+            continue
+        indexes = list(dict.fromkeys(int(part) for part in parts))
+        if len(indexes) < 2:
+            print("Veuillez choisir au moins deux sections.")
+        elif not all(1 <= index <= total_tournaments for index in indexes):
+            print(f"Les index doivent être compris entre 1 et {total_tournaments}.")
+        else:
+            return indexes
+
+
+def display_section_header(tournament):
+    """Affiche le nom de la section et le numéro de son round en cours."""
+    print(f"\n=== {tournament.name} - Round {tournament.current_round + 1} ===")
+
+
 class TournamentView:
     def __init__(self, tournament_controller):
         self.tournament_controller = tournament_controller